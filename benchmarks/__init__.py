@@ -0,0 +1 @@
+"""Benchmarks for Color the Snake!. Run one from the repository root with `python -m benchmarks.<name>`."""
@@ -0,0 +1,63 @@
+"""
+Tick time of the simulation against the number of snakes in the arena, next to a pairwise player collision check.
+
+    python -m benchmarks.arena_scaling [--players 1 2 4 8 16 32] [--ticks 2000] [--bot cautious]
+"""
+import argparse
+import time
+from benchmarks.pathfinding import percentile
+from color_the_snake.bots import load_bot, steer_all
+from color_the_snake.engine import Collision, CollisionKind, GameConfig, Simulation
+
+
+def pairwise_crashes(sim: Simulation) -> list[int]:
+    """The player collision check without the occupancy grid: every head against the body of every other snake."""
+    crashed: list[int] = []
+    for s in reversed(sim.snakes):
+        if any(other is not s and other.index not in crashed and s.head in other.body for other in sim.snakes):
+            crashed.append(s.index)
+    return crashed
+
+
+def play(players: int, ticks: int, bot: str, seed: int) -> tuple[list[int], list[int], list[int], int]:
+    """Step times, one-pass check times and pairwise check times in nanoseconds, and the number of player collisions."""
+    sim = Simulation(GameConfig(players=players), seed=seed)
+    bots = [load_bot(bot, seed + idx) for idx in range(players)]
+    steps: list[int] = []
+    one_pass: list[int] = []
+    pairwise: list[int] = []
+    crashes: int = 0
+    for _ in range(ticks):
+        steer_all(sim, bots)  # not timed: only the step is.
+        start: int = time.perf_counter_ns()
+        collisions: list[Collision] = sim.step()
+        steps.append(time.perf_counter_ns() - start)
+        crashes += sum(c.kind is CollisionKind.Player for c in collisions)
+        start = time.perf_counter_ns()
+        found: list[int] = sim.player_crashes()
+        one_pass.append(time.perf_counter_ns() - start)
+        start = time.perf_counter_ns()
+        expected: list[int] = pairwise_crashes(sim)
+        pairwise.append(time.perf_counter_ns() - start)
+        assert found == expected, f'{players} players, tick {sim.tick}: one pass found {found}, pairs {expected}'
+    return steps, one_pass, pairwise, crashes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--players', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument('--ticks', type=int, default=2000)
+    parser.add_argument('--bot', default='cautious')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    print(f'{args.ticks} ticks per row, {args.bot} bots, 33x33 arena')
+    print(f'  {"snakes":>6}  {"step mean":>10}  {"step p99":>10}  {"per snake":>10}  {"one pass":>10}  {"pairwise":>10}  {"crashes":>7}')
+    for players in args.players:
+        steps, one_pass, pairwise, crashes = play(players, args.ticks, args.bot, args.seed)
+        mean: float = sum(steps) / len(steps) / 1000
+        print(f'  {players:6}  {mean:8.1f}us  {percentile(steps, 99) / 1000:8.1f}us  {mean / players:8.1f}us  '
+              f'{sum(one_pass) / len(one_pass) / 1000:8.2f}us  {sum(pairwise) / len(pairwise) / 1000:8.2f}us  {crashes:7}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Throughput of the NumPy batch simulator next to the scalar engine, and a check that both play the same games.
+
+    python -m benchmarks.batch_throughput [--games 4096] [--ticks 200] [--players 1] [--check 32] [--check-players 1 2]
+"""
+import argparse
+import random
+import time
+from collections import deque
+import numpy as np
+from color_the_snake.batch import BatchSimulation, NO_ACTION
+from color_the_snake.engine import COLORS, Cell, GameConfig, Heading, Simulation
+
+
+class RecordingBatch(BatchSimulation):
+    """Keeps every food cell and color each game draws, in the order the game draws them."""
+    def __init__(self, games: int, config: GameConfig, seed: int) -> None:
+        self.drawn_cells: list[list[Cell]] = [[] for _ in range(games)]
+        self.drawn_colors: list[list[str]] = [[] for _ in range(games)]
+        super().__init__(games, config, seed)
+
+    def _pick_colors(self, games: np.ndarray) -> np.ndarray:
+        codes: np.ndarray = super()._pick_colors(games)
+        for game, code in zip(games.tolist(), codes.tolist()):
+            self.drawn_colors[game].append(COLORS[code])
+        return codes
+
+    def _pick_cells(self, games: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        gx, gy = super()._pick_cells(games)
+        for game, x, y in zip(games.tolist(), gx.tolist(), gy.tolist()):
+            self.drawn_cells[game].append((x - self.config.half_width, y - self.config.half_height))
+        return gx, gy
+
+
+class ScriptedRandom(random.Random):
+    def __init__(self, colors: list[str]) -> None:
+        super().__init__(0)
+        self.colors: deque[str] = deque(colors)
+
+    def choice(self, seq):
+        return self.colors.popleft()
+
+
+class ReplayedSimulation(Simulation):
+    """A scalar game that takes its food cells and colors from a recording instead of drawing them."""
+    def __init__(self, config: GameConfig, cells: list[Cell], colors: list[str]) -> None:
+        self.cells: deque[Cell] = deque(cells)
+        super().__init__(config, rng=ScriptedRandom(colors))
+
+    def random_cell(self) -> Cell:
+        return self.cells.popleft()
+
+
+def random_actions(rng: np.random.Generator, ticks: int, games: int, players: int, turn_chance: float = 0.2) -> np.ndarray:
+    actions: np.ndarray = rng.integers(0, 4, size=(ticks, games, players))
+    actions[rng.random(actions.shape) >= turn_chance] = NO_ACTION
+    return actions
+
+
+def check(config: GameConfig, games: int, ticks: int, seed: int) -> int:
+    """Number of games whose scalar replay differs from the batch."""
+    batch = RecordingBatch(games, config, seed)
+    actions: np.ndarray = random_actions(np.random.default_rng(seed), ticks, games, config.players)
+    states: list[list[tuple]] = []
+    for t in range(ticks):
+        batch.step(actions[t])
+        states.append([([batch.body(g, p) for p in range(config.players)], [batch.snake_colors(g, p) for p in range(config.players)],
+                        batch.score[g].tolist(), batch.food(g)) for g in range(games)])
+    failed: int = 0
+    for g in range(games):
+        sim = ReplayedSimulation(config, batch.drawn_cells[g], batch.drawn_colors[g])
+        for t in range(ticks):
+            for p, snake in enumerate(sim.snakes):
+                if actions[t, g, p] != NO_ACTION:
+                    snake.steer(Heading(int(actions[t, g, p])))
+            sim.step()
+            state: tuple = [list(s.body) for s in sim.snakes], [list(s.colors) for s in sim.snakes], [s.score for s in sim.snakes], dict(sim.food.items())
+            if state != states[t][g]:
+                print(f'  game {g} differs from its scalar replay at tick {t + 1}')
+                failed += 1
+                break
+    return failed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=4096)
+    parser.add_argument('--ticks', type=int, default=200)
+    parser.add_argument('--players', type=int, default=1, choices=(1, 2))
+    parser.add_argument('--check', type=int, default=0, metavar='N', help='replay N batch games of one and two players, walled or not, with little and much food, on the scalar engine')
+    parser.add_argument('--check-players', type=int, nargs='+', default=[1, 2], choices=(1, 2), metavar='P', help='players of the games checked')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    config = GameConfig(players=args.players)
+
+    batch = BatchSimulation(args.games, config, seed=args.seed)
+    actions: np.ndarray = random_actions(np.random.default_rng(args.seed), args.ticks, args.games, args.players)
+    start: float = time.perf_counter()
+    for t in range(args.ticks):
+        batch.step(actions[t])
+    batch_seconds: float = time.perf_counter() - start
+
+    scalar_ticks: int = max(1, args.ticks * min(args.games, 64))
+    sim = Simulation(config, seed=args.seed)
+    start = time.perf_counter()
+    for _ in range(scalar_ticks):
+        sim.step()
+    scalar_seconds: float = time.perf_counter() - start
+
+    batch_rate: float = args.games * args.ticks / batch_seconds
+    print(f'{args.games} games x {args.ticks} ticks, {args.players} player(s)')
+    print(f'  batch   {batch_seconds / args.ticks * 1000:8.2f} ms/step  {batch_rate:12,.0f} game ticks/s')
+    print(f'  scalar  {scalar_seconds / scalar_ticks * 1e6:8.2f} us/tick  {scalar_ticks / scalar_seconds:12,.0f} game ticks/s')
+    print(f'  speedup {batch_rate / (scalar_ticks / scalar_seconds):8.1f}x')
+
+    if args.check:
+        configs: list[GameConfig] = [GameConfig(players=players, wall_teleport=wall_teleport, food_abundance=food_abundance)
+                                     for players in args.check_players for wall_teleport in (True, False) for food_abundance in (1, 30)]
+        failed: int = sum(check(config, args.check, args.ticks, args.seed) for config in configs)
+        print(f'  check   {len(configs) * args.check - failed}/{len(configs) * args.check} games match their scalar replay')
+        if failed:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Environment steps per second of `VectorEnv` for a growing number of worker processes.
+
+    python -m benchmarks.env_throughput [--envs 64] [--steps 500] [--workers 1 2 4 8] [--players 1]
+"""
+import argparse
+import os
+import time
+import numpy as np
+from color_the_snake.engine import GameConfig
+from color_the_snake.env import ACTIONS, SnakeEnv, VectorEnv
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--envs', type=int, default=64)
+    parser.add_argument('--steps', type=int, default=500)
+    parser.add_argument('--workers', type=int, nargs='+', default=sorted({1, 2, 4, 8, os.cpu_count()}))
+    parser.add_argument('--players', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    config = GameConfig(players=args.players)
+    rng: np.random.Generator = np.random.default_rng(args.seed)
+    actions: np.ndarray = rng.integers(0, ACTIONS, size=(args.steps, args.envs))
+
+    env = SnakeEnv(config, seed=args.seed)  # the baseline: a single environment in this process.
+    env.reset()
+    start: float = time.perf_counter()
+    for t in range(args.steps):
+        if any(env.step(int(actions[t, 0]))[2:4]):
+            env.reset()
+    single: float = args.steps / (time.perf_counter() - start)
+    print(f'{args.envs} environments x {args.steps} steps, {args.players} player(s), {os.cpu_count()} cores')
+    print(f'  single env       {single:12,.0f} steps/s')
+
+    for workers in args.workers:
+        with VectorEnv(args.envs, workers, config, seed=args.seed) as venv:
+            venv.reset()
+            start = time.perf_counter()
+            for t in range(args.steps):
+                venv.step(actions[t])
+            rate: float = args.envs * args.steps / (time.perf_counter() - start)
+        print(f'  {workers:3} worker(s)     {rate:12,.0f} steps/s  {rate / single:6.2f}x single')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Input-to-photon latency and lost key presses of the game, at every speed, with key presses queued and dropped.
+
+    python -m benchmarks.input_latency [--speeds 1 2 3 4] [--seconds 300] [--double 0.3]
+"""
+import argparse
+import random
+from color_the_snake import game, headless
+from color_the_snake.engine import Heading
+from color_the_snake.profiler import Profiler
+from color_the_snake.userdata import Userdata
+
+
+class Player:
+    """Turns the first snake of the game every 150 to 500 ms, sometimes twice in quick succession."""
+    def __init__(self, game_play_manager: game.GamePlayManager, scheduler: headless.Scheduler, queue: bool, double: float, seed: int) -> None:
+        self.game_play_manager: game.GamePlayManager = game_play_manager
+        self.snake: game.Snake = game_play_manager.snakes[0]
+        self.scheduler: headless.Scheduler = scheduler
+        self.queue: bool = queue
+        self.double: float = double
+        self.rng = random.Random(seed)
+        self.presses: int = 0
+        self.lost: int = 0  # presses that never turned the snake.
+        scheduler.after(0, self.turn)
+
+    def turn(self) -> None:
+        if self.game_play_manager.loop.running:  # nothing moves during the opening.
+            heading: Heading = self.snake.inputs[-1][1] if self.snake.inputs else self.snake.state.heading
+            first: Heading = Heading((heading + self.rng.choice((1, 3))) % 4)
+            self.press(first)
+            if self.rng.random() < self.double:
+                second: Heading = Heading((first + self.rng.choice((1, 3))) % 4)
+                self.scheduler.after(self.rng.randint(15, 40), lambda: self.press(second))
+        self.scheduler.after(self.rng.randint(150, 500), self.turn)
+
+    def press(self, heading: Heading) -> None:
+        self.presses += 1
+        if self.queue:  # the game as it is: presses are queued and applied one per tick.
+            self.snake.press(heading)
+            return
+        if not self.snake.state.input_enabled:
+            self.lost += 1
+            return
+        self.snake.steer(heading)  # the way the game used to steer: only the first press of a tick counts.
+        self.game_play_manager.pressed.append(game.animator.clock())
+
+
+def play(speed: int, queue: bool, seconds: float, double: float, seed: int) -> tuple[Player, Profiler]:
+    """Play `seconds` of game time. Every press is timed on the game's clock to the end of the first frame showing the
+    tick it was applied on, so the times are the wait for the next tick; a real screen adds its own on top."""
+    random.seed(seed)
+    profiler = Profiler(window=100_000)
+    game_play_manager, scheduler = headless.start(Userdata(mode=1, speed=speed), profiler=profiler)
+    player = Player(game_play_manager, scheduler, queue, double, seed)
+    scheduler.run(lambda: scheduler.now >= seconds)
+    if queue:
+        player.lost = player.snake.dropped
+    return player, profiler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--speeds', type=int, nargs='+', default=[1, 2, 3, 4])
+    parser.add_argument('--seconds', type=float, default=300, help='game time per row')
+    parser.add_argument('--double', type=float, default=0.3, help='share of turns with a second press 15 to 40 ms after the first')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    print(f'{args.seconds:g}s of game per row, {args.double:.0%} of turns doubled')
+    print(f'  {"speed":>5}  {"tick":>7}  {"policy":>6}  {"presses":>7}  {"lost":>6}  {"p50":>8}  {"p90":>8}  {"p99":>8}  {"max":>8}')
+    for speed in args.speeds:
+        for queue in (True, False):
+            player, profiler = play(speed, queue, args.seconds, args.double, args.seed)
+            latency = profiler.phases['input']
+            p50, p90, p99 = (ns / 1e6 for ns in latency.percentiles(50, 90, 99))
+            print(f'  {speed:5}  {90 / speed:5.1f}ms  {"queue" if queue else "drop":>6}  {player.presses:7}  {player.lost / max(player.presses, 1):6.1%}  '
+                  f'{p50:6.1f}ms  {p90:6.1f}ms  {p99:6.1f}ms  {latency.peak / 1e6:6.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Load test of the match server: one server process, many concurrent matches of bot clients over localhost.
+
+    python -m benchmarks.net_load [--matches 50] [--ticks 400] [--tick-ms 45] [--bot random]
+"""
+import argparse
+import asyncio
+import signal
+import socket
+import subprocess
+import sys
+import time
+from benchmarks.pathfinding import percentile
+from color_the_snake.bots import load_bot
+from color_the_snake.net import STATE, Client
+
+
+async def play(port: int, seat_seed: int, bot_name: str) -> tuple[int, list[int], float, int, int]:
+    """Full snapshot bytes, delta bytes, seconds from the first to the last snapshot and the largest gap in microseconds."""
+    client = Client()
+    await client.connect('127.0.0.1', port)
+    bot = load_bot(bot_name, seat_seed)
+    full: int = 0
+    deltas: list[int] = []
+    first: float = 0.0
+    last: float = 0.0
+    gaps: list[int] = []
+    async for kind, payload in client.messages():
+        client.handle(kind, payload)
+        if kind != STATE:
+            continue
+        now: float = time.perf_counter()
+        if not full:
+            full, first = len(payload), now
+        else:
+            deltas.append(len(payload))
+            gaps.append(int((now - last) * 1e6))
+        last = now
+        if (heading := bot.decide(client.state, client.seat)) is not None and heading != client.state.snakes[client.seat].heading:
+            client.press(heading)
+    client.writer.close()
+    return full, deltas, last - first, gaps
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+async def connect_all(port: int, matches: int, players: int, bot: str) -> list:
+    tasks = [asyncio.create_task(play(port, i, bot)) for i in range(matches * players)]
+    return await asyncio.gather(*tasks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--matches', type=int, default=50)
+    parser.add_argument('--players', type=int, default=2)
+    parser.add_argument('--ticks', type=int, default=400, help='length of every match')
+    parser.add_argument('--tick-ms', type=float, default=45.0)
+    parser.add_argument('--bot', default='random')
+    args = parser.parse_args()
+    port: int = free_port()
+    server = subprocess.Popen([sys.executable, '-m', 'color_the_snake.net', 'serve', '--port', str(port), '--players', str(args.players),
+                               '--tick-ms', str(args.tick_ms), '--max-ticks', str(args.ticks)], stdout=subprocess.PIPE, text=True)
+    try:
+        for _ in range(100):  # wait for the server to listen.
+            try:
+                socket.create_connection(('127.0.0.1', port)).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+        results = asyncio.run(connect_all(port, args.matches, args.players, args.bot))
+    finally:
+        server.send_signal(signal.SIGINT)
+        stats: str = server.communicate(timeout=10)[0].strip()
+    fulls: list[int] = [full for full, _, _, _ in results]
+    deltas: list[int] = [size for _, sizes, _, _ in results for size in sizes]
+    rates: list[float] = [len(sizes) / seconds for _, sizes, seconds, _ in results if seconds]
+    gaps: list[int] = [gap for _, _, _, match_gaps in results for gap in match_gaps]
+    print(f'{args.matches} matches x {args.players} {args.bot} bot(s), {args.ticks} ticks of {args.tick_ms:g} ms, one server process')
+    print(f'  server         {stats}')
+    print(f'  tick rate      mean {sum(rates) / len(rates):6.1f}/s  min {min(rates):6.1f}/s  of {1000 / args.tick_ms:.1f}/s per match')
+    print(f'  arrival gap    p50 {percentile(gaps, 50) / 1000:6.1f} ms  p99 {percentile(gaps, 99) / 1000:6.1f} ms  max {max(gaps) / 1000:6.1f} ms')
+    print(f'  snapshot size  full {sum(fulls) / len(fulls):6.0f} B  delta mean {sum(deltas) / len(deltas):6.1f} B  p99 {percentile(deltas, 99)} B')
+
+
+if __name__ == '__main__':
+    main()
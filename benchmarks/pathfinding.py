@@ -0,0 +1,63 @@
+"""
+Decision time of the pathfinding bot with its incrementally updated distance field and with a fresh search every tick.
+
+    python -m benchmarks.pathfinding [--ticks 3000] [--half-width 30] [--food 30] [--check]
+"""
+import argparse
+import time
+from color_the_snake.bots import PathfindingBot
+from color_the_snake.engine import GameConfig, Simulation
+
+
+class SearchingBot(PathfindingBot):
+    """The pathfinding bot as it would be without incremental updates: every decision searches the whole arena."""
+    def follow(self, sim: Simulation) -> None:
+        self.rebuild(sim)
+
+
+def play(bot: PathfindingBot, config: GameConfig, ticks: int, seed: int, check: bool = False) -> tuple[list[int], int, int]:
+    """Decision times, the cells the field visited in total and the final score of the bot's snake."""
+    sim = Simulation(config, seed=seed)
+    times: list[int] = []
+    visited: int = 0
+    for _ in range(ticks):
+        start: int = time.perf_counter_ns()
+        if (heading := bot.decide(sim, 0)) is not None:
+            sim.snakes[0].steer(heading)
+        times.append(time.perf_counter_ns() - start)
+        visited += bot.field.visited
+        if check:
+            fresh = PathfindingBot()
+            fresh.rebuild(sim)
+            assert fresh.field.dist == bot.field.dist, f'incremental field differs from a rebuilt one at tick {sim.tick}'
+        sim.step()
+    return times, visited, sim.snakes[0].score
+
+
+def percentile(values: list[int], p: float) -> float:
+    ordered: list[int] = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=3000)
+    parser.add_argument('--half-width', type=int, default=30)
+    parser.add_argument('--food', type=int, default=30, help='food abundance')
+    parser.add_argument('--no-teleport', action='store_true')
+    parser.add_argument('--check', action='store_true', help='compare the field with a rebuilt one after every tick')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    config = GameConfig(half_width=args.half_width, half_height=args.half_width, food_abundance=args.food, wall_teleport=not args.no_teleport)
+    side: int = 2 * args.half_width + 1
+    print(f'{args.ticks} ticks in a {side}x{side} arena, food abundance {args.food}, wall teleport {"off" if args.no_teleport else "on"}')
+    for label, bot in (('incremental', PathfindingBot()), ('full search', SearchingBot())):  # the same game.
+        times, visited, score = play(bot, config, args.ticks, args.seed, args.check and label == 'incremental')
+        print(f'  {label:<12} mean {sum(times) / len(times) / 1000:8.1f} us  p50 {percentile(times, 50) / 1000:8.1f} us  '
+              f'p99 {percentile(times, 99) / 1000:8.1f} us  {visited / len(times):8.1f} cells/tick  score {score}')
+    if args.check:
+        print('  check        the incremental field matched a rebuilt one after every tick')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Memory per segment and per food item, and the tick cost of a very long snake.
+
+    python -m benchmarks.segment_memory [--segments N]
+"""
+import argparse
+import time
+import tracemalloc
+from collections import deque
+from typing import Callable
+from color_the_snake.engine import COLORS, Heading, SnakeState
+from color_the_snake.grid import Cell, OccupancyGrid
+from color_the_snake.storage import ColorRow, FoodTable, SegmentRing
+
+
+def serpentine(length: int, half_width: int) -> list[Cell]:
+    """`length` cells that snake back and forth through the arena from its top left, head first."""
+    width: int = 2 * half_width + 1
+    cells: list[Cell] = []
+    for i in range(length):
+        row, col = divmod(i, width)
+        cells.append((col - half_width if row % 2 == 0 else half_width - col, half_width - row))
+    return cells
+
+
+def allocated(build: Callable[[], object]) -> int:
+    """Bytes still allocated after `build()`, counting only what the object it returns keeps alive."""
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    kept: object = build()
+    size: int = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def per_call(func: Callable[[], object], repeat: int) -> float:
+    start: int = time.perf_counter_ns()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter_ns() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--segments', type=int, default=100_000)
+    args = parser.parse_args()
+    n: int = args.segments
+    half_width: int = 1
+    while (2 * half_width + 1) ** 2 < 2 * n:
+        half_width *= 2
+    cells: list[Cell] = serpentine(n, half_width)
+    colors: list[str] = [COLORS[i % len(COLORS)] for i in range(n)]
+
+    compact: int = allocated(lambda: (SegmentRing(cells, Heading.Left), ColorRow(colors)))
+    # the layout before: tuples freshly built per cell, like each move creates them.
+    boxed: int = allocated(lambda: (deque((x + 0, y + 0) for x, y in cells), deque([Heading.Left] * n), list(colors)))
+
+    food_items: int = min(n, 10_000)
+
+    def fill_food() -> FoodTable:
+        table = FoodTable()
+        for fid, cell in enumerate(cells[:food_items]):
+            table[fid] = (cell, COLORS[fid % len(COLORS)])
+        return table
+    food: int = allocated(fill_food)
+
+    print(f'{n:,} segments in a {2 * half_width + 1}x{2 * half_width + 1} arena')
+    print(f'  compact body + colors   {compact / n:7.2f} bytes/segment')
+    print(f'  deque of tuples + list  {boxed / n:7.2f} bytes/segment')
+    print(f'  food table              {food / food_items:7.2f} bytes/food item')
+
+    grid = OccupancyGrid(half_width, half_width)
+    snake = SnakeState(cells, Heading.Down, [COLORS[0]] * (n // 2) + ['white'] * (n - n // 2), grid)
+    ticks: int = 1000
+
+    def move() -> None:
+        x, y = snake.head
+        dx, dy = snake.heading.delta
+        snake.move((x + dx, y + dy))
+        snake.is_self_collision()
+    print(f'  move + collision check  {per_call(move, ticks) / 1000:7.2f} us/tick')
+    print(f'  eat (colors shift)      {per_call(lambda: snake.eat(COLORS[1]), ticks) / 1000:7.2f} us/eat')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Soak check of the sprite pools: canvas items and memory over thousands of collisions.
+
+    python -m benchmarks.sprite_pool [--collisions 3000] [--every 250] [--bots 15] [--limit 256]
+"""
+import argparse
+import time
+from color_the_snake import game, headless
+from color_the_snake.engine import Collision
+from color_the_snake.soak import rss_mb
+from color_the_snake.userdata import Userdata
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--collisions', type=int, default=3000)
+    parser.add_argument('--every', type=int, default=250, help='collisions between samples')
+    parser.add_argument('--bots', type=int, default=15, help='snakes next to the computer player')
+    parser.add_argument('--limit', type=int, default=256, help='sprites each pool keeps; 0 turns the pools off for comparison')
+    parser.add_argument('--tolerance', type=float, default=10, help='percent the second half may exceed the first by')
+    args = parser.parse_args()
+    # snakes crowded into the arena crash all the time, and every crash turns segments into food that others grow on.
+    game_play_manager, scheduler = headless.start(Userdata(mode=3), bots=args.bots)
+    pools = game.segment_pool, game.food_manager.pool
+    for pool in pools:
+        pool.limit = args.limit
+    collisions: list[int] = [0]
+    react = game_play_manager.collision_reaction
+
+    def count(collision: Collision) -> None:
+        collisions[0] += 1
+        react(collision)
+    game_play_manager.collision_reaction = count
+
+    print(f'{args.bots + 1} snakes, pools of {args.limit} sprites')
+    print(f'  {"crashes":>7}  {"ticks":>7}  {"items":>6}  {"sprites":>8}  {"pooled":>6}  {"free items":>10}  {"rss":>8}  {"seconds":>7}')
+    samples: list[tuple[int, int, float]] = []  # (canvas items, sprites made, rss) at every sample.
+    start: float = time.perf_counter()
+    for target in range(args.every, args.collisions + 1, args.every):
+        scheduler.run(lambda: collisions[0] >= target)
+        if not game_play_manager.loop.running:
+            raise SystemExit(f'the game stopped at tick {game_play_manager.simulation.tick}')
+        items: int = len(game.window.cv.items)
+        made: int = sum(pool.made for pool in pools)
+        samples.append((items, made, rss_mb()))
+        print(f'  {collisions[0]:7}  {game_play_manager.simulation.tick:7}  {items:6}  {made:8}  {sum(len(pool.free) for pool in pools):6}  '
+              f'{sum(map(len, game.batch.free.values())):10}  {samples[-1][2]:6.1f}MB  {time.perf_counter() - start:7.1f}')
+
+    half: int = len(samples) // 2  # with the pools, all three level off once the first crashes have filled them.
+    failed: bool = False
+    for column, name in enumerate(('canvas items', 'sprites made', 'resident memory')):
+        first, second = max(s[column] for s in samples[:half]), max(s[column] for s in samples[half:])
+        grew: bool = second > first * (1 + args.tolerance / 100)
+        failed |= grew
+        print(f'{name}: {round(first, 1):g} in the first half, {round(second, 1):g} in the second{" - growing" if grew else ""}')
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Startup time of the game: importing it, showing the menu and drawing the first frame of a game.
+
+    python -m benchmarks.startup [--repeat 10]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from benchmarks.pathfinding import percentile
+
+PRELUDE: str = 'import sys, time\nstart = time.perf_counter()\n'
+REPORT: str = "print(time.perf_counter() - start, 'tkinter' in sys.modules or 'turtle' in sys.modules)\n"
+STAGES: dict[str, str] = {
+    'import package': 'import color_the_snake\n',
+    'import app': 'import color_the_snake.app\n',
+    'menu shown': 'from color_the_snake.menu import Menu\n'
+                  'from color_the_snake.userdata import Userdata\n'
+                  'Menu(Userdata()).root.update()\n',
+    'first frame': 'from color_the_snake import game\n'
+                   'from color_the_snake.app import parse_arguments\n'
+                   'from color_the_snake.userdata import Userdata\n'
+                   'game.start(parse_arguments([]), Userdata())\n'
+                   'game.batch.flush()\n'
+                   'game.window.update()\n',
+}
+HEADLESS: tuple[str, ...] = ('import package', 'import app')  # the stages that must not load the GUI.
+
+
+def run(code: str) -> tuple[float, float, bool] | None:
+    """Run a stage in a fresh interpreter. Returns the seconds in the stage, those of the whole process, interpreter
+    start and exit included, and whether the GUI got loaded; or None without a display."""
+    start: float = time.perf_counter()
+    done = subprocess.run([sys.executable, '-c', PRELUDE + code + REPORT], capture_output=True, text=True)
+    elapsed: float = time.perf_counter() - start
+    if done.returncode:
+        if 'TclError' in done.stderr:
+            return None
+        raise RuntimeError(done.stderr)
+    seconds, gui = done.stdout.split()[-2:]
+    return float(seconds), elapsed, gui == 'True'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10, help='fresh processes per stage')
+    parser.add_argument('--json', metavar='FILE', help='also write the results to FILE')
+    args = parser.parse_args()
+    print(f'{args.repeat} processes per stage')
+    print(f'  {"stage":<16}  {"stage p50":>10}  {"stage max":>10}  {"process p50":>12}  {"gui":>4}')
+    results: dict[str, dict[str, float | bool]] = {}
+    for name, code in STAGES.items():
+        runs = [run(code) for _ in range(args.repeat)]
+        if None in runs:
+            print(f'  {name:<16}  skipped: no display')
+            continue
+        stage: list[float] = [r[0] * 1000 for r in runs]
+        process: list[float] = [r[1] * 1000 for r in runs]
+        gui: bool = any(r[2] for r in runs)
+        results[name] = {'stage_p50_ms': percentile(stage, 50), 'stage_max_ms': max(stage), 'process_p50_ms': percentile(process, 50), 'gui': gui}
+        print(f'  {name:<16}  {percentile(stage, 50):8.1f}ms  {max(stage):8.1f}ms  {percentile(process, 50):10.1f}ms  {"yes" if gui else "no":>4}')
+        if gui and name in HEADLESS:
+            raise SystemExit(f'{name} loaded Tk or turtle')
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,276 @@
+"""
+Benchmark suite of the engine's hot paths, with JSON baselines to catch regressions.
+
+    python -m benchmarks.suite [--ticks 500] [--quick] [--save BASELINE.json] [--compare BASELINE.json] [--threshold 15]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from itertools import islice
+from benchmarks.segment_memory import allocated
+from benchmarks.viewport_culling import CountingCanvas
+from color_the_snake.bots import Bot, load_bot, steer_all
+from color_the_snake.canvas import Batch, Sprite
+from color_the_snake.engine import CELL_SIZE, COLORS, WHITE, GameConfig, Heading, SnakeState, Simulation
+from color_the_snake.grid import Cell
+from color_the_snake.profiler import Profiler
+from color_the_snake.storage import ColorRow, SegmentRing
+
+# Whether a larger value of each metric is better, for the comparison.
+METRICS: dict[str, bool] = {'ticks_per_s': True, 'move_us': False, 'collisions_us': False, 'food_us': False, 'bytes_per_segment': False,
+                            'rendered_ticks_per_s': True}
+
+
+@dataclass(frozen=True)
+class Case:
+    length: int = 8
+    food: int = 2
+    players: int = 1
+    teleport: bool = True
+
+    @property
+    def name(self) -> str:
+        return f'length={self.length} food={self.food} players={self.players} teleport={"on" if self.teleport else "off"}'
+
+
+def cases(quick: bool) -> list[Case]:
+    """The base case, one snake of length 8 with 2 food items, then one setting changed at a time, each with teleport on
+    and off."""
+    lengths: list[int] = [4, 12, 100, 1000] + ([] if quick else [10_000, 100_000])
+    foods: list[int] = [1, 10, 100] + ([] if quick else [1000, 10_000])
+    players: list[int] = [2, 8] + ([] if quick else [32])
+    swept: list[Case] = [Case()] + [Case(length=n) for n in lengths] + [Case(food=n) for n in foods] + [Case(players=n) for n in players]
+    return [Case(c.length, c.food, c.players, teleport) for teleport in (True, False) for c in swept]
+
+
+def tour(half: int, teleport: bool) -> list[Cell]:
+    """A closed path through the arena, each cell next to the one before and the last next to the first.
+
+    With teleport, every row is crossed from a column one left of where the row above started, wrapping around the
+    walls, which closes up in a square arena. Without it, the rows below the top one are crossed back and forth to the
+    right of the first column, which then leads back up; an odd-sized arena has no closed path through all of its
+    cells, so the last row and column are left out."""
+    size: int = 2 * half + 1
+    if teleport:
+        return [((start + i) % size - half, half - row) for row in range(size) for start in [-row % size] for i in range(size)]
+    cells: list[Cell] = []
+    for row in range(size - 1):
+        columns = range(-half + 1, half) if row % 2 == 0 else range(half - 1, -half, -1)
+        cells += [(x, half - row) for x in columns]
+    return cells + [(-half, y) for y in range(-half + 1, half + 1)]
+
+
+def heading_between(a: Cell, b: Cell) -> Heading:
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    dx, dy = (dx > 0) - (dx < 0), (dy > 0) - (dy < 0)
+    if abs(b[0] - a[0]) > 1 or abs(b[1] - a[1]) > 1:  # across a wall.
+        dx, dy = -dx, -dy
+    return next(h for h in Heading if h.delta == (dx, dy))
+
+
+class Scenario:
+    """A simulation set up for a case, in an arena grown to fit it, and what steers its snakes. A single snake follows a
+    `tour`, so even the longest never crash and every tick does the same work; several start as the game spawns them
+    and are steered by cautious bots."""
+    def __init__(self, case: Case, seed: int) -> None:
+        half: int = 16
+        while (2 * half) ** 2 < 2 * (case.length * case.players + case.food) or case.length >= half and case.players > 1:
+            half *= 2
+        length: int = case.length if case.players > 1 else 4
+        self.sim = Simulation(GameConfig(players=case.players, length=length, food_abundance=case.food, wall_teleport=case.teleport,
+                                         half_width=half, half_height=half), seed=seed)
+        self.bots: list[Bot] = [load_bot('cautious', seed + idx) for idx in range(case.players)] if case.players > 1 else []
+        self.next: dict[Cell, Heading] = {}  # the heading the single snake takes on each cell of its tour.
+        if case.players == 1:
+            path: list[Cell] = tour(half, case.teleport)
+            self.next = {cell: heading_between(cell, after) for cell, after in zip(path, path[1:] + path[:1])}
+            old: SnakeState = self.sim.snakes[0]
+            old.cut(0)
+            body: list[Cell] = path[case.length - 1::-1]
+            colors: list[str] = [COLORS[i % len(COLORS)] for i in range(case.length // 2)] + [WHITE] * (case.length - case.length // 2)
+            self.sim.snakes[0] = SnakeState(body, self.next[body[0]], colors, self.sim.grid)
+        for fid in list(self.sim.food)[case.food:]:  # the opening may have scattered more.
+            self.sim.remove_food(fid)
+        while len(self.sim.food) < case.food:
+            self.sim.create_food()
+
+    def steer(self) -> None:
+        if self.bots:
+            steer_all(self.sim, self.bots)
+        else:
+            snake: SnakeState = self.sim.snakes[0]
+            snake.steer(self.next[snake.head])
+
+
+class Mirror:
+    """Draws a simulation like the game does, a sprite per segment and per food item, onto a canvas that only counts."""
+    def __init__(self, sim: Simulation) -> None:
+        self.sim: Simulation = sim
+        self.batch = Batch(CountingCanvas())
+        self.snakes: list[deque[Sprite]] = [deque(Sprite(self.batch, x * CELL_SIZE, y * CELL_SIZE, color) for (x, y), color in zip(s.body, s.colors))
+                                            for s in sim.snakes]
+        self.heads: list[Cell] = [s.head for s in sim.snakes]
+        self.colored: list[int] = [s.colored for s in sim.snakes]
+        self.shifts: list[int] = [s.colors.shifts for s in sim.snakes]
+        self.food: dict[int, Sprite] = {fid: Sprite(self.batch, x * CELL_SIZE, y * CELL_SIZE, color, CELL_SIZE // 2, 'circle')
+                                        for fid, ((x, y), color) in sim.food.items()}
+        self.batch.flush()
+
+    def render(self) -> None:
+        """Follow a tick the way `Snake.sync` in the game does."""
+        for idx, (s, sprites) in enumerate(zip(self.sim.snakes, self.snakes)):
+            body: SegmentRing = s.body
+            shifts: int = s.colors.shifts - self.shifts[idx]
+            self.shifts[idx] = s.colors.shifts
+            count: int = max(self.colored[idx], s.colored) + 1  # only the colored run, before and after, can change color.
+            if len(body) == len(sprites) and len(body) > 1 and body[1] == self.heads[idx]:  # moved: the tail sprite jumps to the new head.
+                sprites.rotate(1)
+                x, y = body[0]
+                sprites[0].goto(x * CELL_SIZE, y * CELL_SIZE)
+                if shifts == 1:  # ate: the colors moved along with the body.
+                    count = 2
+            else:
+                while len(sprites) < len(body):
+                    sprites.append(Sprite(self.batch, 0, 0, WHITE))
+                while len(sprites) > len(body):
+                    sprites.pop().release()
+                for sprite, (x, y) in zip(sprites, body):
+                    sprite.goto(x * CELL_SIZE, y * CELL_SIZE)
+                count = len(body)
+            for sprite, color in islice(zip(sprites, s.colors), count):
+                sprite.paint(color)
+            self.heads[idx], self.colored[idx] = body[0], s.colored
+        for fid in self.sim.changed_food:
+            if fid not in self.sim.food:
+                if fid in self.food:
+                    self.food.pop(fid).release()
+                continue
+            (x, y), color = self.sim.food[fid]
+            if sprite := self.food.get(fid):
+                sprite.goto(x * CELL_SIZE, y * CELL_SIZE)
+                sprite.paint(color)
+            else:
+                self.food[fid] = Sprite(self.batch, x * CELL_SIZE, y * CELL_SIZE, color, CELL_SIZE // 2, 'circle')
+        self.batch.flush()
+
+
+def measure(case: Case, ticks: int, seed: int) -> dict[str, list[float]]:
+    """Per-tick samples of one run of `case`, in nanoseconds: headless, then with its phases timed, then drawn; and the
+    bytes per segment, once."""
+    scenario = Scenario(case, seed)
+    step_ns: list[float] = []
+    for _ in range(ticks):
+        scenario.steer()
+        start: int = time.perf_counter_ns()
+        scenario.sim.step()
+        step_ns.append(time.perf_counter_ns() - start)
+
+    scenario = Scenario(case, seed)
+    profiler = scenario.sim.profiler = Profiler(window=ticks)  # keeps every tick's sample.
+    for _ in range(ticks):
+        scenario.steer()
+        scenario.sim.step()
+    phase: dict[str, list[float]] = {name: list(rolling.samples) for name, rolling in profiler.phases.items()}
+
+    scenario = Scenario(case, seed)
+    mirror = Mirror(scenario.sim)
+    rendered_ns: list[float] = []
+    for _ in range(ticks):
+        scenario.steer()
+        start = time.perf_counter_ns()
+        scenario.sim.step()
+        mirror.render()
+        rendered_ns.append(time.perf_counter_ns() - start)
+
+    snakes: list[SnakeState] = scenario.sim.snakes
+    segments: int = sum(len(s) for s in snakes)
+    storage: int = allocated(lambda: [(SegmentRing(list(s.body), s.heading), ColorRow(list(s.colors))) for s in snakes])
+    return {'ticks_per_s': step_ns, 'move_us': phase['move'], 'collisions_us': [sum(ns) for ns in zip(phase['self'], phase['walls'], phase['players'])],
+            'food_us': phase['food'], 'bytes_per_segment': [storage / segments], 'rendered_ticks_per_s': rendered_ns}
+
+
+def median(values: list[float]) -> float:
+    ordered: list[float] = sorted(values)
+    return ordered[len(ordered) // 2]
+
+
+def summarize(runs: list[dict[str, list[float]]]) -> dict[str, float]:
+    """Every metric from the median tick over all the runs, which a GC pause or a hiccup of the machine in some of the
+    ticks does not move: ticks per second as the rate of that tick, phases in microseconds."""
+    pooled: dict[str, float] = {metric: median([ns for run in runs for ns in run[metric]]) for metric in METRICS}
+    return {metric: value if metric == 'bytes_per_segment' else 1e9 / value if METRICS[metric] else value / 1000
+            for metric, value in pooled.items()}
+
+
+def tick_us(metric: str, value: float) -> float | None:
+    """The time of a tick a metric stands for, in microseconds, or None for a metric that is not a time."""
+    if metric == 'bytes_per_segment':
+        return None
+    return 1e6 / value if METRICS[metric] else value
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float, noise_us: float) -> int:
+    """Print how every metric changed against the baseline and return how many got worse by more than `threshold`%, and
+    for times by more than `noise_us` a tick too."""
+    regressions: int = 0
+    for name, metrics in results.items():
+        if name not in baseline:
+            print(f'  {name}: not in the baseline')
+            continue
+        changes: list[str] = []
+        for metric, higher in METRICS.items():
+            before, after = baseline[name][metric], metrics[metric]
+            change: float = (after - before) / before * 100 if before else 0.0
+            worse: bool = (change < -threshold) if higher else (change > threshold)
+            if (us := tick_us(metric, before)) is not None and abs(tick_us(metric, after) - us) <= noise_us:
+                worse = False
+            regressions += worse
+            changes.append(f'{metric} {change:+.0f}%' + (' REGRESSION' if worse else ''))
+        print(f'  {name}: ' + ', '.join(changes))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=500, help='ticks per run')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per case at least, whose ticks are pooled')
+    parser.add_argument('--seconds', type=float, default=0.5, help='time to keep repeating the runs of a case for at least')
+    parser.add_argument('--quick', action='store_true', help='leave out the cases of 10,000 segments or food items and up, and 32 players')
+    parser.add_argument('--save', metavar='FILE', help='write the results to FILE as a baseline')
+    parser.add_argument('--compare', metavar='FILE', help='compare the results with the baseline in FILE')
+    parser.add_argument('--threshold', type=float, default=15.0, help='percent a metric may get worse before it counts as a regression')
+    parser.add_argument('--noise-us', type=float, default=0.5, help='change in the time of a tick that counts as noise, however many percent')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    print(f'{args.ticks} ticks per run, median tick of at least {args.repeat} runs and {args.seconds:g}s per case')
+    print(f'  {"case":<48}  {"ticks/s":>9}  {"move":>8}  {"collide":>8}  {"food":>8}  {"B/seg":>6}  {"drawn/s":>9}')
+    results: dict[str, dict[str, float]] = {}
+    for case in cases(args.quick):
+        runs: list[dict[str, list[float]]] = []
+        start: float = time.perf_counter()
+        while len(runs) < args.repeat or time.perf_counter() - start < args.seconds:
+            runs.append(measure(case, args.ticks, args.seed))
+        m = results[case.name] = summarize(runs)
+        print(f'  {case.name:<48}  {m["ticks_per_s"]:9,.0f}  {m["move_us"]:6.2f}us  {m["collisions_us"]:6.2f}us  {m["food_us"]:6.2f}us  '
+              f'{m["bytes_per_segment"]:6.1f}  {m["rendered_ticks_per_s"]:9,.0f}')
+    if args.save:
+        with open(args.save, mode='w') as f:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(), 'ticks': args.ticks,
+                       'cases': {case.name: asdict(case) for case in cases(args.quick)}, 'results': results}, f, indent=2)
+        print(f'baseline saved to {args.save}')
+    if args.compare:
+        with open(args.compare) as f:
+            baseline: dict = json.load(f)
+        print(f'against {args.compare} (python {baseline["python"]}, {baseline["ticks"]} ticks per run), threshold {args.threshold:g}%')
+        if regressions := compare(results, baseline['results'], args.threshold, args.noise_us):
+            print(f'{regressions} regression(s)')
+            sys.exit(1)
+        print('no regressions')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Frame cost of a scrolling view against the size of the world it looks at, with and without culling to the view.
+
+    python -m benchmarks.viewport_culling [--cells 33 101 301 1001] [--frames 300] [--density 0.05]
+"""
+import argparse
+import random
+import time
+from benchmarks.pathfinding import percentile
+from color_the_snake.canvas import Batch, Sprite
+
+CELL_SIZE: int = 20
+VIEW: int = 320  # half the width and height of the game window.
+
+
+class CountingCanvas:
+    """Takes the calls a `Batch` makes of a Tk canvas and keeps the number of items it has, so the times are those of
+    the batch alone."""
+    def __init__(self) -> None:
+        self.items: int = 0
+        self.made: int = 0
+
+    def create_rectangle(self, *coords, **options) -> int:
+        self.items += 1
+        self.made += 1
+        return self.made
+
+    create_oval = create_rectangle
+
+    def coords(self, item: int, *coords) -> None:
+        pass
+
+    def itemconfigure(self, item: int, **options) -> None:
+        pass
+
+    def tag_raise(self, item: int) -> None:
+        pass
+
+    def delete(self, *items: int) -> None:
+        self.items -= len(items)
+
+
+def run(cells: int, frames: int, density: float, cull: bool, seed: int) -> tuple[list[int], list[int], int]:
+    """Flush times in nanoseconds, canvas calls per frame, and the canvas items in the end."""
+    rng = random.Random(seed)
+    canvas = CountingCanvas()
+    batch = Batch(canvas)
+    half: int = cells // 2
+    sprites: list[Sprite] = [Sprite(batch, rng.randint(-half, half) * CELL_SIZE, rng.randint(-half, half) * CELL_SIZE, 'white')
+                             for _ in range(int(cells * cells * density))]
+    movers: list[Sprite] = sprites[:max(1, len(sprites) // 20)]
+    if cull:
+        batch.look_at(-half * CELL_SIZE, -half * CELL_SIZE, VIEW, VIEW)
+    batch.flush()
+    times: list[int] = []
+    calls: list[int] = []
+    for frame in range(frames):
+        for sprite in movers:
+            sprite.goto(sprite.x + rng.choice((-CELL_SIZE, CELL_SIZE)), sprite.y)
+        if cull:  # a diagonal pass over the world and back.
+            along: float = (1 - abs(frame / frames * 2 - 1)) * 2 - 1
+            batch.look_at(along * half * CELL_SIZE, along * half * CELL_SIZE, VIEW, VIEW)
+        start: int = time.perf_counter_ns()
+        batch.flush()
+        times.append(time.perf_counter_ns() - start)
+        calls.append(batch.flushed)
+    return times, calls, canvas.items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cells', type=int, nargs='+', default=[33, 101, 301, 1001], help='width of each world in cells')
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--density', type=float, default=0.05, help='sprites per cell')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    print(f'{args.frames} frames per row, {args.density:g} sprites per cell, a twentieth of them moving every frame')
+    print(f'  {"cells":>5}  {"sprites":>8}  {"":6}  {"flush p50":>10}  {"flush p99":>10}  {"calls":>6}  {"items":>7}')
+    for cells in args.cells:
+        for cull in (True, False):
+            times, calls, items = run(cells, args.frames, args.density, cull, args.seed)
+            print(f'  {cells:5}  {int(cells * cells * args.density):8}  {"view" if cull else "all":6}  {percentile(times, 50) / 1000:8.1f}us  '
+                  f'{percentile(times, 99) / 1000:8.1f}us  {sum(calls) / len(calls):6.0f}  {items:7}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,2 @@
+"""Color the Snake! as an importable package, starting with the headless simulation engine the game is built on."""
+from .engine import COLORS, WHITE, CELL_SIZE, Cell, Heading, CollisionKind, GameConfig, Scatter, Collision, SnakeState, Simulation
@@ -0,0 +1,64 @@
+"""Non-blocking animations that run as timed tasks next to the game loop."""
+import logging
+import time
+from typing import Any, Callable, Iterator
+
+
+Task = Iterator[float]  # changes some drawables, then yields the seconds until it goes on (0: the next frame).
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Animator:
+    """Schedules animation tasks on `after` at up to one frame per `frame_seconds` while any task is running."""
+    def __init__(self, after: Callable[[int, Callable], Any], render: Callable[[], None] = lambda: None, frame_seconds: float = 1 / 60,
+                 clock: Callable[[], float] = time.perf_counter) -> None:
+        self.after: Callable[[int, Callable], Any] = after
+        self.render: Callable[[], None] = render
+        self.frame_seconds: float = frame_seconds
+        self.clock: Callable[[], float] = clock
+        self.now: float = clock()
+        self.tasks: list[tuple[float, Task]] = []  # (time the task resumes, task)
+        self._scheduled: bool = False
+
+    @property
+    def busy(self) -> bool:
+        return bool(self.tasks)
+
+    def play(self, task: Task) -> None:
+        """Start `task` on the next frame."""
+        self.tasks.append((self.clock(), task))
+        if not self._scheduled:
+            self._scheduled = True
+            self.after(0, self._frame)
+
+    def _frame(self) -> None:
+        self.now = self.clock()
+        running, self.tasks = self.tasks, []  # tasks started by a running task join `self.tasks` directly.
+        for wake, task in running:
+            if wake <= self.now:
+                try:
+                    wake = self.now + next(task)
+                except StopIteration:
+                    continue
+                except Exception:
+                    logger.exception('animation task %r failed and was dropped', task)
+                    continue
+            self.tasks.append((wake, task))
+        self.render()
+        if not self.tasks:
+            self._scheduled = False
+            return
+        delay: float = max(self.frame_seconds, min(wake for wake, _ in self.tasks) - self.clock())
+        self.after(round(delay * 1000), self._frame)
+
+    def wait(self, seconds: float) -> Task:
+        yield seconds
+
+    def tween(self, seconds: float, apply: Callable[[float], None]) -> Task:
+        """Call `apply` with the progress from 0 to 1 on every frame for `seconds`, ending on exactly 1."""
+        start: float = self.now
+        while (progress := (self.now - start) / seconds) < 1:
+            apply(progress)
+            yield 0
+        apply(1.0)
@@ -0,0 +1,42 @@
+"""
+The entry point of the game: reads the command line and the player's settings, shows the menu and plays the game.
+
+    python -m color_the_snake [--replay LOG] [--connect HOST:PORT] [--bots N] [--interpolate] [--arena CELLS] [--profile [FILE]]
+"""
+import argparse
+from .userdata import APP_NAME, UserdataFile
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=APP_NAME)
+    parser.add_argument('--replay', metavar='LOG', help='show a recorded game instead of playing one')
+    parser.add_argument('--time-scale', type=float, default=1.0, help='replay at this multiple of real time (+ and - double and halve it)')
+    parser.add_argument('--start', type=int, default=0, metavar='TICK', help='start the replay at this tick')
+    parser.add_argument('--connect', metavar='HOST:PORT', help='play a match on a server (python -m color_the_snake.net serve)')
+    parser.add_argument('--bots', type=int, default=0, metavar='N', help='add N snakes steered by the computer to the game (up to 30)')
+    parser.add_argument('--interpolate', action='store_true', help='draw the snakes gliding between ticks at the frame rate of the screen')
+    parser.add_argument('--arena', type=int, default=0, metavar='CELLS', help='play on an arena this many cells across, which scrolls to follow your snake')
+    parser.add_argument('--profile', nargs='?', const='', metavar='FILE', help='time every phase of the game and show the times under the scoreboard '
+                        '(F3 hides them); with a FILE ending in .csv or .json, also save them there when the game closes')
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    arguments: argparse.Namespace = parse_arguments(argv)
+    userdata_file: UserdataFile = UserdataFile()
+    own_settings: bool = not arguments.replay and not arguments.connect  # a replay brings its own settings, and a server sets those of its matches.
+    window_pos: tuple[int, int] | None = (0, 0)
+    if own_settings:
+        from .menu import Menu  # Tk, turtle and the images load only once needed, so importing this module stays cheap.
+        window_pos = Menu(userdata_file.data).show()
+        userdata_file.save()
+        if window_pos is None:  # the menu was closed: the settings are kept, but no game starts.
+            return
+    from .game import run
+    run(arguments, userdata_file.data, window_pos)
+    if own_settings:  # neither a replay nor a server may overwrite the player's own settings with theirs.
+        userdata_file.save()
+
+
+if __name__ == '__main__':
+    main()
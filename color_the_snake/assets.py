@@ -0,0 +1,17 @@
+"""The images of the menu as base64 GIF data, decoded into Tk images the first time they are asked for."""
+from functools import cache
+from typing import Any
+
+
+# This binary data contains the colored title of game as .GIF image file.
+LOGO: bytes = b'R0lGODlhgAJUAHcAACH5BAQAAP8ALAAAAACAAlQAhwAAAAILCwsCBAwJAgsMDAAQDgUWFBUHBBcIFBwUBRIWFhIbGxgYGB0LKgMgHRIkEhAxBAElIgQxLQc6NRomJxowLxQ1MiYICioRCDENCzoKEzoUCzwVHCMBIzwCPDccITQbNCwiCDImCSsiJTknLD0tMjk2OBMqTC0QQDs9QABAAARAORBBPCJEIi5cLi16CzJkMgxOSAxTTQxaUxpJRRVRTBRWUQNgVw1uZApzaRhsZBFxaCVKSCZbVzZAQiNjXjl0TyRnYyhybCx9dzl0cUoLFUUUDkcVElQMF1gTF0oWKFwXJEImDUMvDUMyDUo2Dkk4DlEqEFgnEUUmLUotNEY1OlYlLl0oMlM1PWsOHWEYFnUOHnMZG2wVJHsOIHkTJGcmFGY1FGY5FGo+FXQhGXk3F2ogLWgrNnssO3YwPk8DT1cDV08/RVg8RGkEaXcEd2A+RmU2aXYlfFtDEWFEE2RNE21FFWtJFHVFF3NWFkBAQExKTlZES1NKUF1eY0B/QERubUBwb1hhZWdCS2tVXXJATHlMV3NRWmJbYWxsbCpdqHYqqAC0ABuHfSeAeQD/AECgEEKHcVq0Wnugew+PgwaUhhKNgUqYkUCN/4UeH4QPI4YTIpgbJ5wcM4UnHIs2HJAuHpM7HYgoOYEwP5QoIJAsPp87IKYUK6YeNbIaLbIcNq4iKqUhN6Q6ILIpK7okPbo5J48/T5kuQpUpVZU7TKouRKgqXaUxRrYnQLMzbIlZG5hHHZtXHp9AIIhkGploHapBIr5cJaNvIKx6Ib5iJbV2I49AT45AUMkbN9EcNcEgOsE9KM8wMNgoNNUxMeM6M8VIJ8VYJtFEK9BcKcB/JtB+Ke1IMvBMMvdaMPZnMPR7MP9AQI0FjZMFk6cGp7oGuqQzqIRNlbNA/84HztgH2OEI4f9AjauDIb2IJLqQJMCBJsqTJ9iPKteeKdelKueLLeeQLfKJL/ODMPCYL+6rLu21LfChL4CAgK2trbS0tID/gKLWosPDw8rKytnZ2f///wj/AAEIHEiwoMGDCBMqXMiwocOHECNKnEixosWLGDNq3Mixo8ePIEOKHEmypMmTKFOqXMmypcuXMGPKnEmzps2bOHPq3Mmzp8+fQIMKHUq0qNGjSJMqXcq0qdOnUKNKnUq1qtWrWLNq3cq1q9evYMOKHUu2rNmzaNOqLcugrdu3cOPKnUuXLoG1ePPq3XtSz7+/gAP3C0z4H7/CgQ8j/qt48T2+kCNLnuzQ7+J/gy83Rry5cGfCjymLHk06r+XFmRd/TnzZcOvQpWPLns31NOLUnFuvBrz7L2yNUOoIH068ePEBOJmIWS4mjHPnUUZn0EK9evUkYgUg2c69u3fuRZAk/yky/kgRsQQoWBhhQX2FChYsBBAaYMIK+yvy6y9w0XZh3J7pJuBlv2V0Tj0IJqjgggsmgBMv8kQoYYTaEDMaGc9Y88yGHD7jjFgXICPiiCMqg4wyKKL4ijKvtNgiLrigItYCgARi441EBEKEAUIZUMmPQAYZQX+tAUhYb65p9lpHBzLoJIMO3gThhBJWeGGHWH4YVogknojMK16CuSKLLLrYYiczAqJmjTYS4SaPQfkY5JxDWuQfYUaypuSejjH55J8JRmnTlFTKY6VoZGiI5YZagsWliKqIaOKXX6aoYpkuohkWjWveqOOOPc5JJ5GX5cnbgKotyVGTgD4paE28xP9TqKEWisZFhot6CGKXI6piIpiWrtgippqCxamabX4KJ1ByivpjnRXdKRiqufGJWIETiaCttuko6E464IYr7oJQbCvCATPFOuuhYB2wwbsbZBDvvAphmKuuXB1wwb4XFNElJ50ALHDABAPcCSpmssLvvl0dy6aOOi77U7POQkuRtICZyhi1ARKIkTt/5pFQAoBCka6shbL71RHXWOPyyy+ji1Ci9zaqlb+8jvhQEWa+CCMuAnDlMI5vhurssxeZ4M/STDedT9NQ+4NP1E1PTfXSVl+dyMchj1zyyevWChbL15QNs8syH3Sroll2hUTOOjvEc89mBr3V0ERL7BPFolr/PBHGf+VDFMhPiowQyX+aLJO6KYu9ctlmn522QfbmanNWOMO9M911C70mmzkWHefRSNvZmuBDEe6k4Qch/qTiMak7D5Uqe0V25DBPXhDNlrsNt4ibc96i3VrhDTGoo5Put0SA/4O6UKozyLpBrjsJO0yMF+q47ZC3LHlCa/fOVeY5By888VkZ7ybyzJJeyfIRNf/8TtUz6ARF0V//UvZUbt/V7d7LXUIqt6jLYeVtvzMf59CHFeMpy2hHgx9E5OeT+i3ofhPJH9hm5T+uAPBs1tAdQXhXwK6Qj1cKpBsDr4K30LFvYu6T4EMo2BMLKgiDEtHg4mSFsgl1cCsf/B5C/8JXQq4gUHNyE97wPNepZL1wbzEk1WLmpxMbJgiHEdFh7HrYP7EEUYAzuxe+tnLCLqWwZyu0ivpE1z7lSRExVMyJFRGERYhoEXvx4KKEfqiVL8ZsgGxrmxF/h4wzdu5un/MUG2HoRtNdJo44mWM96viQEJhLhAgZADo2yclOerIY6gglNXjxEHXpUR58NEgZosHKVkKDla+MpSyhAQ0MOOQCtMylLnfJS09QBAzLgMYyliGN7oFwGbBIJiw2QBAiZskV0IymNF2ximquAjsTycIptsnNbnrTm5jkSBlJ9BABLOycF1DIEUTBzna6UxRogCc80UDPetIzDRygCBXaAP+HNgyCDwANqED3QNCC3qUhLXwgQijwg4b+IAgP1QFEFbICHVj0ojjQwQ42uoMcdNSjOQip3hLCt1E5cooVBBQlRXKAetDDpfSIqUxnOg972NQe9ChGKU9Jq4fsIhtADapQh4qNoGKDmQ3BADaWytSmOtWpraAIGbBRNmxYw5gghJkRRijGDjnjGc0AazPGStZmcIEim0iGWtfKVmQkw61wfWsy0imSI5ZvJEuohV73eou++rWvtLhFYGlB2MLSQgkUwYIhFnuIxjaWEJCFLCImO1k/+OGgDFFfxBJigSF49rOedcQQFFKDRpj2tJZIrWpXm1pKVGKkCCmpkJK2j9r/2va2k0jpn1YakgS8dKbApQc8cEoPm85jHjp1iOxol8qC/HSo0C2qdJeaDaQyRKlPze5TozoRT1zDqt3DXVatsdWBkDBXYQWresM6VmeM9awTSStb50tfuSKDriEZZ9xEkte96vWvAB6sYAVb2CkkdrGGcOwhIhtZylb2sg5Z4xMJ0lnQDsERGB5tQkp7WtOy9sOtdYBDZAskGTpEBY9IsYpXzAjdPom3IGlpcGdq05jW9KbJbQj/qtRcgjwXukTNhnSFbN2FYFe7SMYGdyUy1apeFXLjfVl5BeJM9G6IvWMV63vRWt+1xtWtanUrfkFiVxTi1b//BfCAB2zYwiJ2/yKKZaxjCbHgBjvYsphdiAMXWZAKgxbDoiVthz0M4tW6FrYHIXHpKoLiFTu6xTVUKUpkPOPg3tQeyN1p2HyaDW0AOchDLrJCjpzk7C45Ip4Ab3gDON4pA4CAi0ovltdbVvhKRL5dnu+Xx/wR/QLvzGhWs18FPNgCH1jOj2UwIRyMCDxHOJHHm/BA/PxZQGsYIRzucKFZSwkRN0TR77tIox2tYkjzRJIw1ggGfPELX7AbpjHNAx3mTW86iGEOwrh0O3TBC37rQiE7plAqy7CLgociGkINBhgWzvCGC1nI2ABGKCYeClEThNSlbkXDXQ2RDSRh4VoIBVZhBgbrTO68Hf9qRhJWvnItsDwJriirKzbxhUxsApsI0YImvsAFTaSCrZz4Tne8nAxNeOHoXuB1Ri7QnSx06QtQj7rUM5CR/vrXr7I4ghI4oHWub/0IozAsGqxAdit8QCFToILaqTAIBB+iDSOIu9znTlnLpsAEeE8BogGg2RdSgAY04AENegDaIMRnAhaYQEFYQAMZ1KAGO+iwDiZAecRXnvKqde0NZMB5GcgQ3CZuyLjJ/Qhz00/SIoHCgoD7qoLc4abHncdw4QEPgPO0dgWJhqc7PdRQKGTI1GUqGBKC8SSTwSN+RBv4cFVEhHCiGe4t61hPoZCfd3kLCrGv9pGBhJE8ikSR+pX/r17RfYxYna99lYVCztDmwh7jDAophCGOgWC3k0AhdfeDIPa/fwokRMISwwNuMgREYGE/oBA6MGgdJgMKwW1BonixFUUWMXrkZnpVhHoh4QQI8luslxCvB3uYdly1lxCEwlwKgXC752m7twsK8XDBJ3zEV2pNdXwdkXwhNEBiZEAE8XzSR1acUH3J0Az1ZWsGIQBg9mVvVX4h8X2RIimUgiLcV3VoVgt+JQoKgQbtRwvGEAvwlxDyV3/2lxABkH/813//B21t8kI0UIBE4AgF+FkHmBAJ6AgK2AgMmBCZVwmWQAl8WAkQmGgSyGikV24u5iTplhEayIEdiBAfWFPH/xWCI4gQJTghuEcQusd7vfd7ELeJSzV8CFF8SEaDHHE7WRVOrxZIXqUQpNCDZEV9CWF99YV9CbF99nUeIvF9JeIlKUJ+UhhsfVUK65eFtPB+8Ud/YJhg95cQZFiG/ocQCbVIAkiAFjYEcYgQCViHdtiAq1UJruVaf2gQoCdug5hiFihHGAgSiaiIMtV6BPGBmBaCIghw8jA7JpgQKAhUuwdUvpcQLviC2OCJBwGK2iWKG0GKIGSKVcYhOjgQPMiKP/iKQTiECWGEtKhWtriEvDIpUAgsSmgR55dmtwCMCYGF7beFXYgQX3gMh1B/h5CMByEAy8h/zXgQfScxa8iGBv+IgHRYh3eIEJlHCZbAjdz4jQURjhM4jqVXiPYzEk6gjjPFjgPhjvAYjyS4LpU4EJeYj0HFggkxXRAHg5+YZLBAcaHAcRlBiqx2g2FUMwrRkD3oiggBi/QVdEK3HWEmV/bVkR9xAFLXl1/gKynyBUUwmIRJmBrwEB9Jhb8YjFlIjAmRdlRQBWonmZJJAnN3mSMQk2bojGi4PvFBARXAUGzoCEEAeIBnAQhoWjspeZfXmhOQh0HpWn5IUoFIERT4aEp5QUzpUvD2lB5oXO8Ye5F4EJNIIVcpEPcIXfuIEP34lf8Yg0hmcTUIZQeJg8zXIczQltHXgw8ZlxGZa3eJhOL/mQwXuRKc8ISXQjfFwhCJ6VciiRAk2WYmSREkkGwMxmyWVYaCMJMGsWefsj4DWIA08BBziI3atm2xKZRESRBGKYjjWI6RdI4f0ZQw1Zv0AJUC4Y6xJ5zymDLHCQCXyHv5yJUI4ZVOBZAGIZBLJZ2jCGVpaYqwlooJ4ZbSB5cHIZfgqX1Eh4TlqRKcAJjpiSlngphT6J6M2X6OKRH1WWf3eWf6x4xn2EQuBKBu4oYEOKAOcY0GiqCtBZRCaQkLOhANShEQAAlmeqZo+gK5eUO7WWkX+puOOJXDaRDFaSgfmpyZ2JXNCZYBmWQsWpDUKUQHgSGouCHZmRCryIrN0J03//qdObqjeKl9PZoSnXAiwSKkQ+oQ7bmYI5mF8zkRS6psy+ak+smfBSFhVBqgjoClDaEDq1mHXLqHeiiUsxmBjVQRR7ANurqrvOoKuvVSSykSFFppGAoAjTiVstehtHOnKqicmuiPnQid2vWnGmGQgko5OdiWitoMNmoQOJprcdVWtDipKHGeYkImwmIm67kQmxqSR9pmSRoRoaps+PmkMhmlyBJtVCqNAkqgqomNsZpaQumNtHmrFKEB18CrCuurkQaswZqBbvqmjOiIG0qVkuihdxpUKaiPz8pUX4miBaGiRzUS1gpGgypGh+p828qo3uqobfVNMAuz5HoSX9AJNv9rMDZ7MAlzTgrRru95EPFpWJ/aEAegAAigAAdQBfYpUH2gmfuJrw+Tqm4SBBAFUaiZpY3wqh3GUVwLUh8VUmAbUmEqEGM6EbmqsL1aQQ7rsHTElBFbrK9HsRv6DspaJdrArJ+2nAcBfCeaEBfgpyQbqCaLrYU6RgdBo2XVrQXxrWtFhEkxN5wDNAnhs+9qWPG6EIqlYMnGBgXhtKZKEM+YqhVAEVqqgD25EWUrERqAtmnbsLypm8L6tnCKrMlalcuasc0qVHprENPVu88ZltEZuOL1R2uZKyl7EInqkEAohPQli0sBuXQjuQhBuZ1aklz4EHGmuZDFuQThuVBLNKL/S7pae1qnqxGpGxFny7rbwLDn9luG6LZuCrdyO7d1a5x4C2S7WxAm2lQgSxB/G7wiUbLEe7L30gzaup2JC4Rd5rhIAb09I70HQb0IwX7We5IMkb0Ktr0EQQDey5lS+p8AOroTcY3jW74Zcb4QgbDqu74p5b7A+lKHiBFNGb8e+IgVOw90a7t2e7ephHCYqLsd67HRCrzTKrzjBaPX2SHLoK2KyrKL67Jr5bxK4cBmAsEGIcEHQcHyaQwWjLnIxqRt0LkPVqr4qkhSK8ISUaCm6xEo/BDpy7rsSz8uvIFtG7s0zIi0e1w5fLGUeLf3i49Blb8EEXzO+bsH8b9FHMDD/zvA2FrAqritiksQjKtWUvy4SmTFBfGRf/WzBhG0hWUMXIy9X1xn3DsQHUyTTaSvACoBpGugJowRbewQq7vCcRwRD+ACuJzLurzLLtACF+Fbc7yBMYwQ7cCb9PAECTHDxJoQdnDDsbfHxHm7GfvDgdyCSNa/AyGy1HqWZpOWaqk2hfsMysDEyguR1zcTvlZISSQ8mEwQmmykCaHFQhvKXniMCXYIJZAQHDzGUOrBDwPCqSqNrMoQroqNr6wTb4y2tQwRMKAPDv3QEB3R+iAJv6yIxjxJFFHMwIrMCKHMM1aszZzH0EynfezHwXCCWgnEetq7EIfNAoHI2bXNGEE2R/+8fGw5oyurwLE4E2VmRuscuWkkEO/MqRPsqfSMksbIki2Jf82Wn/2Myvk6pQHNhgO9ECS8xkChwuq70A/R0BL91Q5N0RYBzBxozMN8EMUMU/pDEB4NXPBgSxPrzDhct358tydtj5+WDYI8EE7lnC4NANpsxN6MxPdyvAaBuK2o082LzoRkSC8S1AAw1O5avVvcxQXxhWDYWC55EA9mr5sJ1VEL0AFKgKvqrwYdFBqQC6q92qw9C0rw2rAd2yBwArRd27YNBGAN1mJdEWQdU/CG0RPRDu7L0QfR1jJlUyAt1/Ew0gVRgnWtDXeNEMmplXstEHzLv34LuIrszco3RGL/ZMA43cSKPV+V7BI9DSnq3BBU7CLtPBCSzckFIc+ffNQHIX9JLWebXRD77NRP3Z8fLLWjTQRVrZOnDRQoIA4InuAKDg7m0OAO/uDhgAkSPuEUfgm5/dW7bRAI0BC9LVMwddYGodExtdYDYdy+iRDNfMPxMNc6/NzQfYJ5Xd0A4LvYTcQxbcSlaJ3GS87cOd5sVd4tkc6O/QrtLdS+SNRZ3H6xMIyWTRCYrdT5Lcb8fa/+jCOijZNtOOBy6MpBceAK/uUM/uBiHuEUXuYWfuERneED4QbjUA7k4A0brhDmIgIzVQ/r0ElzkBAH4Em+/VLEbRDGPVzCBdcHkeIqztwE/0EoLh7dB4GnKl2i0DrEh6zdIcEyUYaQ4QzeKquokTwQk5wMQD4QMbtNh9kR571fDLHeRF7kkX3kkw2fjUnfBvHkbrfUytjU+vm0Va6vFGAAvm4APfCGRCAEDvUDWj4QpTtoBy0QOJADzR62IcXKsQXt0L53DuHlX57gYS7mDk7mZT7hZ47mD63mAMAN5XDu504Ocd4Qwm3R8TYyZQ1cf14QbV1jyM3MKq7HHeri2hANMJ63Qdy3Nv5UMn0Rll7T3o1ehl0QiD1WTizJuRbqAvFWcKOXGaFfkeLYMALZ7125WhgLl3vZ943f+szP/X2qqexCATiab+hZ1XgQBc2T2v/oWgn6I2MLALHcENie7eKw7dxuDt7+7ZgQ7uI+0QXhAeie9N3wEO1gD7/t29NTEMBsoTE172ztpvaQ3Cq+3PKoDXZa14xuED6MvwFf45MOwJXeMtxN2LkyzuFdzt55zghBkeM5sxZx6r+m3uzM6h0fz40Z8k5uz5rN1FP+2f4d1f9pk8IuWnCYmgXuk6o1q3148znPEDuf7T7P7UH/7UQv7mruBkmP7uPwEO7g9DMW9QRBaTNm9QPRBDMl6MOV9fi+oSs+D1xPgl7P7/6O1ynNsV0Z6YacopQOEgef4wkvPpvOip0uEJ8u8QBAi3Bl8Rgh5D/9wHzv6vBNEPL98YD/PxD2vZLIFuXdi+tkvOvRtvKknZNb/vgH0aUJSrC2GkEXcflg/vPdLvTgXvTjXhBvEPrpDhAABA4kWLCdvXr0FC6kl6cgwQQMJdJ78nBgE4Xw7Nmjt3FjAosC7cwjSTLevJPvQgrkJU/bS5gvg60EEC3bTZw4Q9HElg3bT6A/way8ENQotg00lS4VeOSaNahRox5YSebZVaxYmdHk1Mzr16+caKZKVtas2S00kyFb27ZtEaZxByJBVtduXVXI5BZ51ddvX1y4BKxcUsuw4VuJb4miiYbWY8i0jh07Q7OQIcyZD20msZIAIkR+/AgiXZrCygWAVAcKRKQ1ESIGCNIg/zJkSG3btn/Q1OGo0W/gv2XQtGSJUiVLlY4fn7DSQCXo0aVHkBsShTjs2bWDM9fd+/dwmMSPJ39J33n06dXrk1RwTTn48ct5k0unzh386xii89Xf/3+EFsoDP/wwWCkBOwjMoyOPftHlQQghLKakeaoZ48IxxKCJl5g6jIYmKcIAQ0SbcIrmExRTVNGoT8AAgwwwkgoJg6OCkrE6HC9w0UUypLLGEyCBvIAgLrIyUhmuwFJSrJWKQAKJLJA45axTtrDySizbYmuLJ58cEselLugSyruQ+aILNNNUU81NcPGLlSSOWKKIJGgq7LBaFLulFJrOiOwxY2KhjKYPSCiUBP84DNnsED6oKMGER02QVFLQRCvNNNRUA4S112CTbaAILBDVAhuIcMQ2IWhQVdWCJJjAggkm0CG4HWKw1VYZYshVhuKKq0SGCVYQ9lOLnpPuWOrAJOg67Zrl7jtowyNvWvPWs/a89goahxz5ylFDWQCGmWjcjhJaCCQwD/BoI40odLekeIiRi8MOYZoprl1y0rcnfn3iF6m4iqrxpxvBxfEAH6V6xgiCrDISK2eSVPKrU+Ta5Cyz2NJYSy2/NDjHMu9SRRlkXlFGGZP/+qsTue5ETE/GVvLzz0AHjQsLRRclZGeeQfM5tNEuFeS0kFJbrbVOiX3Igtxsc+Tpp2mqIbj/Rnq1+mpKKLHEgbiMPTa6ZA1mttnsnoXWO2mnHa/aa9fLliAEvomPnDUMFpdcvBVC9+B1N5rHnr/fNWmeYuatF6YP4wpFX58a//dxgJmiceDIP64O4YSfgYrhgYp8uJlntlqpq4m9YpKpizFWPWO3PLY8YLvyIvkVZE6e/eSUVX6F5bhczlNPPmX+kxZjjLGZKZwXPYTnnn8GWuihMz2609hWYrppqKNeSQaqr/beOOS4ZsrrrysJG9yxyRbH7LPNSVttTNhuO723C/LADTUQ+PjuvMnd+3KPBA5wgqNQvAx3uGzciymLY1xPHOcvGwWMcpV7HVMw5yPNLaxhD7tK/zMiNrrSmc5iq9tYCTtWQblcIGQjIxnuXNgXlK2sZXjS02IaM7ziHW8pyVMe8wjhvOcJjWgWMRqnXAOb6oXkernJniOk1r3vea8SSqMJ+b52PmU1YBFb5GIX5WALMIZRjHFQRBnNeMZIzM9tKAwJ//o3kf/JRV0BHOAA33WSecgrLvQ6XOKYkq+cOPBfEIRgwWgyuYEZko0huSAGrcE5gXiOg0gCYQgrFpfUrU51G0uG6xYZEhXahWS1q53tbJc7lfGOKb6rYfBCMrPI5LAyN8vZZnz4w5+JJmiXGuJDimhEJFKRIEt0WvZowr3gRNFqyKGE+JZiRWR9ko0wUKN66v8nzTv8Qpvb5GY3u0kVMA3Am9zkxS/KeU5elBMPcgnDLnjhzl3Esxe7KINcwNALfJoin6bgZz/92U9PruQArfinPwMqTYIcgBSmIEVDHdpQ1x3hoaTghCc4AYpM0CQJm+BoRzuqBbkgwaMj5agmTHrSk4IToRY5wBdc+oVNuDSmL6VpTWnaBblwoAtm2GkXzuDTLliBJkowwxWMelSjfkAuJKhCU5361KaywQRSTUFVreoDrCrAOTzgale9SoCVRIAHNSBrWctKkwnUwAYzWKsN3LrWGcRVrnMVZkgCcAO85lWvdV0pjqhZTfRcs6+DJWxhDXtYxCZWsYtlbGMd+1ikyOKoBZKgbGUte1lJ/CGym+VsZz37WdCGVrSjJW1pTXta1KZWtatlbWtd+1rYxla2s6VtbW17W9zmVre75W1vfftb4AZXuMMlbnGNe1zkJle5y2Vuc537XOhGV7rTpW51rXtd7GZXu9vlbne9+13whle84yVvec17XvSmV73rZW973fte+MZXvvOlb33te1/85le/++Vvf/37XwAHWMADJrBSAgIAIf4KUGhvdG9TY2FwZQA7'
+TOGGLE_OFF: bytes = b'R0lGODlhPAAeAHcAACH5BAQAAP8ALAAAAAA8AB4AgwAAAAsLCx8fHy4uLjw8PEVFRWtra3FxcXp6ev/m5gAAAAAAAAAAAAAAAAAAAAAAAASnMMlJq7046827/2AockBpnmiqrixrnUQhz3RNtHj+mgbi/8CgIUdcvQKDwSHIBB6SgaIU8BI0r0zBtFjFen3ara4CsH6xYXGre76m1UayuZ2Fr+X05tuOYueBe3wmfn9ggiqEhYGHiX+Lgo15j3yRdJN2lW2XcJlnm2qdX59ioV6jW0dJS3RPA1GHfWQ8eUOwiLIlMTW7Mze2KTu/sCPExcbHyMnKExEAIf4KUGhvdG9TY2FwZQA7'
+TOGGLE_ON: bytes = b'R0lGODlhPAAeAHcAACH5BAQAAP8ALAAAAAA8AB4AgwAAAA42DhJIEhhgGCSQJCecJzDAMED/QP/m5gAAAAAAAAAAAAAAAAAAAAAAAAAAAAS0EMlJq7046827/2AockBpnmiqrixrtTAcEHRt30RwvnGfDoegcEg8DHYVnxIgGBSKUGFhICjxljFDdCs0WJPYLJfrBVzDLO04Wj6jVep1sQ1+r+LyIZ1iT+fnX3x9cH9EexODhIVdgYiJKHiFhxKPkIuMZnWVAJF/kwibJp15n6Elo3KlpqhrqqGsY66bsGSNlKZNT39TVZmCpgBAf0cmbpszOMk0OsWawG8j0dLT1NXW1xMRACH+ClBob3RvU2NhcGUAOw=='
+GIFS: dict[str, bytes] = {'logo': LOGO, 'toggle_off': TOGGLE_OFF, 'toggle_on': TOGGLE_ON}
+
+
+@cache  # a Tk image belongs to the interpreter that made it: use these only while the menu's root window lives.
+def photo(name: str) -> Any:
+    """The image `name` of `GIFS` as a `tkinter.PhotoImage`."""
+    import tkinter as tk
+    return tk.PhotoImage(data=GIFS[name])
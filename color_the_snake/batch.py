@@ -0,0 +1,384 @@
+"""Batch simulation of many independent games at once with NumPy, for evaluating control policies."""
+import numpy as np
+from .engine import COLORS, EAT_RADIUS, FOOD_MARGIN, CELL_SIZE, Cell, CollisionKind, GameConfig, Heading
+from .storage import WHITE_CODE, color_name
+
+
+_DX: np.ndarray = np.array([Heading(h).delta[0] for h in range(4)], dtype=np.int16)
+_DY: np.ndarray = np.array([Heading(h).delta[1] for h in range(4)], dtype=np.int16)
+NO_ACTION: int = -1
+NO_COLLISION: int = -1
+
+
+class BatchSimulation:
+    """`games` games of the same `config`, advanced together by `step()`.
+
+    Snakes are ring buffers along the last axis of `xs`, `ys` and `headings` (games x players x capacity), starting at
+    `start` and `length` long. Their colors are a second ring per snake that only holds the colored run: it starts at
+    `color_start` and is `colored` long, and every segment behind it is white. `occupancy` counts the segments of each
+    snake on each cell, and food is a grid per game of food ids (-1 for none) and color codes. The capacity of the rings
+    doubles whenever a snake could outgrow it.
+    """
+    def __init__(self, games: int, config: GameConfig = GameConfig(), seed: int | None = None, capacity: int = 64) -> None:
+        if config.players not in (1, 2):
+            raise ValueError('a batch game has one or two players')
+        self.games: int = games
+        self.players: int = config.players
+        self.config: GameConfig = config
+        # not `random.Random`: a batch game only plays like the scalar game given the same food draws, which
+        # benchmarks/batch_throughput.py --check and tests/test_batch.py feed it.
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.tick: int = 0
+        self.width: int = 2 * config.half_width + 1
+        self.height: int = 2 * config.half_height + 1
+        margin: int = -(-FOOD_MARGIN // CELL_SIZE)
+        self.region_width: int = max(0, config.half_width - margin)  # the food region, as in `FreeCells`.
+        self.region_height: int = max(0, config.half_height - margin)
+        self.reach: int = EAT_RADIUS // CELL_SIZE
+        self.near: list[tuple[int, int]] = [(dx, dy) for dx in range(-self.reach, self.reach + 1) for dy in range(-self.reach, self.reach + 1)
+                                       if (dx * dx + dy * dy) * CELL_SIZE * CELL_SIZE < EAT_RADIUS * EAT_RADIUS]
+        self._near_x: np.ndarray = np.array([dx + config.half_width for dx, _ in self.near], dtype=np.int64)  # grid offsets of the cells a head eats from.
+        self._near_y: np.ndarray = np.array([dy + config.half_height for _, dy in self.near], dtype=np.int64)
+        size: int = 1
+        while size < max(capacity, 2 * config.length + 32):
+            size *= 2
+        shape: tuple[int, int, int] = games, self.players, size
+        self.xs: np.ndarray = np.zeros(shape, dtype=np.int16)
+        self.ys: np.ndarray = np.zeros(shape, dtype=np.int16)
+        self.headings: np.ndarray = np.zeros(shape, dtype=np.int8)
+        self.start: np.ndarray = np.zeros(shape[:2], dtype=np.int64)
+        self.length: np.ndarray = np.zeros(shape[:2], dtype=np.int64)
+        self.colors: np.ndarray = np.full(shape, WHITE_CODE, dtype=np.uint8)
+        self.color_start: np.ndarray = np.zeros(shape[:2], dtype=np.int64)
+        self.colored: np.ndarray = np.zeros(shape[:2], dtype=np.int64)
+        self.score: np.ndarray = np.zeros(shape[:2], dtype=np.int64)
+        self.last_collision_index: np.ndarray = np.zeros(shape[:2], dtype=np.int64)
+        self.occupancy: np.ndarray = np.zeros((games, self.players, self.width, self.height), dtype=np.uint16)
+        self.food_ids: np.ndarray = np.full((games, self.width, self.height), -1, dtype=np.int64)
+        self.food_colors: np.ndarray = np.zeros((games, self.width, self.height), dtype=np.uint8)
+        self.food_count: np.ndarray = np.zeros(games, dtype=np.int64)
+        self.food_in_reach: np.ndarray = np.zeros((games, self.width, self.height), dtype=np.uint8)  # food a head on the cell would eat.
+        self.next_food_id: np.ndarray = np.zeros(games, dtype=np.int64)
+        self._eaten: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []  # cells of food eaten during this step.
+        self._eaten_grid: np.ndarray = np.zeros((games, self.width, self.height), dtype=bool)
+        self._spawn()
+
+    @property
+    def capacity(self) -> int:
+        return self.xs.shape[2]
+
+    @property
+    def mask(self) -> int:
+        return self.capacity - 1
+
+    # ---- Setup ----
+    def _spawn(self) -> None:
+        """Lay the snakes out like `Simulation` does and scatter the random colors of the first one as the opening food."""
+        every: np.ndarray = np.arange(self.games)
+        n: int = self.config.length
+        self.length[:] = n
+        self.xs[:, 0, :n] = -np.arange(n)
+        self.ys[:, 0, :n] = 2
+        self.headings[:, 0, :n] = Heading.Right
+        for i in range(n):
+            self.colors[:, 0, i] = self._pick_colors(every)
+        self.colored[:, 0] = n
+        if self.players == 2:
+            self.xs[:, 1, :n] = np.arange(n)
+            self.ys[:, 1, :n] = -3
+            self.headings[:, 1, :n] = Heading.Left
+        for p in range(self.players):
+            for i in range(n):
+                self._grid_add(every, p, self.xs[:, p, i], self.ys[:, p, i])
+        self._scatter(every, 0, np.zeros(self.games, dtype=np.int64))
+        self.colored[:, 0] = 0
+
+    # ---- Randomness ----
+    def _pick_colors(self, games: np.ndarray) -> np.ndarray:
+        """A random color code for each of `games`."""
+        return self.rng.integers(0, len(COLORS), size=len(games)).astype(np.uint8)
+
+    def _pick_cells(self, games: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """A uniformly random free cell of the food region for each of `games`, as grid indexes.
+
+        A game without any free cell gets a random cell of the region, like `Simulation.random_cell()`. The scalar
+        engine may then stack two food items on one cell, which the batch cannot: the one place the engines differ.
+        """
+        x0, x1 = self.config.half_width - self.region_width, self.config.half_width + self.region_width + 1
+        y0, y1 = self.config.half_height - self.region_height, self.config.half_height + self.region_height + 1
+        rows: int = y1 - y0
+        free: np.ndarray = ~self.occupancy[games, :, x0:x1, y0:y1].any(axis=1) & (self.food_ids[games, x0:x1, y0:y1] < 0)
+        free = free.reshape(len(games), free.shape[1] * free.shape[2])
+        counts: np.ndarray = free.sum(axis=1)
+        draws: np.ndarray = self.rng.random(len(games))
+        picks: np.ndarray = np.argmax(np.cumsum(free, axis=1) > np.floor(draws * counts)[:, None], axis=1)
+        full: np.ndarray = counts == 0
+        picks[full] = np.floor(draws[full] * free.shape[1]).astype(np.int64)
+        return picks // rows + x0, picks % rows + y0
+
+    # ---- Grid ----
+    def _in_bounds(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return (np.abs(x) <= self.config.half_width) & (np.abs(y) <= self.config.half_height)
+
+    def _tracked(self, games: np.ndarray, p: int, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Positions in the flattened `occupancy` of the cells (x, y) of snake `p` that lie inside the arena. The grid
+        does not track the others."""
+        inside: np.ndarray = self._in_bounds(x, y)
+        return ((games[inside] * self.players + p) * self.width + x[inside] + self.config.half_width) * self.height + y[inside] + self.config.half_height
+
+    def _grid_add(self, games: np.ndarray, p: int, x: np.ndarray, y: np.ndarray) -> None:
+        """Add a segment of snake `p` on the cell (x, y) of each game. No game may appear twice in `games`."""
+        self.occupancy.reshape(-1)[self._tracked(games, p, x, y)] += 1
+
+    def _grid_remove(self, games: np.ndarray, p: int, x: np.ndarray, y: np.ndarray) -> None:
+        self.occupancy.reshape(-1)[self._tracked(games, p, x, y)] -= 1
+
+    def _count(self, games: np.ndarray, p: int, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Segments of snake `p` on the cells (x, y), 0 outside the arena."""
+        inside: np.ndarray = self._in_bounds(x, y)
+        counts: np.ndarray = np.zeros(len(games), dtype=self.occupancy.dtype)
+        counts[inside] = self.occupancy.reshape(-1)[self._tracked(games, p, x, y)]
+        return counts
+
+    def _wrap(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if not self.config.wall_teleport:
+            return x, y
+        w, h = self.config.half_width, self.config.half_height
+        return (x + w) % self.width - w, (y + h) % self.height - h
+
+    # ---- Snakes ----
+    def _slot(self, games: np.ndarray, p: int, index: np.ndarray) -> np.ndarray:
+        return (self.start[games, p] + index) & self.mask
+
+    def _flat(self, games: np.ndarray, p: int, slot: np.ndarray) -> np.ndarray:
+        """Positions of the ring slots in the flattened segment arrays, which index much faster than three index arrays."""
+        return (games * self.players + p) * self.capacity + slot
+
+    def _head(self, games: np.ndarray, p: int) -> tuple[np.ndarray, np.ndarray]:
+        at: np.ndarray = self._flat(games, p, self.start[games, p] & self.mask)
+        return self.xs.reshape(-1)[at], self.ys.reshape(-1)[at]
+
+    def _reserve(self, extra: int) -> None:
+        """Double the capacity until every snake can grow by `extra` segments, unrolling the rings to start at 0."""
+        if self.length.max(initial=0) + extra < self.capacity:
+            return
+        size: int = self.capacity
+        while self.length.max() + extra >= size:
+            size *= 2
+        order: np.ndarray = (self.start[..., None] + np.arange(self.capacity)) & self.mask
+        color_order: np.ndarray = (self.color_start[..., None] + np.arange(self.capacity)) & self.mask
+        for name, fill, rotation in (('xs', 0, order), ('ys', 0, order), ('headings', 0, order), ('colors', WHITE_CODE, color_order)):
+            old: np.ndarray = getattr(self, name)
+            grown: np.ndarray = np.full(old.shape[:2] + (size,), fill, dtype=old.dtype)
+            grown[..., :old.shape[2]] = np.take_along_axis(old, rotation, axis=2)
+            setattr(self, name, grown)
+        self.start[:] = 0
+        self.color_start[:] = 0
+
+    def _move(self, p: int, actions: np.ndarray | None) -> None:
+        every: np.ndarray = np.arange(self.games)
+        xs, ys, headings = self.xs.reshape(-1), self.ys.reshape(-1), self.headings.reshape(-1)
+        at: np.ndarray = self._flat(every, p, self.start[:, p] & self.mask)
+        heading: np.ndarray = headings[at]
+        if actions is not None and self.tick > 1:  # like `SnakeState.steer`, input only counts once the snake has moved.
+            turn: np.ndarray = actions[:, p].astype(np.int8)
+            valid: np.ndarray = (turn >= 0) & (turn != (heading + 2) % 4)
+            heading = np.where(valid, turn, heading).astype(np.int8)
+            headings[at] = heading
+        x, y = self._wrap(xs[at] + _DX[heading], ys[at] + _DY[heading])
+        self.start[:, p] = (self.start[:, p] - 1) & self.mask
+        at = self._flat(every, p, self.start[:, p])
+        xs[at], ys[at], headings[at] = x, y, heading
+        self._grid_add(every, p, x, y)
+        at = self._flat(every, p, (self.start[:, p] + self.length[:, p]) & self.mask)
+        self._grid_remove(every, p, xs[at], ys[at])
+
+    def _scatter(self, games: np.ndarray, p: int, start: np.ndarray) -> None:
+        """Turn the colored segments from `start` to the tail into food, tail first, like `Simulation._scatter`."""
+        count: np.ndarray = np.maximum(0, np.minimum(self.colored[games, p], self.length[games, p]) - start)
+        for r in range(int(count.max(initial=0))):
+            hit: np.ndarray = count > r
+            g: np.ndarray = games[hit]
+            index: np.ndarray = self.colored[g, p] - 1 - r
+            self._create_food(g, self.colors[g, p, (self.color_start[g, p] + index) & self.mask])
+
+    def _collision_reaction(self, games: np.ndarray, p: int, kind: CollisionKind, start: np.ndarray, kinds: np.ndarray) -> None:
+        if not len(games):
+            return
+        kinds[games, p] = kind.value
+        self._scatter(games, p, start)
+        # cut the snake at `start`, then uncolor it
+        index: np.ndarray = np.arange(self.capacity)
+        cut: np.ndarray = (index >= start[:, None]) & (index < self.length[games, p][:, None])
+        rows, cols = np.nonzero(cut)
+        slot: np.ndarray = (self.start[games[rows], p] + cols) & self.mask
+        cells: np.ndarray = self._tracked(games[rows], p, self.xs[games[rows], p, slot], self.ys[games[rows], p, slot])
+        np.subtract.at(self.occupancy.reshape(-1), cells, 1)  # a game loses many cells at once, which `-=` would count once.
+        self.length[games, p] = np.minimum(self.length[games, p], start)
+        self.colored[games, p] = 0
+        self._retreat(games, p)
+        self.score[games, p] = start if kind is CollisionKind.Self else self.score[games, p] // 4
+
+    def _retreat(self, games: np.ndarray, p: int, max_steps: int = 10) -> None:
+        """Undo moves until the head heading changes, the tail reaches a wall or `max_steps` is hit, like
+        `SnakeState.retreat`."""
+        heading: np.ndarray = self.headings[games, p, self.start[games, p] & self.mask]
+        active: np.ndarray = np.ones(len(games), dtype=bool)
+        for _ in range(max_steps):
+            g: np.ndarray = games[active]
+            if not len(g):
+                return
+            tail: np.ndarray = self._slot(g, p, self.length[g, p] - 1)
+            tail_heading: np.ndarray = self.headings[g, p, tail]
+            x, y = self._wrap(self.xs[g, p, tail] - _DX[tail_heading], self.ys[g, p, tail] - _DY[tail_heading])
+            inside: np.ndarray = self._in_bounds(x, y)  # a snake never backs out of the arena.
+            active[active] = inside
+            g, tail_heading, x, y = g[inside], tail_heading[inside], x[inside], y[inside]
+            if not len(g):
+                return
+            behind: np.ndarray = self._slot(g, p, self.length[g, p])
+            self.xs[g, p, behind], self.ys[g, p, behind], self.headings[g, p, behind] = x, y, tail_heading
+            self._grid_add(g, p, x, y)
+            head: np.ndarray = self.start[g, p] & self.mask
+            self._grid_remove(g, p, self.xs[g, p, head], self.ys[g, p, head])
+            self.start[g, p] = (self.start[g, p] + 1) & self.mask
+            active[active] = self.headings[g, p, self.start[g, p] & self.mask] == heading[active]
+
+    def _self_collisions(self, p: int, kinds: np.ndarray) -> None:
+        every: np.ndarray = np.arange(self.games)
+        x, y = self._head(every, p)
+        games: np.ndarray = np.nonzero(self._count(every, p, x, y) > 1)[0]
+        if not len(games):
+            return
+        index: np.ndarray = np.arange(self.capacity)
+        slots: np.ndarray = (self.start[games, p][:, None] + index) & self.mask
+        hit: np.ndarray = (self.xs[games[:, None], p, slots] == x[games, None]) & (self.ys[games[:, None], p, slots] == y[games, None])
+        hit &= (index >= 1) & (index < self.length[games, p][:, None])
+        start: np.ndarray = np.argmax(hit, axis=1)
+        self.last_collision_index[games, p] = start
+        self._collision_reaction(games, p, CollisionKind.Self, start, kinds)
+
+    def _wall_collisions(self, p: int, kinds: np.ndarray) -> None:
+        every: np.ndarray = np.arange(self.games)
+        games: np.ndarray = np.nonzero(~self._in_bounds(*self._head(every, p)))[0]
+        self._collision_reaction(games, p, CollisionKind.Wall, np.full(len(games), 4), kinds)
+
+    def _player_collisions(self, kinds: np.ndarray) -> None:
+        every: np.ndarray = np.arange(self.games)
+        second: np.ndarray = self._count(every, 0, *self._head(every, 1)) > 0
+        first: np.ndarray = ~second & (self._count(every, 1, *self._head(every, 0)) > 0)
+        for p, hit in ((1, second), (0, first)):
+            games: np.ndarray = np.nonzero(hit)[0]
+            self._collision_reaction(games, p, CollisionKind.Player, np.full(len(games), 4), kinds)
+
+    # ---- Food ----
+    def _reach(self, games: np.ndarray, gx: np.ndarray, gy: np.ndarray, add: bool) -> None:
+        """Count the food on (gx, gy) of each game in `food_in_reach` around it, or stop counting it."""
+        for dx, dy in self.near:
+            x, y = gx - dx, gy - dy
+            inside: np.ndarray = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+            if add:
+                self.food_in_reach[games[inside], x[inside], y[inside]] += 1
+            else:
+                self.food_in_reach[games[inside], x[inside], y[inside]] -= 1
+
+    def _create_food(self, games: np.ndarray, colors: np.ndarray) -> None:
+        gx, gy = self._pick_cells(games)
+        self.food_ids[games, gx, gy] = self.next_food_id[games]
+        self.food_colors[games, gx, gy] = colors
+        self._reach(games, gx, gy, True)
+        self.next_food_id[games] += 1
+        self.food_count[games] += 1
+
+    def _nearest_food(self, games: np.ndarray, p: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Which of `games` have snake `p` touching uneaten food, and for each of those the cell of the touched food with
+        the lowest id, which `Simulation.food_touchers` would hand out first."""
+        hx, hy = self._head(games, p)
+        # clipping keeps the lookup on the grid; a cell clipped onto the edge is one the head reaches anyway.
+        gx: np.ndarray = np.clip(hx[:, None] + self._near_x, 0, self.width - 1)
+        gy: np.ndarray = np.clip(hy[:, None] + self._near_y, 0, self.height - 1)
+        cells: np.ndarray = (games[:, None] * self.width + gx) * self.height + gy
+        ids: np.ndarray = self.food_ids.reshape(-1)[cells]
+        ids[(ids < 0) | self._eaten_grid.reshape(-1)[cells]] = np.iinfo(np.int64).max
+        best: np.ndarray = np.argmin(ids, axis=1)
+        index: np.ndarray = np.nonzero(ids[np.arange(len(games)), best] != np.iinfo(np.int64).max)[0]
+        return games[index], gx[index, best[index]], gy[index, best[index]]
+
+    def _eat(self, games: np.ndarray, p: int, colors: np.ndarray) -> None:
+        """`SnakeState.eat`: score, then grow a fully colored snake or shift its colors one segment towards the tail."""
+        self.score[games, p] += 1
+        full: np.ndarray = self.colored[games, p] == self.length[games, p]
+        g: np.ndarray = games[full]
+        tail: np.ndarray = self._slot(g, p, self.length[g, p] - 1)
+        behind: np.ndarray = self._slot(g, p, self.length[g, p])
+        self.xs[g, p, behind], self.ys[g, p, behind], self.headings[g, p, behind] = self.xs[g, p, tail], self.ys[g, p, tail], self.headings[g, p, tail]
+        self._grid_add(g, p, self.xs[g, p, tail], self.ys[g, p, tail])
+        self.length[g, p] += 1
+        self.colors[g, p, (self.color_start[g, p] + self.colored[g, p]) & self.mask] = colors[full]
+        g = games[~full]
+        self.color_start[g, p] = (self.color_start[g, p] - 1) & self.mask
+        self.colors[g, p, self.color_start[g, p]] = colors[~full]
+        self.colored[games, p] += 1
+
+    def _food_collisions(self) -> None:
+        for p in range(self.players):
+            hx, hy = self._head(np.arange(self.games), p)
+            games: np.ndarray = np.nonzero(self.food_in_reach[np.arange(self.games), np.clip(hx + self.config.half_width, 0, self.width - 1),
+                                                             np.clip(hy + self.config.half_height, 0, self.height - 1)])[0]
+            while True:  # a snake may touch several items; only games that just ate can have another one.
+                games, gx, gy = self._nearest_food(games, p)
+                if not len(games):
+                    break
+                self._eat(games, p, self.food_colors[games, gx, gy])
+                fid: np.ndarray = self.food_ids[games, gx, gy]
+                refresh: np.ndarray = self.food_count[games] <= self.config.food_abundance
+                g: np.ndarray = games[refresh]
+                nx, ny = self._pick_cells(g)  # picked while the old cell is still taken, like `Simulation.refresh_food`.
+                self.food_ids[g, nx, ny] = fid[refresh]
+                self.food_colors[g, nx, ny] = self._pick_colors(g)
+                self._reach(g, nx, ny, True)
+                self._eaten_grid[g, nx, ny] = True
+                self._eaten.append((g, nx, ny))
+                self.food_ids[games, gx, gy] = -1
+                self._reach(games, gx, gy, False)
+                self.food_count[games[~refresh]] -= 1
+        for g, x, y in self._eaten:
+            self._eaten_grid[g, x, y] = False
+        self._eaten.clear()
+
+    # ---- Tick ----
+    def step(self, actions: np.ndarray | None = None) -> np.ndarray:
+        """Advance every game by one tick.
+
+        `actions` holds a `Heading` value per game and player, or `NO_ACTION`. Returns the `CollisionKind` value of the
+        last collision of each snake during the tick, or `NO_COLLISION`.
+        """
+        self._reserve(2 * (2 * self.reach + 1) ** 2 + 2)
+        self.tick += 1
+        kinds: np.ndarray = np.full((self.games, self.players), NO_COLLISION, dtype=np.int8)
+        for p in range(self.players):
+            self._move(p, actions)
+        for p in range(self.players):
+            self._self_collisions(p, kinds)
+        if not self.config.wall_teleport:
+            for p in range(self.players):
+                self._wall_collisions(p, kinds)
+        if self.players == 2:
+            self._player_collisions(kinds)
+        self._food_collisions()
+        return kinds
+
+    # ---- Inspection ----
+    def body(self, game: int, snake: int = 0) -> list[Cell]:
+        slots: np.ndarray = (self.start[game, snake] + np.arange(self.length[game, snake])) & self.mask
+        return list(zip(self.xs[game, snake, slots].tolist(), self.ys[game, snake, slots].tolist()))
+
+    def snake_colors(self, game: int, snake: int = 0) -> list[str]:
+        slots: np.ndarray = (self.color_start[game, snake] + np.arange(self.colored[game, snake])) & self.mask
+        return [color_name(code) for code in self.colors[game, snake, slots].tolist()] + [color_name(WHITE_CODE)] * int(self.length[game, snake] - self.colored[game, snake])
+
+    def food(self, game: int) -> dict[int, tuple[Cell, str]]:
+        """Food id -> (cell, color) of one game, like `Simulation.food`."""
+        gx, gy = np.nonzero(self.food_ids[game] >= 0)
+        return {int(self.food_ids[game, x, y]): ((int(x) - self.config.half_width, int(y) - self.config.half_height), color_name(int(self.food_colors[game, x, y])))
+                for x, y in zip(gx, gy)}
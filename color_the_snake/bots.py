@@ -0,0 +1,189 @@
+"""Computer players that steer a snake of a `Simulation`."""
+import importlib
+import random
+import time
+from collections import deque
+from .engine import EAT_RADIUS, CELL_SIZE, Heading, Simulation, SnakeState
+from .grid import Cell, DistanceField
+
+
+class Bot:
+    """Steers snake `snake` of the simulations it is shown. The base bot never turns."""
+    name: str = 'straight'
+
+    def __init__(self, seed: int = 0) -> None:
+        self.rng: random.Random = random.Random(seed)
+
+    def decide(self, sim: Simulation, snake: int) -> Heading | None:
+        """The heading to steer snake `snake` to before the next tick, or None to keep going straight."""
+        return None
+
+
+BOTS: dict[str, type[Bot]] = {}
+
+
+def register(cls: type[Bot]) -> type[Bot]:
+    """Class decorator that makes a bot available under its `name`."""
+    BOTS[cls.name] = cls
+    return cls
+register(Bot)
+
+
+def load_bot(spec: str, seed: int = 0) -> Bot:
+    """A new bot from a registered name or a 'package.module:Class' path."""
+    if spec in BOTS:
+        return BOTS[spec](seed)
+    module, sep, attr = spec.partition(':')
+    if not sep:
+        raise KeyError(f'unknown bot {spec!r}; registered bots: {", ".join(sorted(BOTS))}')
+    cls: type[Bot] = getattr(importlib.import_module(module), attr)
+    return cls(seed)
+
+
+def next_cell(sim: Simulation, cell: Cell, heading: Heading) -> Cell:
+    dx, dy = heading.delta
+    nxt: Cell = cell[0] + dx, cell[1] + dy
+    return sim.wrap(nxt) if sim.config.wall_teleport else nxt
+
+
+def is_safe(sim: Simulation, snake: int, heading: Heading) -> bool:
+    """Whether moving one cell towards `heading` keeps clear of walls and bodies. The tail moves away, so it is safe."""
+    state: SnakeState = sim.snakes[snake]
+    cell: Cell = next_cell(sim, state.head, heading)
+    if not sim.in_bounds(cell):
+        return False
+    taken: int = sim.grid.count(cell)
+    return not taken or (taken == 1 and cell == state.body[-1])
+
+
+def turns(sim: Simulation, snake: int) -> list[Heading]:
+    """The headings a snake may take this tick: every heading but the one straight back."""
+    back: Heading = sim.snakes[snake].heading.opposite
+    return [h for h in Heading if h != back]
+
+
+@register
+class RandomBot(Bot):
+    """Turns at random now and then, without looking where it goes."""
+    name: str = 'random'
+    turn_chance: float = 0.2
+
+    def decide(self, sim: Simulation, snake: int) -> Heading | None:
+        if self.rng.random() < self.turn_chance:
+            return self.rng.choice(turns(sim, snake))
+        return None
+
+
+@register
+class CautiousBot(Bot):
+    """Goes straight until that would crash, then takes a random safe turn."""
+    name: str = 'cautious'
+
+    def decide(self, sim: Simulation, snake: int) -> Heading | None:
+        if is_safe(sim, snake, sim.snakes[snake].heading):
+            return None
+        safe: list[Heading] = [h for h in turns(sim, snake) if is_safe(sim, snake, h)]
+        return self.rng.choice(safe) if safe else None
+
+
+@register
+class GreedyBot(Bot):
+    """Takes the safe heading that brings its head closest to the nearest food, ties broken at random."""
+    name: str = 'greedy'
+
+    def distance(self, sim: Simulation, a: Cell, b: Cell) -> int:
+        dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+        if sim.config.wall_teleport:  # the way around through the opposite wall may be shorter.
+            dx, dy = min(dx, sim.grid.width - dx), min(dy, sim.grid.height - dy)
+        return dx + dy
+
+    def decide(self, sim: Simulation, snake: int) -> Heading | None:
+        head: Cell = sim.snakes[snake].head
+        targets: list[Cell] = [cell for cell, _ in sim.food.values()]
+        best: list[tuple[int, float, Heading]] = []
+        for heading in turns(sim, snake):
+            if not is_safe(sim, snake, heading):
+                continue
+            cell: Cell = next_cell(sim, head, heading)
+            best.append((min((self.distance(sim, cell, t) for t in targets), default=0), self.rng.random(), heading))
+        return min(best)[2] if best else None
+
+
+@register
+class PathfindingBot(Bot):
+    """Follows the shortest path around all snake bodies to the nearest cell from which it eats.
+
+    The path lengths come from a `DistanceField` that each tick is only told which cells the snakes filled or emptied
+    and which food changed, so a decision costs about as much as the tick changed rather than a search of the whole
+    arena. The bot follows the simulation it was last shown from tick to tick and rebuilds its field for any other.
+    How long each of the last decisions took is kept in `decision_ns`.
+    """
+    name: str = 'pathfinder'
+
+    def __init__(self, seed: int = 0) -> None:
+        super().__init__(seed)
+        self.sim: Simulation | None = None
+        self.tick: int = -1
+        self.field: DistanceField | None = None
+        self.food: dict[int, Cell] = {}  # the food cells the field's targets were made from.
+        self.decision_ns: deque[int] = deque(maxlen=120)
+
+    @property
+    def decision_ms(self) -> float:
+        """Average time of the recent decisions in milliseconds."""
+        return sum(self.decision_ns) / len(self.decision_ns) / 1e6 if self.decision_ns else 0.0
+
+    def aim(self, cell: Cell, count: int) -> None:
+        """Add `count` targets on the cells within eating reach of a food item on `cell`."""
+        reach: int = EAT_RADIUS // CELL_SIZE
+        for x in range(cell[0] - reach, cell[0] + reach + 1):
+            for y in range(cell[1] - reach, cell[1] + reach + 1):
+                if self.field.in_bounds((x, y)):
+                    self.field.add_target(self.field.index((x, y)), count)
+
+    def rebuild(self, sim: Simulation) -> None:
+        config = sim.config
+        self.field = DistanceField(config.half_width, config.half_height, wrap=config.wall_teleport)
+        for i, count in enumerate(sim.grid.counts):
+            self.field.blocked[i] = count > 0
+        self.food = {fid: cell for fid, (cell, _) in sim.food.items()}
+        for cell in self.food.values():
+            self.aim(cell, 1)
+        self.field.rebuild()
+
+    def follow(self, sim: Simulation) -> None:
+        """Bring the field up to date with the one tick the simulation made since the last decision."""
+        for i in sim.grid.flipped:
+            self.field.set_blocked(i, sim.grid.counts[i] > 0)
+        for fid in sim.changed_food:
+            if (old := self.food.pop(fid, None)) is not None:
+                self.aim(old, -1)
+            if fid in sim.food:
+                self.food[fid] = sim.food[fid][0]
+                self.aim(self.food[fid], 1)
+        self.field.commit()
+
+    def decide(self, sim: Simulation, snake: int) -> Heading | None:
+        start: int = time.perf_counter_ns()
+        if sim is self.sim and sim.tick == self.tick + 1:
+            self.follow(sim)
+        elif sim is not self.sim or sim.tick != self.tick:
+            self.rebuild(sim)
+        self.sim, self.tick = sim, sim.tick
+        heading: Heading = sim.snakes[snake].heading
+        options: list[tuple[int, bool, int, Heading]] = []
+        for h in turns(sim, snake):
+            if is_safe(sim, snake, h):
+                i: int = self.field.index(next_cell(sim, sim.snakes[snake].head, h))
+                exits: int = sum(not self.field.blocked[j] for j in self.field.neighbors[i])
+                options.append((self.field.dist[i], h != heading, -exits, h))
+        choice: Heading | None = min(options)[3] if options else None
+        self.decision_ns.append(time.perf_counter_ns() - start)
+        return choice
+
+
+def steer_all(sim: Simulation, bots: list[Bot | None]) -> None:
+    """Let every bot steer its snake for the coming tick. A None entry leaves that snake to someone else."""
+    for idx, bot in enumerate(bots):
+        if bot is not None and (heading := bot.decide(sim, idx)) is not None:
+            sim.snakes[idx].steer(heading)
@@ -0,0 +1,305 @@
+"""Batched drawing straight onto the Tk canvas underneath the turtle screen, through a camera for large worlds."""
+import math
+from typing import Any, Callable
+
+
+class Batch:
+    """Collects the drawables changed since the last frame and draws them with `flush`.
+
+    Released items are kept in a free list per shape and handed to the next drawable of that shape, so growing and
+    cutting snakes recycles canvas items instead of creating new ones. A free list keeps at most `keep` items; any item
+    released beyond that is deleted from the canvas, so a burst of releases does not leave the canvas holding hidden
+    items for good.
+
+    Sprites are filed by the square `tile` of the world they are in, so moving the camera only visits the sprites in
+    the tiles around the view before and after the move, however large the world is.
+    """
+    def __init__(self, canvas: Any, tile: float = 200, keep: int = 1024) -> None:
+        self.canvas: Any = canvas
+        self.dirty: dict['Drawable', None] = {}  # insertion ordered, so new items stack like turtles did.
+        self.free: dict[str, list[int]] = {}
+        self.keep: int = keep  # enough to fill a 640x640 view with squares.
+        self.deleted: int = 0  # items deleted because their free list was full.
+        self.flushed: int = 0  # canvas updates sent by the last flush.
+        self.camera: tuple[float, float] = (0.0, 0.0)  # the world position drawn in the middle of the canvas.
+        self.view: tuple[float, float] | None = None  # half the width and height of the world shown, or None to draw it all.
+        self.tile: float = tile
+        self.tiles: dict[tuple[int, int], set['Sprite']] = {}
+        self.spanning: list['Drawable'] = []  # world drawables too large for a tile, redrawn after every camera move.
+
+    def mark(self, drawable: 'Drawable') -> None:
+        self.dirty[drawable] = None
+
+    def look_at(self, x: float, y: float, half_width: float, half_height: float) -> None:
+        """Center the view on (x, y) of the world, showing `half_width` and `half_height` to each side."""
+        if (x, y) == self.camera and (half_width, half_height) == self.view:
+            return
+        before: set[tuple[int, int]] = self.tiles_in_view() if self.view else set(self.tiles)
+        self.camera, self.view = (x, y), (half_width, half_height)
+        for key in before | self.tiles_in_view():
+            for sprite in self.tiles.get(key, ()):
+                self.mark(sprite)
+        for drawable in self.spanning:
+            self.mark(drawable)
+
+    def tiles_in_view(self) -> set[tuple[int, int]]:
+        """The tiles the view overlaps, and the ring around them that holds sprites sticking out of their tile."""
+        (x, y), (half_width, half_height) = self.camera, self.view
+        return {(i, j) for i in range(math.floor((x - half_width) / self.tile) - 1, math.floor((x + half_width) / self.tile) + 2)
+                for j in range(math.floor((y - half_height) / self.tile) - 1, math.floor((y + half_height) / self.tile) + 2)}
+
+    def in_view(self, x: float, y: float, size: float) -> bool:
+        """Whether a `size` pixels wide square centered on (x, y) of the world is at least partly in the view."""
+        if self.view is None:
+            return True
+        return abs(x - self.camera[0]) - size / 2 < self.view[0] and abs(y - self.camera[1]) - size / 2 < self.view[1]
+
+    def file(self, sprite: 'Sprite', key: tuple[int, int] | None) -> None:
+        """Move `sprite` from the tile it is filed under to the tile `key`, or to none."""
+        if sprite.tile is not None:
+            self.tiles[sprite.tile].discard(sprite)
+        if key is not None:
+            self.tiles.setdefault(key, set()).add(sprite)
+        sprite.tile = key
+
+    def flush(self) -> None:
+        self.flushed = 0
+        for drawable in self.dirty:
+            self.flushed += drawable.draw(self.canvas)
+        self.dirty.clear()
+
+    def take(self, shape: str) -> int | None:
+        """A released canvas item of `shape`, if there is one."""
+        return self.free[shape].pop() if self.free.get(shape) else None
+
+    def give_back(self, shape: str, item: int) -> None:
+        if len(free := self.free.setdefault(shape, [])) < self.keep:
+            free.append(item)
+        else:
+            self.canvas.delete(item)
+            self.deleted += 1
+
+
+class Drawable:
+    """Something on the canvas whose changes are drawn by its batch on the next flush. Positions are turtle
+    coordinates: the origin in the middle and y pointing up."""
+    __slots__ = 'batch', 'item', 'visible'
+
+    def __init__(self, batch: Batch) -> None:
+        self.batch: Batch = batch
+        self.item: int | None = None
+        self.visible: bool = True
+        batch.mark(self)
+
+    def changed(self) -> None:
+        self.batch.mark(self)
+
+    def hide(self) -> None:
+        if self.visible:
+            self.visible = False
+            self.changed()
+
+    def show(self) -> None:
+        if not self.visible:
+            self.visible = True
+            self.changed()
+
+    def draw(self, canvas: Any) -> int:
+        """Bring the canvas item up to date and return how many canvas calls that took."""
+        raise NotImplementedError
+
+
+class Sprite(Drawable):
+    """A filled square or circle of `size` pixels centered on (x, y) of the world."""
+    __slots__ = 'x', 'y', 'fill', 'size', 'shape', 'released', 'drawn', 'tile'
+    CREATE: dict[str, str] = {'square': 'create_rectangle', 'circle': 'create_oval'}
+
+    def __init__(self, batch: Batch, x: float, y: float, fill: str, size: float = 20, shape: str = 'square') -> None:
+        self.x: float = x
+        self.y: float = y
+        self.fill: str = fill
+        self.size: float = size
+        self.shape: str = shape
+        self.released: bool = False
+        self.drawn: tuple | None = None  # (x, y, size, fill, visible) on screen as last sent to the canvas.
+        self.tile: tuple[int, int] | None = None
+        super().__init__(batch)
+        batch.file(self, (int(x // batch.tile), int(y // batch.tile)))
+
+    def goto(self, x: float, y: float) -> None:
+        if x != self.x or y != self.y:
+            self.x, self.y = x, y
+            self.changed()
+            if (key := (int(x // self.batch.tile), int(y // self.batch.tile))) != self.tile:
+                self.batch.file(self, key)
+
+    def paint(self, fill: str) -> None:
+        if fill != self.fill:
+            self.fill = fill
+            self.changed()
+
+    def resize(self, size: float) -> None:
+        if size != self.size:
+            self.size = size
+            self.changed()
+
+    def release(self) -> None:
+        """Hide the sprite and let its canvas item be reused by another sprite, until the sprite is revived."""
+        self.hide()
+        self.released = True
+        self.changed()
+        self.batch.file(self, None)
+
+    def revive(self, x: float, y: float, fill: str, size: float) -> None:
+        """Bring a released sprite back as if it were made anew: shown at (x, y) with `fill` and `size`, on top."""
+        if self.item is not None:  # released since the last flush: its item goes back now and is taken again like a new one.
+            self.drop(self.batch.canvas)
+        self.x, self.y, self.fill, self.size = x, y, fill, size
+        self.released, self.visible = False, True
+        self.batch.dirty.pop(self, None)
+        self.changed()
+        self.batch.file(self, (int(x // self.batch.tile), int(y // self.batch.tile)))
+
+    def drop(self, canvas: Any) -> int:
+        """Hide the canvas item and give it back to the batch. Returns how many canvas calls that took."""
+        calls: int = 0
+        if self.drawn[4]:
+            canvas.itemconfigure(self.item, state='hidden')
+            calls += 1
+        self.batch.give_back(self.shape, self.item)
+        self.item, self.drawn = None, None
+        return calls
+
+    def bbox(self) -> tuple[float, float, float, float]:
+        """Canvas coordinates of the sprite's corners, as the camera shows it."""
+        half: float = self.size / 2
+        x, y = self.x - self.batch.camera[0], self.y - self.batch.camera[1]
+        return x - half, -y - half, x + half, -y + half
+
+    def draw(self, canvas: Any) -> int:
+        state: tuple = (self.x - self.batch.camera[0], self.y - self.batch.camera[1], self.size, self.fill, self.visible)
+        if self.released or not self.batch.in_view(self.x, self.y, self.size):  # out of sight, it owns no canvas item.
+            return self.drop(canvas) if self.item is not None else 0
+        if state == self.drawn:  # the frame ends it the way it was last drawn: nothing to send.
+            return 0
+        if self.item is None:
+            self.item = self.batch.take(self.shape)
+            if self.item is None:
+                self.item = getattr(canvas, self.CREATE[self.shape])(*self.bbox(), fill=self.fill, outline='', state='normal' if self.visible else 'hidden')
+                self.drawn = state
+                return 1
+            canvas.tag_raise(self.item)
+            self.drawn = (None, None, None, None, False)
+        calls: int = 0
+        if state[:3] != self.drawn[:3]:
+            canvas.coords(self.item, *self.bbox())
+            calls += 1
+        options: dict[str, str] = {}
+        if self.fill != self.drawn[3]:
+            options['fill'] = self.fill
+        if self.visible != self.drawn[4]:
+            options['state'] = 'normal' if self.visible else 'hidden'
+        if options:
+            canvas.itemconfigure(self.item, **options)
+            calls += 1
+        self.drawn = state
+        return calls
+
+
+class Pool:
+    """Released sprites of one kind, kept to be revived instead of making new ones as snakes grow and food appears.
+
+    Sprites are revived in the reverse order they were put in, so the one released last, and likeliest to still hold its
+    canvas item, comes back first. The pool keeps at most `limit` sprites; a sprite put in a full pool is left to the
+    garbage collector, and its canvas item to the batch's free list.
+    """
+    def __init__(self, make: Callable[[float, float, str], Sprite], size: float, limit: int = 256) -> None:
+        self.make: Callable[[float, float, str], Sprite] = make
+        self.size: float = size  # every sprite comes out of the pool this size, whatever size it went in.
+        self.limit: int = limit
+        self.free: list[Sprite] = []
+        self.made: int = 0  # sprites made because the pool was empty.
+        self.dropped: int = 0  # sprites left out because the pool was full.
+
+    def get(self, x: float, y: float, fill: str) -> Sprite:
+        """A sprite at (x, y) of the world painted `fill`: a revived one if the pool has one, else a new one."""
+        if self.free:
+            sprite: Sprite = self.free.pop()
+            sprite.revive(x, y, fill, self.size)
+            return sprite
+        self.made += 1
+        return self.make(x, y, fill)
+
+    def put(self, sprite: Sprite) -> None:
+        """Release `sprite` and keep it for `get`, if the pool has room."""
+        sprite.release()
+        if len(self.free) < self.limit:
+            self.free.append(sprite)
+        else:
+            self.dropped += 1
+
+
+class Outline(Drawable):
+    """The outline of the rectangle of the world from (left, bottom) to (right, top), such as the walls of an arena."""
+    __slots__ = 'corners', 'color', 'width', 'drawn'
+
+    def __init__(self, batch: Batch, left: float, bottom: float, right: float, top: float, color: str = 'gray30', width: float = 2) -> None:
+        self.corners: tuple[float, float, float, float] = (left, bottom, right, top)
+        self.color: str = color
+        self.width: float = width
+        self.drawn: tuple | None = None  # (camera, visible) as last sent to the canvas.
+        super().__init__(batch)
+        batch.spanning.append(self)
+
+    def draw(self, canvas: Any) -> int:
+        state: tuple = (self.batch.camera, self.visible)
+        if state == self.drawn:
+            return 0
+        (x, y), (left, bottom, right, top) = self.batch.camera, self.corners
+        corners: tuple[float, float, float, float] = (left - x, y - top, right - x, y - bottom)
+        if self.item is None:
+            self.item = canvas.create_rectangle(*corners, outline=self.color, width=self.width, fill='')
+        else:
+            canvas.coords(self.item, *corners)
+        canvas.itemconfigure(self.item, state='normal' if self.visible else 'hidden')
+        self.drawn = state
+        return 2
+
+
+class Label(Drawable):
+    """Text at (x, y) of the screen. The point is where `anchor` says on the text: by default the middle of its bottom
+    edge, like a turtle writing with `align='center'`."""
+    __slots__ = 'x', 'y', 'text', 'fill', 'font', 'anchor', 'drawn'
+
+    def __init__(self, batch: Batch, x: float, y: float, text: str = '', fill: str = 'white', font: tuple = ('System', 24, 'normal'), anchor: str = 's') -> None:
+        self.x: float = x
+        self.y: float = y
+        self.text: str = text
+        self.fill: str = fill
+        self.font: tuple = font
+        self.anchor: str = anchor
+        self.drawn: tuple | None = None  # (x, y, text, visible) as last sent to the canvas.
+        super().__init__(batch)
+
+    def write(self, text: str, x: float = None, y: float = None) -> None:
+        self.text = text
+        if x is not None: self.x = x
+        if y is not None: self.y = y
+        self.changed()
+
+    def draw(self, canvas: Any) -> int:
+        state: tuple = (self.x, self.y, self.text, self.visible)
+        if state == self.drawn:
+            return 0
+        if self.item is None:
+            self.item = canvas.create_text(self.x, -self.y, text=self.text, anchor=self.anchor, fill=self.fill, font=self.font)
+            self.drawn = (self.x, self.y, self.text, True)
+        calls: int = 0
+        if state[:2] != self.drawn[:2]:
+            canvas.coords(self.item, self.x, -self.y)
+            calls += 1
+        if state[2:] != self.drawn[2:]:
+            canvas.itemconfigure(self.item, text=self.text, state='normal' if self.visible else 'hidden')
+            calls += 1
+        self.drawn = state
+        return calls or 1
@@ -0,0 +1,433 @@
+"""Headless simulation core for Color the Snake!: the game state on a grid of cells, and its rules, without Tk."""
+import random
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from itertools import islice
+from typing import Callable
+from .grid import Cell, FoodIndex, FreeCells, OccupancyGrid
+from .profiler import Profiler
+from .storage import COLORS, WHITE, ColorRow, FoodTable, SegmentRing
+
+
+CELL_SIZE: int = 20  # pixels between two neighbouring cells; the distance a snake moves per tick.
+EAT_RADIUS: int = 30  # a snake eats food whose distance to its head is less than this many pixels.
+FOOD_MARGIN: int = 50  # pixels kept free of food along the edges of the arena.
+
+
+class Heading(IntEnum):
+    """Direction of travel. The value times 90 is the turtle heading in degrees."""
+    Right = 0
+    Up = 1
+    Left = 2
+    Down = 3
+
+    @property
+    def degrees(self) -> int:
+        return self.value * 90
+
+    @property
+    def delta(self) -> Cell:
+        return _DELTAS[self.value]
+
+    @property
+    def opposite(self) -> 'Heading':
+        return Heading((self.value + 2) % 4)
+_DELTAS: tuple[Cell, ...] = (1, 0), (0, 1), (-1, 0), (0, -1)
+_HEADINGS: tuple[Heading, ...] = tuple(Heading)
+
+
+class CollisionKind(Enum):
+    Self = 0
+    Wall = 1
+    Player = 2
+
+
+@dataclass(frozen=True)
+class GameConfig:
+    """Rules of one game. The arena spans the cells -half_width..half_width by -half_height..half_height."""
+    players: int = 1  # up to two per lane of `Simulation._spawn_snake`: 32 in the default arena.
+    length: int = 8
+    food_abundance: int = 2
+    wall_teleport: bool = True
+    half_width: int = 16
+    half_height: int = 16
+
+
+@dataclass
+class Scatter:
+    """The colored segments of a snake were turned into food: `scattered` holds (segment index, food id, food cell)."""
+    snake: int
+    body: list[Cell]
+    colors: list[str]
+    scattered: list[tuple[int, int, Cell]]
+
+
+@dataclass
+class Collision(Scatter):
+    """A snake crashed: segments from `start` on were scattered and cut, and the snake backed into the `retreat` cells."""
+    kind: CollisionKind = CollisionKind.Self
+    start: int = 0
+    retreat: list[Cell] = field(default_factory=list)
+
+
+class SnakeState:
+    """Pure-data snake. Index 0 of `body` and `colors` is the head.
+
+    The body is a `SegmentRing` holding each segment's cell and heading, so a move only adds the new head cell and drops
+    the tail cell, whatever the length of the snake. Colors always form a colored run from the head followed by white
+    segments; `colored` counts it. Every change to the body is mirrored into the shared `grid` under the snake's `index`.
+    """
+    def __init__(self, body: list[Cell], heading: Heading, colors: list[str], grid: OccupancyGrid, index: int = 0) -> None:
+        self.grid: OccupancyGrid = grid
+        self.index: int = index
+        self.body: SegmentRing = SegmentRing(body, heading)
+        for cell in body:
+            grid.add(cell, index)
+        self.colors: ColorRow = ColorRow(colors)
+        self.colored: int = sum(c != WHITE for c in colors)
+        self.score: int = 0
+        self.on_score_changed: Callable = lambda: None
+        self.last_collision_index: int = 0
+        self.input_enabled: bool = False
+
+    def __len__(self) -> int:
+        return len(self.body)
+
+    @property
+    def head(self) -> Cell:
+        return self.body[0]
+
+    @property
+    def heading(self) -> Heading:
+        return _HEADINGS[self.body.heading(0)]
+
+    @property
+    def is_fully_colored(self) -> bool:
+        return self.colored == len(self)
+
+    def steer(self, heading: Heading) -> None:
+        """Only the first key press of a tick counts, and a snake can never turn straight back onto itself."""
+        if not self.input_enabled:
+            return
+        self.input_enabled = False
+        if heading != self.heading.opposite:
+            self.body.set_heading(0, heading)
+
+    def move(self, head: Cell) -> Cell:
+        """Put a new head at `head` (normally one cell in front of the old one) and drop the tail. Returns the old tail."""
+        self.input_enabled = True
+        self.body.appendleft(head, self.body.heading(0))
+        self.grid.add(head, self.index)
+        tail: Cell = self.body.pop()
+        self.grid.remove(tail, self.index)
+        return tail
+
+    def retreat(self, wrap: Callable[[Cell], Cell] = lambda c: c, max_steps: int = 10) -> list[Cell]:
+        """Undo moves until the head reaches a corner, the tail a wall, or `max_steps` is hit. Returns the cells added
+        behind the tail."""
+        heading: Heading = self.heading
+        added: list[Cell] = []
+        for _ in range(max_steps):
+            (x, y), tail_heading = self.body[-1], self.body.heading(-1)
+            dx, dy = _DELTAS[tail_heading]
+            if not self.grid.in_bounds(cell := wrap((x - dx, y - dy))):  # a snake backed out of the arena would never get back.
+                break
+            added.append(cell)
+            self.body.append(added[-1], tail_heading)
+            self.grid.add(added[-1], self.index)
+            self.grid.remove(self.body.popleft(), self.index)
+            if self.heading != heading:
+                break
+        return added
+
+    def is_self_collision(self) -> bool:
+        return self.grid.count(self.head, self.index) > 1
+
+    def self_collision_index(self) -> int | None:
+        """Index of the segment that the head ran into, if any. Walks the body, so check `is_self_collision` first."""
+        head: Cell = self.head
+        for idx, cell in enumerate(islice(self.body, 1, None), start=1):
+            if cell == head:
+                return idx
+        return None
+
+    def extend(self, color: str = WHITE) -> None:
+        self.grid.add(self.body[-1], self.index)
+        self.body.append(self.body[-1], self.body.heading(-1))
+        self.colors.append(color)
+        self.colored += color != WHITE
+
+    def eat(self, color: str) -> None:
+        self.increment_score()
+        if self.is_fully_colored:  # if the snake is already fully colored then extends it.
+            self.extend(color)
+            return
+        # elif the snake is still not fully colored then shift the colors towards the tail and color the head.
+        self.colors.insert_front(color)
+        self.colors.pop()
+        self.colored += 1
+
+    def uncolor(self) -> None:
+        self.colors.whiten(self.colored)
+        self.colored = 0
+
+    def cut(self, start: int) -> None:
+        for _ in range(len(self) - start):
+            self.grid.remove(self.body.pop(), self.index)
+        self.colors.truncate(start)
+        self.colored = min(self.colored, start)
+
+    def increment_score(self, negative: bool = False) -> None:
+        self.score += (-1 if self.score != 0 else 0) if negative else 1
+        self.on_score_changed()
+
+    def set_score(self, n: int) -> None:
+        self.score = n
+        self.on_score_changed()
+
+
+class Change:
+    """How a sequence an observer has seen, the body or the colors of a snake, became the one the snake has now: `front`
+    new items, then `keep` of the old items from `skip` on, then `back` new items. It only counts, so an edit costs the
+    same at any length; the new items are read from the snake."""
+    __slots__ = 'front', 'skip', 'keep', 'back'
+
+    def __init__(self, length: int) -> None:
+        self.front: int = 0
+        self.skip: int = 0
+        self.keep: int = length
+        self.back: int = 0
+
+    def __len__(self) -> int:
+        return self.front + self.keep + self.back
+
+    def pop_back(self, n: int) -> None:
+        taken: int = min(n, self.back)
+        self.back -= taken
+        taken, n = min(n - taken, self.keep), n - taken
+        self.keep -= taken
+        self.front -= n - taken
+
+    def pop_front(self, n: int) -> None:
+        taken: int = min(n, self.front)
+        self.front -= taken
+        taken, n = min(n - taken, self.keep), n - taken
+        self.keep -= taken
+        self.skip += taken
+        self.back -= n - taken
+
+    def renew(self, n: int) -> None:
+        """The first `n` items were replaced."""
+        n = min(n, len(self))
+        taken: int = min(max(n - self.front, 0), self.keep)
+        self.front += taken
+        self.skip += taken
+        self.keep -= taken
+        if n > self.front:  # on into the new items at the back.
+            self.back -= n - self.front
+            self.front = n
+
+
+def mark(snake: SnakeState) -> tuple[int, int, int, int]:
+    """What `changes` needs to remember of a snake as an observer saw it."""
+    return len(snake.body), len(snake.colors), snake.colors.shifts, snake.colored
+
+
+def changes(snake: SnakeState, seen: tuple[int, int, int, int] | None, collisions: list[Collision]) -> tuple[Change, Change]:
+    """How the body and the colors of `snake` changed since its `mark` was `seen`, one step ago, given the collisions
+    that step returned; with None for `seen`, all of them is new. This only plays back what the step reports, the move,
+    the collisions, the color shifts and the growth, so it costs the same however long the snake is."""
+    length, color_length, shifts, colored = seen or (0, 0, snake.colors.shifts, 0)
+    body, colors = Change(length), Change(color_length)
+    if seen:
+        body.front += 1  # the move: a new head, and the tail dropped.
+        body.pop_back(1)
+        for c in collisions:
+            if c.snake == snake.index:  # as `Simulation.collision_reaction`: cut, uncolor, retreat.
+                body.pop_back(max(0, len(body) - c.start))
+                colors.pop_back(max(0, len(colors) - c.start))
+                colors.renew(min(colored, c.start))
+                colored = 0
+                body.back += len(c.retreat)
+                body.pop_front(len(c.retreat))
+    shifted: int = snake.colors.shifts - shifts  # food eaten by a snake not yet fully colored...
+    colors.front += shifted
+    colors.pop_back(shifted)
+    body.back += len(snake.body) - len(body)  # ...and by one that was, which grows at the tail.
+    colors.back += len(snake.colors) - len(colors)
+    return body, colors
+
+
+class Simulation:
+    """Advances a whole game one tick per `step()` call without any rendering, sleeping or window."""
+    def __init__(self, config: GameConfig = GameConfig(), seed: int | None = None, rng: random.Random = None) -> None:
+        self.config: GameConfig = config
+        self.rng: random.Random = rng or random.Random(seed)  # an `rng` of your own replaces the one seeded with `seed`.
+        self.tick: int = 0
+        self.food: FoodTable = FoodTable()
+        self.food_index: FoodIndex = FoodIndex()
+        self.changed_food: set[int] = set()  # ids of food created, moved or removed by the last step.
+        self._next_food_id: int = 0
+        self.free_cells: FreeCells = FreeCells(config.half_width, config.half_height, margin=-(-FOOD_MARGIN // CELL_SIZE))
+        self.grid: OccupancyGrid = OccupancyGrid(config.half_width, config.half_height, self.free_cells)
+        self.snakes: list[SnakeState] = [self._spawn_snake(idx) for idx in range(config.players)]
+        self.profiler: Profiler | None = None  # times the phases of every step while set.
+        # the first snake starts with random colors that are plotted across the arena as the initial food.
+        first: SnakeState = self.snakes[0]
+        self.opening: Scatter = Scatter(0, list(first.body), list(first.colors), self._scatter(first, 0))
+        first.uncolor()
+
+    def _spawn_snake(self, idx: int) -> SnakeState:
+        """Snake 0 starts with random colors, heading right; snake 1 starts white below it, heading left. Further snakes
+        start white, two to a lane on the even rows nearest the middle, one behind the other. Lanes alternate between
+        heading right and left."""
+        length: int = self.config.length
+        if idx == 0:
+            return SnakeState([(-x, 2) for x in range(length)], Heading.Right, [self.rng.choice(COLORS) for _ in range(length)], self.grid, 0)
+        if idx == 1:
+            return SnakeState([(x, -3) for x in range(length)], Heading.Left, [WHITE] * length, self.grid, 1)
+        h: int = self.config.half_height
+        lanes: list[int] = sorted((y for y in range(-h, h + 1) if y % 2 == 0 and y != 2), key=abs)
+        lane, behind = divmod(idx - 2, 2)
+        if lane >= len(lanes) or length >= self.config.half_width:
+            raise ValueError(f'no room for {self.config.players} snakes of length {length} in the arena')
+        sign: int = 1 if lane % 2 == 0 else -1
+        head: int = sign * (-2 if behind else length - 1)
+        return SnakeState([(head - sign * x, lanes[lane]) for x in range(length)], Heading.Right if sign == 1 else Heading.Left, [WHITE] * length, self.grid, idx)
+
+    # ---- Arena ----
+    def in_bounds(self, cell: Cell) -> bool:
+        return self.grid.in_bounds(cell)
+
+    def wrap(self, cell: Cell) -> Cell:
+        """Teleport a cell that left the arena to the opposite edge."""
+        w, h = self.config.half_width, self.config.half_height
+        return (cell[0] + w) % (2 * w + 1) - w, (cell[1] + h) % (2 * h + 1) - h
+
+    def random_cell(self) -> Cell:
+        """A random cell of the food region without snake or food on it. Only a completely full region repeats a cell."""
+        if (cell := self.free_cells.choice(self.rng)) is not None:
+            return cell
+        w, h = self.free_cells.region_width, self.free_cells.region_height
+        return self.rng.randint(-w, w), self.rng.randint(-h, h)
+
+    # ---- Food ----
+    def create_food(self, cell: Cell = None, color: str = None) -> int:
+        if cell is None: cell = self.random_cell()
+        if color is None: color = self.rng.choice(COLORS)
+        fid: int = self._next_food_id
+        self._next_food_id += 1
+        self.food[fid] = (cell, color)
+        self.food_index.add(fid, cell)
+        self.free_cells.block(cell)
+        self.changed_food.add(fid)
+        return fid
+
+    def refresh_food(self, fid: int) -> None:
+        old: Cell = self.food[fid][0]
+        cell: Cell = self.random_cell()
+        self.free_cells.block(cell)
+        self.free_cells.unblock(old)
+        self.food_index.move(fid, old, cell)
+        self.food[fid] = (cell, self.rng.choice(COLORS))
+        self.changed_food.add(fid)
+
+    def remove_food(self, fid: int) -> None:
+        cell: Cell = self.food.pop(fid)[0]
+        self.food_index.remove(fid, cell)
+        self.free_cells.unblock(cell)
+        self.changed_food.add(fid)
+
+    def food_touchers(self) -> list[tuple[SnakeState, int]]:
+        """Pairs of a snake and a food item closer than `EAT_RADIUS` to its head. Each item is eaten at most once."""
+        out: list[tuple[SnakeState, int]] = []
+        eaten: set[int] = set()
+        limit: int = EAT_RADIUS * EAT_RADIUS
+        for s in self.snakes:
+            hx, hy = s.head
+            for fid in self.food_index.near(s.head, EAT_RADIUS // CELL_SIZE):
+                fx, fy = self.food[fid][0]
+                if fid not in eaten and ((fx - hx) ** 2 + (fy - hy) ** 2) * CELL_SIZE * CELL_SIZE < limit:
+                    eaten.add(fid)
+                    out.append((s, fid))
+        return out
+
+    def handle_food_collisions(self) -> None:
+        for s, fid in self.food_touchers():
+            s.eat(self.food[fid][1])
+            if len(self.food) <= self.config.food_abundance:
+                self.refresh_food(fid)
+            else:
+                self.remove_food(fid)
+
+    # ---- Collisions ----
+    def _scatter(self, snake: SnakeState, start: int) -> list[tuple[int, int, Cell]]:
+        """Turn each colored segment from `start` to the tail into a food item of its color."""
+        scattered: list[tuple[int, int, Cell]] = []
+        for idx in range(len(snake) - 1, start - 1, -1):
+            if snake.colors[idx] != WHITE:
+                fid: int = self.create_food(color=snake.colors[idx])
+                scattered.append((idx, fid, self.food[fid][0]))
+        return scattered
+
+    def collision_reaction(self, idx: int, kind: CollisionKind) -> Collision:
+        snake: SnakeState = self.snakes[idx]
+        start: int = snake.last_collision_index if kind is CollisionKind.Self else 4
+        event: Collision = Collision(idx, list(snake.body), list(snake.colors), self._scatter(snake, start), kind=kind, start=start)
+        snake.cut(start)
+        snake.uncolor()
+        event.retreat = snake.retreat(self.wrap if self.config.wall_teleport else lambda c: c)
+        snake.set_score(snake.last_collision_index if kind is CollisionKind.Self else snake.score // 4)
+        return event
+
+    def handle_self_collision(self, idx: int) -> Collision | None:
+        snake: SnakeState = self.snakes[idx]
+        if snake.is_self_collision():
+            snake.last_collision_index = snake.self_collision_index()
+            return self.collision_reaction(idx, CollisionKind.Self)
+        return None
+
+    def handle_wall_collision(self, idx: int) -> Collision | None:
+        if not self.config.wall_teleport and not self.in_bounds(self.snakes[idx].head):
+            return self.collision_reaction(idx, CollisionKind.Wall)
+        return None
+
+    def player_crashes(self) -> list[int]:
+        """Indices of the snakes whose head ran into another snake, head-to-body and head-to-head alike, found in one pass.
+
+        Each head is one lookup in the occupancy grid, so the pass costs the same however long the snakes are, and grows
+        with the number of heads rather than of pairs of snakes. Heads are checked from the last snake to the first. A
+        snake that crashed is no obstacle to the heads checked after it, so of two snakes that meet head-on only the
+        later one crashes.
+        """
+        crashed: dict[int, None] = {}  # in the order found, which is the order the crashes are played.
+        for s in reversed(self.snakes):
+            if any(other not in crashed for other in self.grid.others(s.head, s.index)):
+                crashed[s.index] = None
+        return list(crashed)
+
+    def handle_player_collisions(self) -> list[Collision]:
+        return [self.collision_reaction(idx, CollisionKind.Player) for idx in self.player_crashes()]
+
+    # ---- Tick ----
+    def step(self) -> list[Collision]:
+        """Advance the game by one tick and return the collisions that happened during it, for renderers to play."""
+        profiler: Profiler | None = self.profiler
+        if profiler: profiler.begin()
+        self.tick += 1
+        self.changed_food.clear()
+        self.grid.flipped.clear()
+        for s in self.snakes:
+            dx, dy = s.heading.delta
+            head: Cell = (s.head[0] + dx, s.head[1] + dy)
+            s.move(self.wrap(head) if self.config.wall_teleport else head)
+        if profiler: profiler.lap('move')
+        events: list[Collision | None] = [self.handle_self_collision(idx) for idx in range(len(self.snakes))]
+        if profiler: profiler.lap('self')
+        events += [self.handle_wall_collision(idx) for idx in range(len(self.snakes))]
+        if profiler: profiler.lap('walls')
+        events += self.handle_player_collisions()
+        if profiler: profiler.lap('players')
+        self.handle_food_collisions()
+        if profiler: profiler.lap('food')
+        return [e for e in events if e]
@@ -0,0 +1,184 @@
+"""Reinforcement-learning environments over the simulation, with the reset/step interface of Gym. Needs NumPy."""
+import multiprocessing
+import random
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+from .bots import Bot, load_bot
+from .engine import Heading, GameConfig, Simulation
+
+
+KEEP: int = 4  # the action that does not turn; actions 0-3 are the `Heading` values.
+ACTIONS: int = 5
+
+
+class SnakeEnv:
+    """One game for one agent, who steers the first snake; bots of the `opponent` kind steer the others. Episodes are
+    `max_ticks` long; with `end_on_crash` an episode also ends at the first crash of the agent's snake. `out` may be
+    given to have observations written into an existing array."""
+    def __init__(self, config: GameConfig = GameConfig(), max_ticks: int = 1000, end_on_crash: bool = False, opponent: str = 'greedy',
+                 seed: int | None = None, out: np.ndarray = None) -> None:
+        self.config: GameConfig = config
+        self.max_ticks: int = max_ticks
+        self.end_on_crash: bool = end_on_crash
+        self.opponent: str = opponent
+        self.observation_shape: tuple[int, int, int] = (2 * config.players + 1, 2 * config.half_height + 1, 2 * config.half_width + 1)
+        self.obs: np.ndarray = out if out is not None else np.zeros(self.observation_shape, np.uint8)
+        self.rng: random.Random = random.Random(seed)  # seeds the episodes that `reset` is not given a seed for.
+        self.sim: Simulation | None = None
+        self.bots: list[Bot] = []  # one for each snake after the agent's.
+        self.score: int = 0
+
+    def reset(self, seed: int | None = None) -> tuple[np.ndarray, dict]:
+        seed = seed if seed is not None else self.rng.getrandbits(63)
+        self.sim = Simulation(self.config, seed=seed)
+        self.bots = [load_bot(self.opponent, seed + idx) for idx in range(self.config.players - 1)]
+        self.score = 0
+        return self.observe(), {'seed': seed}
+
+    def step(self, action: int) -> tuple[np.ndarray, int, bool, bool, dict]:
+        """Turn towards `action` (or `KEEP` going) and play one tick. Returns obs, reward, terminated, truncated, info."""
+        sim: Simulation = self.sim
+        if action != KEEP:
+            sim.snakes[0].steer(Heading(action))
+        for idx, bot in enumerate(self.bots, 1):
+            if (heading := bot.decide(sim, idx)) is not None:
+                sim.snakes[idx].steer(heading)
+        crashed: bool = any(collision.snake == 0 for collision in sim.step())
+        reward: int = sim.snakes[0].score - self.score  # a crash costs what it costs a player.
+        self.score = sim.snakes[0].score
+        return self.observe(), reward, self.end_on_crash and crashed, sim.tick >= self.max_ticks, {'score': self.score, 'crashed': crashed}
+
+    def observe(self) -> np.ndarray:
+        """Write the current state into `obs` and return it: uint8 grids of shape (channels, height, width), row 0
+        being the bottom of the arena. Channel 2p counts the segments of snake p on each cell, channel 2p + 1 is 1 on
+        its head, and the last channel is 0 without food, otherwise 1 + the index of the food's color in `COLORS`."""
+        sim: Simulation = self.sim
+        obs: np.ndarray = self.obs
+        grid = sim.grid
+        shape: tuple[int, int] = self.observation_shape[1:]
+        counts: np.ndarray = np.frombuffer(grid.counts, np.uint16).reshape(shape)
+        owners: np.ndarray = np.frombuffer(grid.owners, np.int8).reshape(shape)
+        for p, snake in enumerate(sim.snakes):
+            np.copyto(obs[2 * p], np.where(owners == p, counts, 0), casting='unsafe')
+            obs[2 * p + 1] = 0
+            if sim.in_bounds(snake.head):
+                obs[2 * p + 1, snake.head[1] + grid.half_height, snake.head[0] + grid.half_width] = 1
+        for i, shared in grid.mixed.items():  # the few cells shared by several snakes during a crash.
+            y, x = divmod(i, grid.width)
+            for p, n in shared.items():
+                obs[2 * p, y, x] = n
+        obs[-1] = 0
+        if food := sim.food:  # the arrays stay locked against resizing only while these views of them exist.
+            xs: np.ndarray = np.frombuffer(food.xs, np.int16) + grid.half_width
+            ys: np.ndarray = np.frombuffer(food.ys, np.int16) + grid.half_height
+            obs[-1, ys, xs] = np.frombuffer(food.colors, np.uint8) + 1
+        return obs
+
+
+class VectorEnv:
+    """`envs` copies of `SnakeEnv` stepped together on `workers` processes, resetting each one when its episode ends.
+
+    `obs`, `rewards`, `terminated` and `truncated` are views of shared memory that every `step` and `reset` overwrite.
+    Environment i is seeded with `seed + i`. Use it as a context manager, or call `close`, to stop the workers.
+    """
+    def __init__(self, envs: int, workers: int | None = None, config: GameConfig = GameConfig(), seed: int = 0, **options) -> None:
+        self.envs: int = envs
+        workers = min(envs, workers or multiprocessing.cpu_count())
+        self.observation_shape: tuple[int, int, int] = (2 * config.players + 1, 2 * config.half_height + 1, 2 * config.half_width + 1)
+        layout: dict[str, tuple[tuple[int, ...], type]] = {
+            'obs': ((envs, *self.observation_shape), np.uint8), 'actions': ((envs,), np.int8), 'rewards': ((envs,), np.int32),
+            'terminated': ((envs,), np.bool_), 'truncated': ((envs,), np.bool_), 'scores': ((envs,), np.int32)}
+        self.memory: SharedMemory = SharedMemory(create=True, size=sum(_nbytes(shape, dtype) for shape, dtype in layout.values()))
+        self.layout: dict[str, tuple[int, tuple[int, ...], type]] = {}
+        offset: int = 0
+        for name, (shape, dtype) in layout.items():
+            self.layout[name] = (offset, shape, dtype)
+            offset += _nbytes(shape, dtype)
+        views: dict[str, np.ndarray] = _views(self.memory, self.layout)
+        self.obs: np.ndarray = views['obs']
+        self.actions: np.ndarray = views['actions']
+        self.rewards: np.ndarray = views['rewards']
+        self.terminated: np.ndarray = views['terminated']
+        self.truncated: np.ndarray = views['truncated']
+        self.scores: np.ndarray = views['scores']  # the score of each environment's agent.
+        self.pipes: list[Connection] = []
+        self.processes: list[multiprocessing.Process] = []
+        bounds: np.ndarray = np.linspace(0, envs, workers + 1).astype(int)
+        for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_work, args=(child, self.memory.name, self.layout, lo, hi, config, seed, options), daemon=True)
+            process.start()
+            child.close()
+            self.pipes.append(parent)
+            self.processes.append(process)
+
+    def _command(self, command: bytes) -> None:  # the workers read and write the shared buffers in place.
+        for pipe in self.pipes:
+            pipe.send_bytes(command)
+        for pipe in self.pipes:
+            if (answer := pipe.recv_bytes()) != b'ok':
+                raise RuntimeError(answer.decode())
+
+    def reset(self) -> np.ndarray:
+        self._command(b'r')
+        return self.obs
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Play one tick in every environment. Returns obs, rewards, terminated and truncated; an environment whose
+        episode ended has already been reset, so its obs is the first of its next episode."""
+        self.actions[:] = actions
+        self._command(b's')
+        return self.obs, self.rewards, self.terminated, self.truncated
+
+    def close(self) -> None:
+        if not self.pipes:
+            return
+        for pipe in self.pipes:
+            pipe.send_bytes(b'q')
+        for process in self.processes:
+            process.join()
+        self.pipes, self.processes = [], []
+        del self.obs, self.actions, self.rewards, self.terminated, self.truncated, self.scores
+        self.memory.close()
+        self.memory.unlink()
+
+    def __enter__(self) -> 'VectorEnv':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _nbytes(shape: tuple[int, ...], dtype: type) -> int:
+    return int(np.prod(shape)) * np.dtype(dtype).itemsize
+
+
+def _views(memory: SharedMemory, layout: dict[str, tuple[int, tuple[int, ...], type]]) -> dict[str, np.ndarray]:
+    return {name: np.ndarray(shape, dtype, memory.buf, offset) for name, (offset, shape, dtype) in layout.items()}
+
+
+def _work(pipe: Connection, name: str, layout: dict, lo: int, hi: int, config: GameConfig, seed: int, options: dict) -> None:
+    """Worker process: hosts environments lo..hi-1 and answers commands until told to quit."""
+    memory = SharedMemory(name=name)
+    views: dict[str, np.ndarray] = _views(memory, layout)
+    obs, actions, rewards, terminated, truncated, scores = (views[k] for k in ('obs', 'actions', 'rewards', 'terminated', 'truncated', 'scores'))
+    envs: list[SnakeEnv] = [SnakeEnv(config, seed=seed + i, out=obs[i], **options) for i in range(lo, hi)]
+    try:
+        while (command := pipe.recv_bytes()) != b'q':
+            try:
+                for i, env in enumerate(envs, lo):
+                    if command == b'r':
+                        env.reset()
+                        rewards[i], terminated[i], truncated[i], scores[i] = 0, False, False, 0
+                        continue
+                    _, rewards[i], terminated[i], truncated[i], info = env.step(int(actions[i]))
+                    scores[i] = info['score']
+                    if terminated[i] or truncated[i]:
+                        env.reset()
+                pipe.send_bytes(b'ok')
+            except Exception as e:  # report to the parent instead of leaving it waiting.
+                pipe.send_bytes(f'environment {i}: {e!r}'.encode())
+    finally:
+        del obs, actions, rewards, terminated, truncated, scores, views, envs
+        memory.close()
@@ -0,0 +1,659 @@
+"""The snake game itself: the turtle window, the renderers that draw the simulation on it, and the game play."""
+# noinspection PyUnresolvedReferences, PyProtectedMember
+from turtle import _Screen, Terminator, Turtle, TurtleScreen
+import argparse
+import dataclasses
+import os
+import queue
+import random
+import time
+import tkinter as tk
+from collections import deque
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable
+from .animation import Animator, Task
+from .bots import Bot, PathfindingBot
+from .canvas import Batch, Label, Outline, Pool, Sprite
+from .loop import FixedTimestep
+from .net import END, Client, connect_in_thread
+from .profiler import Profiler
+from .replay import SPEED as SPEED_CHANNEL, InputLog, Replay
+from .engine import WHITE, CELL_SIZE, Cell, Heading, GameConfig, Scatter, Collision, CollisionKind, SnakeState, Simulation
+from .storage import SegmentRing
+from .userdata import APP_NAME, Userdata, UserdataFile
+
+
+# Singletons, made by `start` when the game starts.
+userdata: Userdata  # the settings the game plays with.
+window: 'TurtleScreen | Window'
+batch: Batch  # draws the game straight onto the canvas of the window.
+animator: Animator  # plays the visual effects.
+segment_pool: Pool  # the segments of every snake come from it and go back to it.
+food_manager: 'FoodManager'
+
+
+class Window(_Screen):
+    """Singleton that manages screen: screen updates, coordinates and the frame rate."""
+    def __init__(self, width: int = 640, height: int = 640, bg_color: str = 'black', position: tuple[int, int] = (0, 0)) -> None:
+        super().__init__()
+        Turtle._screen = self
+        self.title(APP_NAME)
+        self.setup(width, height, *position)
+        self.bgcolor(bg_color)
+        self.tracer(False)
+        self.delay(5)  # to make animation a bit faster when expanding segments
+        self.listen()
+
+        # Attributes
+        self.center_to_height = self.window_width() // 2
+        self.center_to_width = self.window_height() // 2
+        def on_resize(event):
+            self.center_to_height = event.height // 2
+            self.center_to_width = event.width // 2
+        self._root.bind("<Configure>", on_resize, add="+")  # add="+" makes the event propagate beyond the on_resize()
+        self.frame_rate = 0.09 / userdata.speed  # in seconds for the snake to update. This is the speed of snake.
+        self.on_speed_changed: Callable = lambda: None
+        self.onkey(key='plus', fun=self.increment_frame_rate)
+        self.onkey(key='minus', fun=lambda: self.increment_frame_rate(negative=True))
+
+    def increment_frame_rate(self, negative: bool = False) -> None:
+        if (userdata.speed == 4 and not negative) or (userdata.speed == 1 and negative):
+            return
+        self.set_speed(userdata.speed + (-1 if negative else 1))
+
+    def set_speed(self, speed: int) -> None:
+        userdata.speed = speed
+        self.frame_rate = 0.09 / speed
+        self.on_speed_changed()
+
+    @staticmethod
+    def to_screen(cell: Cell) -> tuple[int, int]:
+        """Screen coordinates of the center of a simulation cell."""
+        return cell[0] * CELL_SIZE, cell[1] * CELL_SIZE
+
+    def timer(self, ms: int, func: Callable = lambda: None) -> None:
+        self.delay()
+        self.ontimer(func, ms)
+
+
+class Food(Sprite):
+    __slots__ = ()
+
+    def __init__(self, x: int, y: int, color: str) -> None:
+        super().__init__(batch, x, y, color, size=CELL_SIZE // 2, shape='circle')
+
+    @property
+    def food_color(self) -> str:
+        return self.fill
+
+
+class FoodManager:
+    """Singleton that mirrors the food of the simulation with `Food` sprites, taken from and put back in its pool."""
+    def __init__(self) -> None:
+        super().__init__()
+        self.pool: Pool = Pool(Food, CELL_SIZE // 2)
+        self.food: dict[int, Food] = {}
+        self.hidden: set[int] = set()  # scattered food that stays hidden until its segment has flown there.
+        self.simulation: Simulation | None = None
+
+    def show_food(self, fid: int) -> None:
+        """Draw the food `fid` where the simulation has it, or put its sprite away if the food is gone."""
+        if fid not in self.simulation.food:
+            if f := self.food.pop(fid, None):
+                self.pool.put(f)
+            return
+        cell, color = self.simulation.food[fid]
+        x, y = window.to_screen(cell)
+        if f := self.food.get(fid):
+            f.goto(x, y)
+            f.paint(color)
+            f.show()
+        else:
+            f = self.pool.get(x, y, color)
+        if fid in self.hidden:
+            f.hide()
+        self.food[fid] = f
+
+    def reveal(self, fid: int) -> None:
+        self.hidden.discard(fid)
+        if f := self.food.get(fid):
+            f.show()
+
+    def sync(self, food_ids: Iterable[int]) -> None:
+        for fid in food_ids:
+            self.show_food(fid)
+
+
+class SnakeSegment(Sprite):
+    __slots__ = ()
+
+    def __init__(self, x: int, y: int, color: str = WHITE) -> None:
+        super().__init__(batch, x, y, color, size=CELL_SIZE)
+
+    @property
+    def is_colored(self) -> bool:
+        return self.fill != WHITE
+
+    @property
+    def seg_color(self) -> str:
+        return self.fill
+
+    def glide(self, x: float, y: float, seconds: float = 0.1) -> Task:
+        """Animation task that moves the segment to (x, y) over `seconds`."""
+        x0, y0 = self.x, self.y
+        yield from animator.tween(seconds, lambda t: self.goto(x0 + (x - x0) * t, y0 + (y - y0) * t))
+
+
+INPUT_QUEUE: int = 3  # key presses a snake holds on to, one applied per tick; enough for a quick double turn and one more.
+
+
+class Snake:
+    """Draws one `SnakeState` of the simulation with a `SnakeSegment` sprite per body cell.
+
+    The sprites sit in a deque in body order, so following a move only sends the tail sprite to the old head cell and
+    the head sprite one cell on. Recoloring is limited to the colored run at the front of the snake, and to the first
+    two sprites when the snake moved and ate: the colors then shifted along with the body, so every other sprite keeps
+    the color it has.
+    """
+    def __init__(self, state: SnakeState, colors: list[str] = None) -> None:
+        self.state: SnakeState = state
+        self.segments: deque[SnakeSegment] = deque(segment_pool.get(*window.to_screen(cell), color) for cell, color in zip(state.body, colors or state.colors))
+        self.cells: deque[Cell] = deque(state.body)  # the cells the sprites are currently drawn on.
+        self.colored: int = len(self.segments) if colors else state.colored  # length of the drawn colored run.
+        self.shifts: int = state.colors.shifts  # color shifts of the state that have been drawn.
+        self.tint: str | None = None  # color painted over the whole snake while it flashes.
+        self.head: SnakeSegment = self.segments[0]  # will be the head segment
+        self.head.resize(1.3 * CELL_SIZE)
+        self.on_steer: Callable[[Heading], None] = lambda heading: None  # sees every heading the snake is steered to, even those it ignores.
+        self.inputs: deque[tuple[float, Heading]] = deque()  # (time pressed, heading) of the key presses waiting for a tick.
+        self.dropped: int = 0  # key presses left out because `inputs` was full.
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    @property
+    def score(self) -> int:
+        return self.state.score
+
+    def steer(self, heading: Heading) -> None:
+        self.on_steer(heading)
+        self.state.steer(heading)
+
+    def press(self, heading: Heading) -> None:
+        """Queue a key press for `apply_input`, stamped with the time of the game's clock. A press that would not turn
+        the snake, after the presses before it, is left out, and so is any press while `INPUT_QUEUE` presses wait."""
+        last: Heading = self.inputs[-1][1] if self.inputs else self.state.heading
+        if heading == last or heading == last.opposite:
+            return
+        if len(self.inputs) >= INPUT_QUEUE:
+            self.dropped += 1
+            return
+        self.inputs.append((animator.clock(), heading))
+
+    def apply_input(self) -> float | None:
+        """Steer by the oldest queued key press, if there is one, and return the time it was pressed. The simulation
+        takes one heading per tick, so every queued press gets a tick of its own."""
+        if not self.inputs or not self.state.input_enabled:  # not before the snake first moved.
+            return None
+        pressed, heading = self.inputs.popleft()
+        self.steer(heading)
+        return pressed
+
+    def extend(self, cell: Cell = None, color: str = WHITE) -> None:
+        if cell is None: cell = self.cells[-1]
+        self.segments.append(segment_pool.get(*window.to_screen(cell), color))
+        self.cells.append(cell)
+
+    def advance(self, head: Cell) -> None:
+        """Follow one move of the simulation: the tail sprite jumps to the old head cell and the head sprite moves on."""
+        head_seg: SnakeSegment = self.segments.popleft()
+        tail: SnakeSegment = self.segments.pop()
+        tail.goto(*window.to_screen(self.cells[0]))
+        head_seg.goto(*window.to_screen(head))
+        self.segments.appendleft(tail)
+        self.segments.appendleft(head_seg)
+        self.cells.appendleft(head)
+        self.cells.pop()
+
+    def show(self, body: Iterable[Cell], colors: list[str] = None) -> None:
+        """Redraw the whole snake on `body`, growing or cutting the sprite list to its length."""
+        cells: list[Cell] = list(body)
+        while len(self) < len(cells):
+            self.extend(cells[len(self)])
+        for seg in self.cut_segments(len(cells)):
+            segment_pool.put(seg)
+        self.cells = deque(cells)
+        for seg, cell in zip(self.segments, self.cells):
+            seg.goto(*window.to_screen(cell))
+        if colors is not None:
+            for seg, color in zip(self.segments, colors):
+                if seg.seg_color != color:
+                    seg.paint(color)
+            self.colored = sum(c != WHITE for c in colors)
+
+    def set_tint(self, tint: str | None) -> None:
+        self.tint = tint
+        for seg, color in zip(self.segments, self.state.colors):
+            if seg.seg_color != (tint or color):
+                seg.paint(tint or color)
+        self.colored = self.state.colored
+
+    def recolor(self, count: int = None) -> None:
+        """Repaint the sprites of the colored run, or its first `count`, whose color changed. Every sprite behind the run
+        is white already."""
+        if self.tint:
+            for seg in self.segments:
+                if seg.seg_color != self.tint:
+                    seg.paint(self.tint)
+            return
+        if count is None: count = max(self.colored, self.state.colored) + 1
+        for seg, color in islice(zip(self.segments, self.state.colors), count):
+            if seg.seg_color != color:
+                seg.paint(color)
+        self.colored = self.state.colored
+
+    def sync(self) -> None:
+        """Catch up with the simulation after a tick, touching only the sprites whose cell or color changed."""
+        body: SegmentRing = self.state.body
+        shifts: int = self.state.colors.shifts - self.shifts
+        self.shifts = self.state.colors.shifts
+        advanced: bool = False
+        if body[0] != self.cells[0] and len(body) > 1 and body[1] == self.cells[0] and len(self) == len(body):
+            self.advance(body[0])
+            advanced = True
+        if body[0] == self.cells[0] and len(self) < len(body):  # the snake grew at its tail.
+            advanced = False
+            for cell in islice(body, len(self), None):
+                self.extend(cell)
+        if body[0] != self.cells[0] or len(self) != len(body):  # anything else is redrawn in full.
+            advanced = False
+            self.show(body)
+        self.recolor(2 if advanced and shifts == 1 else None)
+
+    def interpolate(self, alpha: float) -> None:
+        """Slide the head sprite `alpha` of the way from the previous head cell to the current one."""
+        (x0, y0), (x1, y1) = self.cells[1], self.cells[0]
+        if abs(x1 - x0) + abs(y1 - y0) == 1:  # no sliding across the arena after a wall teleport.
+            self.head.goto(*window.to_screen((x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha)))
+
+    def extrapolate(self, alpha: float) -> None:
+        """Slide the head sprite `alpha` of the way from the current head cell towards the next one, as far as it is
+        known: along the heading the snake has, or is predicted to have, when the next tick comes."""
+        (x, y), (dx, dy) = self.cells[0], self.state.heading.delta
+        self.head.goto(*window.to_screen((x + dx * alpha, y + dy * alpha)))
+
+    def cut_segments(self, start: int) -> list[SnakeSegment]:
+        """Take the sprites from `start` on off the snake and return them, still showing."""
+        cut: list[SnakeSegment] = []
+        while len(self) > start:
+            cut.append(self.segments.pop())
+            self.cells.pop()
+        self.colored = min(self.colored, len(self))
+        return cut[::-1]
+
+    # ---- Visuals ----
+    # These are animation tasks for the `animator`: each step yields the seconds to wait before the next one.
+    def initial_plot(self, opening: Scatter) -> Task:
+        yield from self.plot_food_from_segments(list(self.segments), opening, 0, retract_after_expand=True)
+        yield from self.uncolor_segments()
+
+    def crash(self, segments: list[SnakeSegment], collision: Collision) -> Task:
+        """The segments cut off by `collision` flash and then fly to the food they became, while the snake plays on."""
+        yield from self.flash_warning(segments, tint_snake=collision.kind is not CollisionKind.Self)
+        yield from self.plot_food_from_segments(segments, collision, collision.start)
+
+    def flash_warning(self, segments: list[SnakeSegment], tint_snake: bool = False) -> Task:
+        seg_colors: list[str] = [seg.seg_color for seg in segments]
+        for i in range(6):
+            for seg, color in zip(segments, seg_colors):
+                seg.paint('yellow' if i % 2 == 0 else color)
+            if tint_snake:
+                self.set_tint('yellow' if i % 2 == 0 else None)
+            yield 0.2
+
+    @staticmethod
+    def plot_food_from_segments(segments: list[SnakeSegment], scatter: Scatter, start: int, retract_after_expand: bool = False) -> Task:
+        """Fly `segments`, which were body indexes `start` on, to the food the simulation created from them."""
+        targets: dict[int, tuple[int, Cell]] = {idx: (fid, cell) for idx, fid, cell in scatter.scattered}
+        original_locations: list[tuple[float, float]] = [(seg.x, seg.y) for seg in segments]
+        for idx in range(len(segments) - 1, -1, -1):
+            seg: SnakeSegment = segments[idx]
+            if start + idx not in targets:
+                seg.hide()
+                yield 0.05
+                continue
+            fid, cell = targets[start + idx]
+            yield from seg.glide(*window.to_screen(cell))
+            food_manager.reveal(fid)
+        if retract_after_expand:
+            for seg, loc in zip(segments, original_locations):
+                yield from seg.glide(*loc)
+            return
+        for seg in segments:
+            segment_pool.put(seg)
+
+    def uncolor_segments(self) -> Task:
+        for seg in self.segments:
+            seg.paint(WHITE)
+            yield 0.01
+        self.colored = 0
+
+
+KEYS: tuple[tuple[str, str, str, str], ...] = ('Up', 'Left', 'Down', 'Right'), ('w', 'a', 's', 'd')  # up, left, down and right of each player.
+
+
+class GamePlayManager:
+    """Singleton for the snake game play: runs the simulation and lets the renderers follow it.
+
+    The players at the keyboard steer the first snakes, with the keys in `KEYS`; the computer steers the `bots` snakes
+    after them, and with `computer_player` the first snake too. An `arena` that many cells across replaces the one the
+    size of the window; whenever the arena is larger than the window, the view scrolls to follow the first snake, or
+    the own one in a match on a server.
+    """
+    def __init__(self, two_players: bool = False, interpolate: bool = False, computer_player: bool = False, replay: Replay = None, time_scale: float = 1.0,
+                 remote: Client = None, messages: queue.SimpleQueue = None, bots: int = 0, arena: int = 0, profiler: Profiler = None):
+        self.replay: Replay | None = replay  # plays a recorded game back instead of taking input.
+        self.remote: Client | None = remote  # follows a match on a server instead of running the simulation here.
+        self.messages: queue.SimpleQueue | None = messages  # what the server sent that the game has not handled yet.
+        self.profiler: Profiler | None = profiler  # times the phases of ticks and frames.
+        self.time_scale: float = time_scale  # multiple of real time the game runs at.
+        self.log: InputLog | None = None  # records the game when games are recorded.
+        if replay:
+            self.simulation: Simulation = replay.sim
+        elif remote:
+            self.simulation = remote.state  # a `RemoteState`, which the renderers read like a simulation.
+            remote.handle(*messages.get())  # the first snapshot, with the whole match.
+        else:
+            half_width, half_height = (arena // 2, arena // 2) if arena else (window.center_to_width // CELL_SIZE, window.center_to_height // CELL_SIZE)
+            config = GameConfig(players=(2 if two_players else 1) + bots, length=userdata.length, food_abundance=userdata.food_abundance, wall_teleport=userdata.wall_teleport,
+                                half_width=half_width, half_height=half_height)
+            seed: int = random.randrange(1 << 63)  # every random choice of the game derives from it, so the log only needs the key presses.
+            self.simulation = Simulation(config, seed=seed)
+            if userdata.record:
+                self.log = InputLog(seed, config, userdata.mode, userdata.speed)
+        food_manager.simulation = self.simulation
+        fresh: bool = self.simulation.tick == 0 and not remote  # a replay may start later in the game, after the opening.
+        first, *others = self.simulation.snakes
+        self.snakes: list[Snake] = [Snake(first, colors=self.simulation.opening.colors if fresh else None)] + [Snake(s) for s in others]
+        self.humans: int = 0 if replay or remote or computer_player else 2 if two_players else 1  # snakes steered with `KEYS`.
+        self.bots: dict[int, Bot] = {}  # the bot steering each computer-steered snake, by index.
+        if not replay and not remote:
+            bot = PathfindingBot()  # its distance field depends on the arena only, so one bot can steer every snake.
+            self.bots = {idx: bot for idx in range(self.humans, len(self.snakes))}
+        for s in self.simulation.snakes:
+            s.on_score_changed = self.update_scoreboard
+        if self.log:
+            for snake in self.snakes:
+                snake.on_steer = lambda heading, idx=snake.state.index: self.log.record(self.simulation.tick, idx, heading)
+        if fresh:
+            food_manager.hidden |= {fid for _, fid, _ in self.simulation.opening.scattered}
+        food_manager.sync(self.simulation.food)
+        self.setup_input_controls()
+
+        # Camera
+        c: GameConfig = self.simulation.config
+        self.followed: Snake | None = None  # the snake the view scrolls with, if the arena does not fit the window.
+        if c.half_width * CELL_SIZE > window.center_to_width or c.half_height * CELL_SIZE > window.center_to_height:
+            self.followed = self.snakes[remote.seat if remote else 0]
+            Outline(batch, -(c.half_width + 0.5) * CELL_SIZE, -(c.half_height + 0.5) * CELL_SIZE, (c.half_width + 0.5) * CELL_SIZE, (c.half_height + 0.5) * CELL_SIZE)
+            batch.look_at(self.followed.head.x, self.followed.head.y, window.center_to_width, window.center_to_height)
+
+        # Scoreboard
+        self.scoreboard: Label = Label(batch, 0, 0)
+        self.update_scoreboard()
+        self.hud: Label | None = None  # the phase times under the scoreboard, while profiling.
+        self.frames: int = 0
+        if profiler:
+            self.simulation.profiler = profiler
+            self.hud = Label(batch, -window.center_to_width + 10, window.center_to_height - 40, fill='gray70', font=('Consolas', 10, 'normal'), anchor='nw')
+            window.onkey(key='F3', fun=lambda: self.hud.show() if not self.hud.visible else self.hud.hide())
+
+        # Game Loop
+        tick_seconds: float = remote.tick_seconds if remote else window.frame_rate / time_scale  # a server sets the pace of its matches.
+        self.loop: FixedTimestep = FixedTimestep(window.cv.after, self.tick, self.render, tick_seconds, after_cancel=window.cv.after_cancel,
+                                                 interpolate=interpolate or bool(remote), clock=animator.clock)
+        self.changed_food: set[int] = set()  # food changed by ticks that have not been rendered yet.
+        self.ticked: bool = False
+        self.pressed: list[float] = []  # when the key presses applied by ticks that have not been rendered yet were made, while profiling.
+        if not remote:
+            window.on_speed_changed = self.speed_changed
+
+        # Pause Play Interaction
+        self.game_active: bool = True
+        window.onkey(key='space', fun=self.pause_play_pressed)
+
+    def pause_play_pressed(self):
+        if self.game_active:
+            self.game_active = False
+            self.loop.stop()
+        else:
+            self.game_active = True
+            now: float = animator.clock()
+            for snake in self.snakes:  # what was pressed during the pause is as new as the game.
+                snake.inputs = deque((now, heading) for _, heading in snake.inputs)
+            self.loop.start()
+
+    def speed_changed(self) -> None:
+        self.loop.tick_seconds = window.frame_rate / self.time_scale
+        if self.log:
+            self.log.record(self.simulation.tick, SPEED_CHANNEL, userdata.speed - 1)
+
+    def scale_time(self, factor: float) -> None:
+        self.time_scale *= factor
+        self.loop.tick_seconds = window.frame_rate / self.time_scale
+        self.update_scoreboard()
+
+    def write_to_scoreboard(self, text: str) -> None:
+        self.scoreboard.write(text, y=window.center_to_height - 35)
+
+    def update_scoreboard(self) -> None:
+        first: Snake = self.snakes[0]
+        if self.remote:
+            own: Snake = self.snakes[self.remote.seat]
+            others: list[Snake] = [s for s in self.snakes if s is not own]
+            scores: str = f'You: {own.score}' + (f'     |     Opponent: {others[0].score}' if len(others) == 1 else self.best_of(others))
+            self.write_to_scoreboard(scores + ('     |     Game over' if self.remote.scores is not None else ''))
+        elif self.replay:
+            scores: str = f'1st Player: {first.score}     |     2nd Player: {self.snakes[1].score}' if len(self.snakes) > 1 else f'Score: {first.score}'
+            self.write_to_scoreboard(f'Replay at {self.time_scale:g}x     |     {scores}{self.best_of(self.snakes[2:])}')
+        elif not self.humans:
+            self.write_to_scoreboard(f'Computer: {first.score}     |     Decision: {self.bots[0].decision_ms:.2f} ms{self.best_of(self.snakes[1:])}')
+        elif self.humans == 1:
+            if first.score > userdata.highscore:
+                userdata.highscore = first.score
+            self.write_to_scoreboard(f'Score: {first.score}     |     Highscore: {userdata.highscore}{self.best_of(self.snakes[1:])}')
+        else:
+            self.write_to_scoreboard(f'1st Player: {first.score}     |     2nd Player: {self.snakes[1].score}{self.best_of(self.snakes[2:])}')
+
+    @staticmethod
+    def best_of(snakes: list[Snake]) -> str:
+        """The scoreboard's part for snakes that are not named on it: the best of their scores."""
+        return f'     |     Best of {len(snakes)} others: {max(s.score for s in snakes)}' if snakes else ''
+
+    def setup_input_controls(self) -> None:
+        if self.replay:  # the snakes follow the log; + and - change how fast it plays instead of the game speed.
+            window.onkey(key='plus', fun=lambda: self.scale_time(2))
+            window.onkey(key='minus', fun=lambda: self.scale_time(0.5))
+            return
+        keyed: list[Snake] = self.snakes[:self.humans]
+        if self.remote:  # the arrow keys steer the own snake, whichever seat it has, by sending the presses to the server.
+            keyed = [self.snakes[self.remote.seat]]
+            keyed[0].on_steer = self.remote.press
+        for snake, keys in zip(keyed, KEYS):
+            steer: Callable[[Heading], None] = snake.steer if self.remote else snake.press  # presses in a match go straight to the server, which decides what counts.
+            for key, heading in zip(keys, (Heading.Up, Heading.Left, Heading.Down, Heading.Right)):
+                window.onkeypress(key=key, fun=partial(steer, heading))
+
+    def collision_reaction(self, collision: Collision) -> None:
+        """Hand the segments that were cut off in the crash to an animation. The snake itself already moved on."""
+        snake: Snake = self.snakes[collision.snake]
+        snake.show(collision.body, collision.colors)  # the position the snake crashed in.
+        food_manager.hidden |= {fid for _, fid, _ in collision.scattered}
+        animator.play(snake.crash(snake.cut_segments(collision.start), collision))
+
+    def steer_bots(self) -> None:
+        """Let the bots press the keys for the headings they decided on, and show how long the decisions took."""
+        for idx, bot in self.bots.items():
+            if (heading := bot.decide(self.simulation, idx)) is not None:
+                self.snakes[idx].steer(heading)
+        if not self.humans:
+            self.update_scoreboard()
+
+    def receive(self) -> bool:
+        """Apply the snapshots that arrived from the server since the last tick. False once the match is over."""
+        while not self.messages.empty():
+            if (message := self.messages.get()) is None or message[0] == END:
+                if message:
+                    self.remote.handle(*message)
+                return False
+            self.remote.handle(*message)
+            self.changed_food |= self.simulation.changed_food
+            self.ticked = True
+        return True
+
+    def tick(self) -> None:
+        """Advance the simulation by one tick. Called by the game loop at the rate set by the speed."""
+        try:
+            if self.profiler: self.profiler.begin()
+            if self.remote:  # the server ran the tick; crashes show as the snake being redrawn, without animation.
+                if not self.receive():
+                    self.loop.stop()
+                    self.update_scoreboard()
+                if self.profiler: self.profiler.lap('receive')
+                return
+            if self.replay:
+                if self.replay.done:
+                    self.loop.stop()
+                    return
+                collisions: list[Collision] = self.replay.step()
+                if self.replay.speed != userdata.speed:
+                    window.set_speed(self.replay.speed)
+            else:
+                for snake in self.snakes[:self.humans]:
+                    if (pressed := snake.apply_input()) is not None and self.profiler:
+                        self.pressed.append(pressed)
+                if self.bots:
+                    self.steer_bots()
+                    if self.profiler: self.profiler.lap('bots')
+                collisions: list[Collision] = self.simulation.step()
+            self.changed_food |= self.simulation.changed_food
+            self.ticked = True
+            for collision in collisions:
+                self.collision_reaction(collision)
+            if self.profiler: self.profiler.lap('reactions')
+        except (tk.TclError, Terminator):  # the window was closed while the loop was still drawing.
+            self.loop.stop()
+
+    def render(self, alpha: float) -> None:
+        """Draw the ticks that ran since the last frame, then the head `alpha` of the way into the next tick."""
+        try:
+            if self.profiler: self.profiler.begin()
+            if self.ticked:
+                for snake in self.snakes:
+                    snake.sync()
+                food_manager.sync(self.changed_food)
+                self.changed_food.clear()
+                self.ticked = False
+                if self.profiler: self.profiler.lap('sync')
+            if self.loop.interpolate:
+                for snake in self.snakes:
+                    if self.remote and snake.state.index == self.remote.seat:
+                        snake.extrapolate(alpha)  # runs ahead on the predicted heading, so a key press shows at once.
+                    else:
+                        snake.interpolate(alpha)
+                if self.profiler: self.profiler.lap('interpolate')
+            if self.followed:
+                self.follow()
+                if self.profiler: self.profiler.lap('camera')
+            self.frames += 1
+            if self.hud and self.hud.visible and self.frames % 30 == 0:  # often enough to read, rarely enough not to cost.
+                self.hud.write(self.profiler.report(), x=-window.center_to_width + 10, y=window.center_to_height - 40)
+            batch.flush()
+            if self.profiler: self.profiler.lap('flush')
+            if self.pressed:  # the frame that shows the key presses of the ticks.
+                now: float = animator.clock()
+                for pressed in self.pressed:
+                    self.profiler.add('input', round((now - pressed) * 1e9))
+                self.pressed.clear()
+        except (tk.TclError, Terminator):  # the window was closed while the loop was still drawing.
+            self.loop.stop()
+
+    def follow(self) -> None:
+        """Scroll the view just enough to keep the head of the followed snake within the middle half of the window."""
+        (x, y), head = batch.camera, self.followed.head
+        half_width, half_height = window.center_to_width, window.center_to_height
+        x = min(max(x, head.x - half_width / 2), head.x + half_width / 2)
+        y = min(max(y, head.y - half_height / 2), head.y + half_height / 2)
+        batch.look_at(x, y, half_width, half_height)
+
+    def opening(self) -> Task:
+        if self.simulation.tick == 0 and not self.remote:
+            first: Snake = self.snakes[0]
+            if len(self.snakes) == 1:
+                yield from first.flash_warning(list(first.segments))
+            yield from first.initial_plot(self.simulation.opening)
+        for snake in self.snakes:  # the snakes stand still during the opening, so keys pressed then count for nothing.
+            snake.inputs.clear()
+        self.loop.start()
+
+    def start_game(self) -> None:
+        animator.play(self.opening())
+
+    def save_log(self) -> None:
+        """Write the input log of the game to the replays folder, named after the time the game ended."""
+        directory: str = os.path.join(UserdataFile.get_appdata_directory(), 'replays')
+        os.makedirs(directory, exist_ok=True)
+        self.log.ticks = self.simulation.tick
+        self.log.save(os.path.join(directory, time.strftime('%Y-%m-%d %H-%M-%S') + '.ctsl'))
+
+
+def setup(screen: 'TurtleScreen | Window', clock: Callable[[], float] = time.perf_counter) -> None:
+    """Make the singletons that draw the game on `screen`, the game window or a stand-in for it, with the game loop and
+    the animations timed by `clock`."""
+    global window, batch, animator, segment_pool, food_manager
+    window = screen
+    batch = Batch(window.cv)
+    animator = Animator(window.cv.after, render=batch.flush, clock=clock)
+    segment_pool = Pool(SnakeSegment, CELL_SIZE)
+    food_manager = FoodManager()
+
+
+def start(arguments: argparse.Namespace, settings: Userdata, window_pos: tuple[int, int] = (0, 0)) -> GamePlayManager:
+    """Open the game window and start the game that the command line `arguments` ask for, playing with `settings`.
+    Returns the manager of the game, whose opening is about to play."""
+    global userdata
+    userdata = settings
+    replay: Replay | None = None  # the recorded game being shown, if the game was started with --replay.
+    if arguments.replay:
+        replay = Replay(InputLog.load(arguments.replay))
+        replay.seek(arguments.start)
+        userdata = dataclasses.replace(settings, mode=replay.log.mode, speed=replay.speed)  # the player's own settings stay as they are.
+    remote: Client | None = None  # the seat in a match on a server, if the game was started with --connect.
+    messages: queue.SimpleQueue | None = None
+    if arguments.connect:
+        host, _, port = arguments.connect.rpartition(':')
+        remote, messages = connect_in_thread(host or '127.0.0.1', int(port))
+    setup(Window(position=window_pos))
+    if remote:  # the match starts once every seat is taken.
+        waiting: Label = Label(batch, 0, 0, 'Waiting for the other player...')
+        while messages.empty():
+            batch.flush()
+            window.update()
+            time.sleep(0.05)
+        waiting.write('')
+    game_play_manager: GamePlayManager = GamePlayManager(two_players=userdata.mode == 2, interpolate=arguments.interpolate, computer_player=userdata.mode == 3 and not replay and not remote,
+                                                         replay=replay, time_scale=arguments.time_scale, remote=remote, messages=messages, bots=arguments.bots,
+                                                         arena=arguments.arena, profiler=Profiler() if arguments.profile is not None else None)
+    game_play_manager.start_game()
+    return game_play_manager
+
+
+def run(arguments: argparse.Namespace, settings: Userdata, window_pos: tuple[int, int] = (0, 0)) -> None:
+    """Play the game `start` starts until its window is closed, then save its input log and profile if it made them."""
+    game_play_manager: GamePlayManager = start(arguments, settings, window_pos)
+    window.mainloop()  # runs the game loop's timers and handles input until the window is closed.
+    if game_play_manager.log:
+        game_play_manager.save_log()
+    if game_play_manager.profiler and arguments.profile:
+        game_play_manager.profiler.export(arguments.profile)
@@ -0,0 +1,319 @@
+"""Spatial indexes over the cells of the arena, updated incrementally as the simulation changes."""
+import random
+from array import array
+from collections import Counter, defaultdict
+
+
+Cell = tuple[int, int]
+EMPTY: int = -1  # owner of a cell without any segment on it.
+MIXED: int = -2  # owner of a cell shared by segments of more than one snake.
+
+
+class OccupancyGrid:
+    """Counts the snake segments on every cell of the arena and remembers which snake they belong to.
+
+    A cell normally holds segments of at most one snake, so `owners` stores that snake's id directly. The rare cells
+    shared by several snakes (for a tick, while a crash is resolved) keep a per-snake count in `mixed` instead.
+    Cells outside the arena, such as a head that just hit a wall, are not tracked. When a cell gains its first segment
+    or loses its last one, the optional `free` index is told to block or unblock it and the cell's index is added to
+    `flipped`, which the owner of the grid clears whenever it likes (the simulation does so every tick).
+    """
+    def __init__(self, half_width: int, half_height: int, free: 'FreeCells' = None) -> None:
+        self.free: FreeCells | None = free
+        self.half_width: int = half_width
+        self.half_height: int = half_height
+        self.width: int = 2 * half_width + 1
+        self.height: int = 2 * half_height + 1
+        self.counts: array = array('H', bytes(2 * self.width * self.height))
+        self.owners: array = array('b', [EMPTY]) * (self.width * self.height)
+        self.mixed: dict[int, Counter] = {}
+        self.flipped: set[int] = set()  # indices of cells that became occupied or empty since the last clear.
+
+    def in_bounds(self, cell: Cell) -> bool:
+        return -self.half_width <= cell[0] <= self.half_width and -self.half_height <= cell[1] <= self.half_height
+
+    def index(self, cell: Cell) -> int:
+        return cell[0] + self.half_width + (cell[1] + self.half_height) * self.width
+
+    def add(self, cell: Cell, snake: int) -> None:
+        if not self.in_bounds(cell):
+            return
+        i: int = self.index(cell)
+        owner: int = self.owners[i]
+        if owner == EMPTY:
+            self.owners[i] = snake
+            self.flipped.add(i)
+            if self.free:
+                self.free.block(cell)
+        elif owner == MIXED:
+            self.mixed[i][snake] += 1
+        elif owner != snake:
+            self.mixed[i] = Counter({owner: self.counts[i], snake: 1})
+            self.owners[i] = MIXED
+        self.counts[i] += 1
+
+    def remove(self, cell: Cell, snake: int) -> None:
+        if not self.in_bounds(cell):
+            return
+        i: int = self.index(cell)
+        self.counts[i] -= 1
+        if self.owners[i] == MIXED:
+            shared: Counter = self.mixed[i]
+            shared[snake] -= 1
+            if not shared[snake]:
+                del shared[snake]
+            if len(shared) == 1:
+                self.owners[i] = next(iter(shared))
+                del self.mixed[i]
+        elif not self.counts[i]:
+            self.owners[i] = EMPTY
+            self.flipped.add(i)
+            if self.free:
+                self.free.unblock(cell)
+
+    def owner(self, cell: Cell) -> int:
+        """Id of the snake on `cell`, `EMPTY`, or `MIXED` when segments of several snakes share it."""
+        return self.owners[self.index(cell)] if self.in_bounds(cell) else EMPTY
+
+    def count(self, cell: Cell, snake: int = None) -> int:
+        """Number of segments on `cell`, counting only those of `snake` if it is given."""
+        if not self.in_bounds(cell):
+            return 0
+        i: int = self.index(cell)
+        if snake is None or self.owners[i] == snake:
+            return self.counts[i]
+        return self.mixed[i][snake] if self.owners[i] == MIXED else 0
+
+    def others(self, cell: Cell, snake: int) -> list[int]:
+        """Ids of the snakes other than `snake` with a segment on `cell`."""
+        if not self.in_bounds(cell):
+            return []
+        owner: int = self.owners[self.index(cell)]
+        if owner == MIXED:
+            return [s for s in self.mixed[self.index(cell)] if s != snake]
+        return [] if owner in (EMPTY, snake) else [owner]
+
+
+class FoodIndex:
+    """Uniform-grid spatial hash that files food ids under square buckets of `bucket` x `bucket` cells.
+
+    A lookup only visits the few buckets that overlap the search square around a cell, so finding the food near a
+    head no longer depends on how much food lies on the board.
+    """
+    def __init__(self, bucket: int = 2) -> None:
+        self.bucket: int = bucket
+        self.buckets: dict[Cell, set[int]] = {}
+
+    def key(self, cell: Cell) -> Cell:
+        return cell[0] // self.bucket, cell[1] // self.bucket
+
+    def add(self, fid: int, cell: Cell) -> None:
+        self.buckets.setdefault(self.key(cell), set()).add(fid)
+
+    def remove(self, fid: int, cell: Cell) -> None:
+        key: Cell = self.key(cell)
+        bucket: set[int] = self.buckets[key]
+        bucket.discard(fid)
+        if not bucket:
+            del self.buckets[key]
+
+    def move(self, fid: int, old: Cell, new: Cell) -> None:
+        if self.key(old) != self.key(new):
+            self.remove(fid, old)
+            self.add(fid, new)
+
+    def near(self, cell: Cell, reach: int) -> list[int]:
+        """Ids of the food in the buckets overlapping the square of `reach` cells around `cell`, in ascending order."""
+        (x0, y0), (x1, y1) = self.key((cell[0] - reach, cell[1] - reach)), self.key((cell[0] + reach, cell[1] + reach))
+        found: list[int] = []
+        for bx in range(x0, x1 + 1):
+            for by in range(y0, y1 + 1):
+                if bucket := self.buckets.get((bx, by)):
+                    found.extend(bucket)
+        return sorted(found)
+
+
+class FreeCells:
+    """The cells of the food region that hold neither a snake segment nor food, with an O(1) uniform random pick.
+
+    Free cells are kept in a dense array with a reverse map from cell index to array position, so a cell is removed by
+    swapping it with the last entry. `blocked` counts what sits on each cell: one for any number of segments (the
+    occupancy grid only reports its first and last) plus one per food item. The food region leaves `margin` cells
+    clear along every edge of the arena.
+    """
+    def __init__(self, half_width: int, half_height: int, margin: int = 0) -> None:
+        self.half_width: int = half_width
+        self.half_height: int = half_height
+        self.width: int = 2 * half_width + 1
+        self.region_width: int = max(0, half_width - margin)
+        self.region_height: int = max(0, half_height - margin)
+        self.blocked: array = array('H', bytes(2 * self.width * (2 * half_height + 1)))
+        self.positions: array = array('l', [-1]) * (self.width * (2 * half_height + 1))
+        self.cells: array = array('l')
+        for y in range(-self.region_height, self.region_height + 1):
+            for x in range(-self.region_width, self.region_width + 1):
+                self._push(self.index((x, y)))
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __contains__(self, cell: Cell) -> bool:
+        return self.in_region(cell) and self.positions[self.index(cell)] != -1
+
+    def in_region(self, cell: Cell) -> bool:
+        return -self.region_width <= cell[0] <= self.region_width and -self.region_height <= cell[1] <= self.region_height
+
+    def index(self, cell: Cell) -> int:
+        return cell[0] + self.half_width + (cell[1] + self.half_height) * self.width
+
+    def cell(self, index: int) -> Cell:
+        return index % self.width - self.half_width, index // self.width - self.half_height
+
+    def _push(self, i: int) -> None:
+        self.positions[i] = len(self.cells)
+        self.cells.append(i)
+
+    def _swap_remove(self, i: int) -> None:
+        pos: int = self.positions[i]
+        last: int = self.cells.pop()
+        if last != i:
+            self.cells[pos] = last
+            self.positions[last] = pos
+        self.positions[i] = -1
+
+    def block(self, cell: Cell) -> None:
+        if not self.in_region(cell):
+            return
+        i: int = self.index(cell)
+        self.blocked[i] += 1
+        if self.blocked[i] == 1:
+            self._swap_remove(i)
+
+    def unblock(self, cell: Cell) -> None:
+        if not self.in_region(cell):
+            return
+        i: int = self.index(cell)
+        self.blocked[i] -= 1
+        if not self.blocked[i]:
+            self._push(i)
+
+    def choice(self, rng: random.Random) -> Cell | None:
+        """A uniformly random free cell, or None when the region is full."""
+        return self.cell(self.cells[rng.randrange(len(self.cells))]) if self.cells else None
+
+
+UNREACHABLE: int = 1 << 30  # distance of blocked cells and of cells with no way to a target.
+
+
+class DistanceField:
+    """Steps from every open cell of the arena to the nearest target cell, kept up to date as cells and targets change.
+
+    Block and unblock cells and add or remove targets, then `commit()`. Instead of a search over the whole arena, the
+    commit first forgets the distances that ran through a cell that was blocked or a target that is gone, walking
+    outwards only while a cell has no other neighbour one step closer, and then lowers distances outwards from the
+    forgotten cells, the unblocked cells and the new targets, a level at a time. Cells are indexed like
+    `OccupancyGrid`, and with `wrap` the edges of the arena are joined like the walls of a teleporting game.
+    """
+    def __init__(self, half_width: int, half_height: int, wrap: bool = False) -> None:
+        self.half_width: int = half_width
+        self.half_height: int = half_height
+        self.width: int = 2 * half_width + 1
+        self.height: int = 2 * half_height + 1
+        size: int = self.width * self.height
+        self.dist: array = array('l', [UNREACHABLE]) * size
+        self.blocked: bytearray = bytearray(size)
+        self.targets: array = array('H', bytes(2 * size))  # number of targets on each cell; any number makes it distance 0.
+        self.neighbors: list[tuple[int, ...]] = [self._neighbors(i, wrap) for i in range(size)]
+        self.visited: int = 0  # cells the last commit looked at.
+        self._raised: list[int] = []
+        self._lowered: list[int] = []
+
+    def index(self, cell: Cell) -> int:
+        return cell[0] + self.half_width + (cell[1] + self.half_height) * self.width
+
+    def in_bounds(self, cell: Cell) -> bool:
+        return -self.half_width <= cell[0] <= self.half_width and -self.half_height <= cell[1] <= self.half_height
+
+    def _neighbors(self, i: int, wrap: bool) -> tuple[int, ...]:
+        x, y = i % self.width, i // self.width
+        out: list[int] = []
+        for nx, ny in ((x + 1, y), (x, y + 1), (x - 1, y), (x, y - 1)):
+            if wrap:
+                nx, ny = nx % self.width, ny % self.height
+            elif not (0 <= nx < self.width and 0 <= ny < self.height):
+                continue
+            out.append(nx + ny * self.width)
+        return tuple(out)
+
+    def set_blocked(self, i: int, blocked: bool) -> None:
+        if blocked == bool(self.blocked[i]):
+            return
+        self.blocked[i] = blocked
+        (self._raised if blocked else self._lowered).append(i)
+
+    def add_target(self, i: int, count: int = 1) -> None:
+        """Add `count` targets on cell `i`, or remove them with a negative `count`."""
+        before: int = self.targets[i]
+        self.targets[i] = before + count
+        if not before:
+            self._lowered.append(i)
+        elif not self.targets[i]:
+            self._raised.append(i)
+
+    def commit(self) -> None:
+        self.visited = 0
+        if self._raised or self._lowered:
+            self._lower(self._raise(self._raised) + self._lowered)
+            self._raised, self._lowered = [], []
+
+    def rebuild(self) -> None:
+        """Recompute every distance from scratch, like a breadth-first search from all targets at once."""
+        self.dist[:] = array('l', [UNREACHABLE]) * len(self.dist)
+        self._raised, self._lowered = [], [i for i, n in enumerate(self.targets) if n]
+        self.commit()
+
+    def _raise(self, seeds: list[int]) -> list[int]:
+        """Forget the distances that can no longer be reached through a neighbour one step closer. Returns those cells.
+
+        Cells are checked in order of their old distance, so the neighbours a cell could lean on have been checked before.
+        """
+        dist: array = self.dist
+        levels: defaultdict[int, list[int]] = defaultdict(list)
+        for i in seeds:
+            if dist[i] != UNREACHABLE:
+                levels[dist[i]].append(i)
+        lost: list[int] = []
+        d: int = min(levels, default=0)
+        while levels:
+            for i in levels.pop(d, ()):
+                self.visited += 1
+                if dist[i] != d or not self.blocked[i] and (self.targets[i] or any(dist[j] == d - 1 for j in self.neighbors[i])):
+                    continue
+                dist[i] = UNREACHABLE
+                lost.append(i)
+                levels[d + 1].extend(j for j in self.neighbors[i] if dist[j] == d + 1)
+            d += 1
+        return lost
+
+    def _lower(self, seeds: list[int]) -> None:
+        """Give the `seeds` the distance their neighbours allow, and spread every improvement outwards level by level."""
+        dist, blocked, neighbors = self.dist, self.blocked, self.neighbors
+        levels: defaultdict[int, list[int]] = defaultdict(list)
+        for i in seeds:
+            if blocked[i]:
+                continue
+            d: int = 0 if self.targets[i] else min(dist[j] for j in neighbors[i]) + 1 if neighbors[i] else UNREACHABLE
+            if d < dist[i]:
+                dist[i] = d
+                levels[d].append(i)
+        d = min(levels, default=0)
+        while levels:
+            for i in levels.pop(d, ()):
+                if dist[i] != d:
+                    continue
+                self.visited += 1
+                for j in neighbors[i]:
+                    if dist[j] > d + 1 and not blocked[j]:
+                        dist[j] = d + 1
+                        levels[d + 1].append(j)
+            d += 1
@@ -0,0 +1,120 @@
+"""Stand-ins for the game window and its Tk canvas, so the game runs without a display and on virtual time."""
+import heapq
+import itertools
+from typing import Any, Callable, Iterator
+from . import game
+from .profiler import Profiler
+from .userdata import Userdata
+
+
+class Scheduler:
+    """Tk's `after` on a virtual clock: `run` calls the timers in the order they fall due and moves the clock to each.
+
+    A timer falls due a millisecond later at the earliest, for the time Tk takes to get to it, so a game loop that waits
+    for a fraction of a millisecond still sees its clock move on.
+    """
+    def __init__(self) -> None:
+        self.now: float = 0.0  # in seconds.
+        self.timers: list[tuple[float, int, Callable[[], Any]]] = []  # a heap of (time due, id, callback).
+        self.cancelled: set[int] = set()
+        self._ids: Iterator[int] = itertools.count()
+
+    def clock(self) -> float:
+        return self.now
+
+    def after(self, ms: int, func: Callable[[], Any]) -> int:
+        timer: int = next(self._ids)
+        heapq.heappush(self.timers, (self.now + max(ms, 1) / 1000, timer, func))
+        return timer
+
+    def after_cancel(self, timer: int) -> None:
+        self.cancelled.add(timer)
+
+    def run(self, until: Callable[[], bool]) -> None:
+        """Call the timers as they fall due until `until()` is true or no timer is left."""
+        while self.timers and not until():
+            due, timer, func = heapq.heappop(self.timers)
+            if timer in self.cancelled:
+                self.cancelled.discard(timer)
+                continue
+            self.now = max(self.now, due)
+            func()
+
+
+class Canvas:
+    """Takes the calls the game makes of a Tk canvas, keeping the kind of every item it has and counting the calls."""
+    def __init__(self, scheduler: Scheduler) -> None:
+        self.items: dict[int, str] = {}
+        self.calls: int = 0
+        self.after: Callable[[int, Callable[[], Any]], int] = scheduler.after
+        self.after_cancel: Callable[[int], None] = scheduler.after_cancel
+        self._ids: Iterator[int] = itertools.count(1)
+
+    def create(self, kind: str) -> int:
+        item: int = next(self._ids)
+        self.items[item] = kind
+        self.calls += 1
+        return item
+
+    def create_rectangle(self, *coords, **options) -> int:
+        return self.create('rectangle')
+
+    def create_oval(self, *coords, **options) -> int:
+        return self.create('oval')
+
+    def create_text(self, *coords, **options) -> int:
+        return self.create('text')
+
+    def coords(self, item: int, *coords) -> None:
+        self.calls += 1
+
+    def itemconfigure(self, item: int, **options) -> None:
+        self.calls += 1
+
+    def tag_raise(self, item: int) -> None:
+        self.calls += 1
+
+    def delete(self, *items: int) -> None:
+        for item in items:
+            del self.items[item]
+        self.calls += 1
+
+
+class Window:
+    """What the game uses of its window, with the keys bound the same way and `press` to press them."""
+    increment_frame_rate = game.Window.increment_frame_rate
+    set_speed = game.Window.set_speed
+    to_screen = staticmethod(game.Window.to_screen)
+
+    def __init__(self, scheduler: Scheduler, width: int = 640, height: int = 640) -> None:
+        self.cv: Canvas = Canvas(scheduler)
+        self.center_to_width: int = width // 2
+        self.center_to_height: int = height // 2
+        self.frame_rate: float = 0.09 / game.userdata.speed
+        self.on_speed_changed: Callable = lambda: None
+        self.keys: dict[str, Callable[[], Any]] = {}
+        self.onkey(key='plus', fun=self.increment_frame_rate)
+        self.onkey(key='minus', fun=lambda: self.increment_frame_rate(negative=True))
+
+    def onkey(self, fun: Callable[[], Any], key: str) -> None:
+        self.keys[key] = fun
+
+    onkeypress = onkey
+
+    def press(self, key: str) -> None:
+        if fun := self.keys.get(key):
+            fun()
+
+    def update(self) -> None:
+        pass
+
+
+def start(settings: Userdata, bots: int = 0, arena: int = 0, profiler: Profiler = None, interpolate: bool = False) -> tuple[game.GamePlayManager, Scheduler]:
+    """Set up a game like `game.start` does for the mode of `settings`, without a window. The game starts as the
+    scheduler runs, and runs as fast as it can be simulated and drawn."""
+    scheduler = Scheduler()
+    game.userdata = settings
+    game.setup(Window(scheduler), clock=scheduler.clock)
+    game_play_manager = game.GamePlayManager(two_players=settings.mode == 2, interpolate=interpolate, computer_player=settings.mode == 3, bots=bots, arena=arena, profiler=profiler)
+    game_play_manager.start_game()
+    return game_play_manager, scheduler
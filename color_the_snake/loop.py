@@ -0,0 +1,82 @@
+"""Fixed-timestep game loop driven by a scheduler callback, such as Tk's `after`, instead of blocking sleeps."""
+import time
+from typing import Any, Callable
+
+
+class FixedTimestep:
+    """Calls `update` once per `tick_seconds` of real time and `render` once per frame.
+
+    Elapsed time is collected in an accumulator, so time spent updating and drawing is paid back by the following
+    frames instead of slowing the game down, and frames are scheduled for the moment the next tick falls due, which
+    keeps timer lateness from adding up. At most `max_catch_up` ticks run in one frame; a larger backlog (after the
+    machine stalled, say) is dropped and counted in `dropped` rather than replayed all at once.
+
+    With `interpolate`, frames run every `frame_seconds` and `render` receives how far (0 to 1) the game is into the
+    next tick. Otherwise a frame only happens when at least one tick ran.
+    """
+    def __init__(self, after: Callable[[int, Callable], Any], update: Callable[[], None], render: Callable[[float], None], tick_seconds: float,
+                 after_cancel: Callable[[Any], None] = None, max_catch_up: int = 5, interpolate: bool = False, frame_seconds: float = 1 / 60,
+                 clock: Callable[[], float] = time.perf_counter) -> None:
+        self.after: Callable[[int, Callable], Any] = after
+        self.after_cancel: Callable[[Any], None] | None = after_cancel
+        self.update: Callable[[], None] = update
+        self.render: Callable[[float], None] = render
+        self.tick_seconds: float = tick_seconds
+        self.max_catch_up: int = max_catch_up
+        self.interpolate: bool = interpolate
+        self.frame_seconds: float = frame_seconds
+        self.clock: Callable[[], float] = clock
+        self.running: bool = False
+        self.accumulator: float = 0.0
+        self.ticks: int = 0  # updates run since the loop was created.
+        self.dropped: int = 0  # ticks given up because the loop fell too far behind.
+        self._last: float = 0.0
+        self._next_frame: float = 0.0
+        self._timer: Any = None
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.running = True
+        self.resync()
+        self._schedule()
+
+    def stop(self) -> None:
+        self.running = False
+        if self._timer is not None and self.after_cancel:
+            self.after_cancel(self._timer)
+        self._timer = None
+
+    def resync(self) -> None:
+        """Forget the time since the last frame, e.g. after a pause or an animation that blocked the event loop."""
+        self._last = self._next_frame = self.clock()
+        self.accumulator = 0.0
+
+    def _schedule(self) -> None:
+        self._timer = self.after(max(0, round((self._next_frame - self.clock()) * 1000)), self._frame)
+
+    def _frame(self) -> None:
+        self._timer = None
+        if not self.running:
+            return
+        now: float = self.clock()
+        self.accumulator += now - self._last
+        self._last = now
+        steps: int = 0
+        while self.accumulator >= self.tick_seconds and steps < self.max_catch_up and self.running:
+            self.accumulator -= self.tick_seconds
+            self.update()
+            steps += 1
+        if self.accumulator >= self.tick_seconds:  # too far behind: drop the backlog instead of spiralling.
+            self.dropped += int(self.accumulator // self.tick_seconds)
+            self.accumulator %= self.tick_seconds
+        self.ticks += steps
+        if steps or self.interpolate:
+            self.render(self.accumulator / self.tick_seconds)
+        if not self.running:
+            return
+        if self.interpolate:
+            self._next_frame = max(self._next_frame + self.frame_seconds, now)
+        else:
+            self._next_frame = self._last - self.accumulator + self.tick_seconds
+        self._schedule()
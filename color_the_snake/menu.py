@@ -0,0 +1,170 @@
+"""The start menu: a Tk window with the settings of the next game, a Play button and the instructions."""
+import tkinter as tk
+from tkinter import ttk
+from .assets import photo
+from .userdata import APP_NAME, Userdata
+
+
+font_large = ('System', 17)
+font_small = ('System', 16)
+
+
+class ToggleSwitch(tk.Label):
+    def __init__(self, master=None):
+        super().__init__(master, image=photo('toggle_off'), bd=0)
+        self.toggled = False
+        self.bind("<Button-1>", lambda _: self.toggle())
+
+    def set_toggled(self, b: bool):
+        self.toggled = b
+        self.config(image=photo('toggle_on') if b else photo('toggle_off'))
+
+    def toggle(self):
+        self.set_toggled(not self.toggled)
+
+    @property
+    def is_toggled(self) -> bool:
+        return self.toggled
+
+
+class Settings(tk.Frame):
+    def __init__(self, master: tk.Misc, userdata: Userdata):
+        super().__init__(master)
+        self.configure(bg="black")
+
+        # Player Mode
+        l = tk.Label(self, text="Mode: ", font=font_large, bg="black", fg="white")
+        l.grid(row=0, column=0, sticky="e")
+        self._mode = ttk.Combobox(self, values=["Single Player", "Double Player", "Computer Player"], font=font_small, state="readonly", width=17)
+        self._mode.bind("<<ComboboxSelected>>", lambda _: master.focus())  # so that focus does not cause blue highlight to stay on combobox.
+        self._mode.current(userdata.mode-1)
+        self._mode.grid(row=0, column=1, padx=10, pady=10, sticky="w")
+
+        # Speed Slider
+        l = tk.Label(self, text="Speed: ", font=font_large, bg="black", fg="white")
+        l.grid(row=1, column=0, sticky="e")
+        self._speed = tk.Scale(self, from_=1, to=4, orient="horizontal", font=font_small, bg="black", fg="white", length=150)
+        self._speed.set(userdata.speed)
+        self._speed.grid(row=1, column=1, padx=10, pady=10, sticky="w")
+
+        # Length Slider
+        l = tk.Label(self, text="Initial Length: ", font=font_large, bg="black", fg="white")
+        l.grid(row=2, column=0, sticky="e")
+        self._length = tk.Scale(self, from_=4, to=12, orient="horizontal", font=font_small, bg="black", fg="white", length=150)
+        self._length.set(userdata.length)
+        self._length.grid(row=2, column=1, padx=10, pady=10, sticky="w")
+        
+        # Food Abundance
+        l = tk.Label(self, text="Food Abundance: ", font=font_large, bg="black", fg="white")
+        l.grid(row=3, column=0, sticky="e")
+        self._food = tk.Scale(self, from_=1, to=10, orient="horizontal", font=font_small, bg="black", fg="white", length=150)
+        self._food.set(userdata.food_abundance)
+        self._food.grid(row=3, column=1, padx=10, pady=10, sticky="w")
+
+        # Wall Teleport
+        l = tk.Label(self, text="Wall Teleport: ", font=font_large, bg="black", fg="white")
+        l.grid(row=4, column=0, sticky="e")
+        self._teleport = ToggleSwitch(self)
+        self._teleport.set_toggled(userdata.wall_teleport)
+        self._teleport.grid(row=4, column=1, padx=10, pady=10, sticky="w")
+
+        # Record Games
+        l = tk.Label(self, text="Record Games: ", font=font_large, bg="black", fg="white")
+        l.grid(row=5, column=0, sticky="e")
+        self._record = ToggleSwitch(self)
+        self._record.set_toggled(userdata.record)
+        self._record.grid(row=5, column=1, padx=10, pady=10, sticky="w")
+
+    @property
+    def mode(self) -> int:
+        return self._mode.current() + 1
+
+    @property
+    def speed(self) -> int:
+        return int(self._speed.get())
+
+    @property
+    def length(self) -> int:
+        return int(self._length.get())
+    
+    @property
+    def food_abundance(self) -> int:
+        return int(self._food.get())
+
+    @property
+    def wall_teleport(self) -> bool:
+        return self._teleport.is_toggled
+
+    @property
+    def record(self) -> bool:
+        return self._record.is_toggled
+
+    def save_to(self, userdata: Userdata) -> None:
+        userdata.mode = self.mode
+        userdata.speed = self.speed
+        userdata.length = self.length
+        userdata.food_abundance = self.food_abundance
+        userdata.wall_teleport = self.wall_teleport
+        userdata.record = self.record
+
+
+instructions: str = """
+The goal of the game is to fill up and extend the snake with colors. If a snake crashes into itself then the colors it has gathered will be dispersed across the screen and its tail will be lost.
+
+Instructions:
+• The first player uses arrow keys to control their snake.
+• The second player uses the WASD keys to control their snake.
+• Pressing + or - will speed up and slow down the snake.
+• Pressing the Space key will pause/play the game.
+• With Record Games on, every game is saved to the replays folder next to your settings. Run the game with --replay and a saved file to watch it again.
+• In Computer Player mode the snake finds its own way to the food, and the scoreboard shows how long it takes to decide.
+• Run the game with --bots and a number to add up to 30 computer snakes to any mode.
+• Run the game with --arena and a number of cells to play on an arena larger than the window, which scrolls along with your snake.
+• Run the game with --profile to see where the time of every tick and frame goes. F3 hides the times.
+"""
+
+
+class Menu:
+    """The menu window, built when created. `show` runs it until the player presses Play or closes it; closing it also
+    keeps the settings."""
+    def __init__(self, userdata: Userdata):
+        self.userdata: Userdata = userdata
+        self.window_pos: tuple[int, int] | None = None  # where the window was when Play was pressed, if it was.
+        self.root = root = tk.Tk()
+        root.title(APP_NAME)
+        root.configure(bg="black")
+        root.geometry("650x700")
+        root.wm_resizable(False, False)
+        root.protocol("WM_DELETE_WINDOW", self.close)
+
+        title_label = tk.Label(root, image=photo('logo'), bg="black")
+        title_label.pack(pady=20)
+        self.settings = Settings(root, userdata)
+        self.settings.pack()
+
+        # Play Button
+        play_button = tk.Button(root, text='Play!', font=font_small, bg="#28a2b3", width=48)
+        play_button.pack(pady=(15, 30))
+        play_button.bind("<ButtonRelease-1>", lambda _: self.play())
+
+        # User Instructions
+        instructions_label = tk.Label(root, text=instructions, wraplength=650, font=("Consolas", 10), justify='left', bg="black", fg="white")
+        instructions_label.pack(padx=20, pady=10)
+
+    def play(self) -> None:
+        """Write the settings to the user data, remember where the window is so the game opens there, and close the menu."""
+        self.settings.save_to(self.userdata)
+        x, y = self.root.geometry().split('+', 1)[1].split('+')
+        self.window_pos = (int(x), int(y))
+        self.root.after(16, self.root.destroy)
+
+    def close(self) -> None:
+        """Write the settings to the user data and close the menu without starting a game."""
+        self.settings.save_to(self.userdata)
+        self.root.after(16, self.root.destroy)
+
+    def show(self) -> tuple[int, int] | None:
+        """Run the menu until it closes, and return where the game's window goes, or None if it was closed without
+        pressing Play."""
+        self.root.mainloop()
+        return self.window_pos
@@ -0,0 +1,409 @@
+"""
+Networked matches over TCP with asyncio: the server owns the simulation, clients send key presses and draw.
+
+    python -m color_the_snake.net serve [--port 8765] [--players 2] [--tick-ms 45] [--max-ticks 0]
+    python -m color_the_snake.net bot [--host 127.0.0.1] [--port 8765] [--bot greedy]
+"""
+import argparse
+import asyncio
+import itertools
+import queue
+import random
+import struct
+import threading
+import time
+from array import array
+from collections import deque
+from typing import AsyncIterator, Callable, Iterable
+from .bots import Bot, load_bot
+from .engine import Collision, GameConfig, Heading, Simulation, SnakeState, changes, mark
+from .grid import OccupancyGrid
+from .storage import FoodTable, SegmentRing, color_code, color_name
+
+
+JOIN: bytes = b'J'  # client -> server: take a seat in the next match.
+INPUT: bytes = b'I'  # client -> server: seq u32, heading u8.
+WELCOME: bytes = b'W'  # server -> client: seat u8, the match's GameConfig, tick seconds f32.
+STATE: bytes = b'S'  # server -> client: acknowledged seq u32, then a snapshot.
+END: bytes = b'E'  # server -> client: final scores, i32 each.
+
+_FRAME: struct.Struct = struct.Struct('<Ic')  # every message: the length of what follows, a kind, then the payload.
+_INPUT: struct.Struct = struct.Struct('<IB')
+_WELCOME: struct.Struct = struct.Struct('<BBBBBHHf')
+_SNAKE: struct.Struct = struct.Struct('<iBHHHHHHHHH')  # score, heading, body and colors front/skip/keep/back, colored.
+_FOOD: struct.Struct = struct.Struct('<IhhB')
+_GONE: int = 0xFF  # color code of food that was removed; food is never white.
+CLOSE_AFTER: float = 5.0  # seconds a server waits for a client to close after the match ended.
+
+
+def frame(kind: bytes, payload: bytes = b'') -> bytes:
+    return _FRAME.pack(len(payload) + 1, kind) + payload
+
+
+async def read_message(reader: asyncio.StreamReader) -> tuple[bytes, bytes]:
+    size, kind = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+    return kind, await reader.readexactly(size - 1)
+
+
+def _cells(body: SegmentRing, indices: Iterable[int]) -> bytes:
+    return array('h', [v for i in indices for v in body[i]]).tobytes()
+
+
+class Match:
+    """One match on the server: its simulation, its seats, the inputs waiting for the next tick and what was last sent."""
+    def __init__(self, config: GameConfig, seed: int, max_ticks: int = 0) -> None:
+        self.sim: Simulation = Simulation(config, seed=seed)
+        self.max_ticks: int = max_ticks  # 0 plays until a player leaves.
+        self.seats: list[asyncio.StreamWriter | None] = [None] * config.players
+        self.inputs: list[list[tuple[int, int]]] = [[] for _ in range(config.players)]
+        self.acked: list[int] = [0] * config.players
+        self.sent: list[tuple[int, int, int, int]] = [(0, 0, 0, 0)] * config.players  # the `mark` of every snake as sent.
+        self.started: bool = False
+        self.over: bool = False
+
+    @property
+    def full(self) -> bool:
+        return all(self.seats)
+
+    def snapshot(self, food: list[int], collisions: list[Collision] | None = None) -> bytes:
+        """The state against what was sent last, with the food items `food`, and remember it as sent. `collisions` are
+        those of the tick played since; without them the snakes are sent whole, as changes from nothing.
+
+        Per snake only the cells new at the head and at the tail are sent, and which run of the old ones was kept, and
+        the same for the colors: a snake that just moved costs one cell, however long it is."""
+        out = bytearray(struct.pack('<I', self.sim.tick))
+        for idx, snake in enumerate(self.sim.snakes):
+            body, colors = changes(snake, None if collisions is None else self.sent[idx], collisions or [])
+            out += _SNAKE.pack(snake.score, snake.heading, body.front, body.skip, body.keep, body.back,
+                               colors.front, colors.skip, colors.keep, colors.back, snake.colored)
+            out += _cells(snake.body, itertools.chain(range(body.front), range(body.front + body.keep, len(body))))
+            out += bytes(color_code(snake.colors[i]) for i in itertools.chain(range(colors.front), range(colors.front + colors.keep, len(colors))))
+            self.sent[idx] = mark(snake)
+        out += struct.pack('<H', len(food))
+        for fid in food:
+            if fid in self.sim.food:
+                (x, y), color = self.sim.food[fid]
+                out += _FOOD.pack(fid, x, y, color_code(color))
+            else:
+                out += _FOOD.pack(fid, 0, 0, _GONE)
+        return bytes(out)
+
+    def send(self, payload: bytes) -> None:
+        for seat, writer in enumerate(self.seats):
+            if writer and not writer.is_closing():
+                writer.write(frame(STATE, struct.pack('<I', self.acked[seat]) + payload))
+
+    def start(self) -> None:
+        self.started = True
+        self.send(self.snapshot(list(self.sim.food)))
+
+    def tick(self) -> None:
+        for seat, inputs in enumerate(self.inputs):
+            for seq, heading in inputs:
+                self.sim.snakes[seat].steer(Heading(heading))
+                self.acked[seat] = seq
+            inputs.clear()
+        collisions: list[Collision] = self.sim.step()
+        self.send(self.snapshot(sorted(self.sim.changed_food), collisions))
+        if self.max_ticks and self.sim.tick >= self.max_ticks:
+            self.finish()
+
+    def finish(self) -> None:
+        if self.over:
+            return
+        self.over = True
+        scores: bytes = struct.pack(f'<{len(self.sim.snakes)}i', *(s.score for s in self.sim.snakes))
+        for writer in self.seats:
+            if writer and not writer.is_closing():
+                writer.write(frame(END, scores))
+                # the client closes once it has read this. Closing first would reset the connection if its inputs are
+                # still arriving, and a reset loses whatever it has not read yet.
+                asyncio.get_running_loop().call_later(CLOSE_AFTER, writer.close)
+
+
+class Server:
+    """Seats clients in matches as they join and ticks every running match every `tick_seconds`.
+
+    Clients whose unsent data piles up beyond `max_buffer` bytes are too slow to follow and are dropped. `stats` counts
+    ticks, the time stepping and sending took, and ticks that started late.
+    """
+    def __init__(self, config: GameConfig = GameConfig(players=2), tick_seconds: float = 0.045, max_ticks: int = 0, seed: int | None = None,
+                 max_buffer: int = 1 << 20) -> None:
+        self.config: GameConfig = config
+        self.tick_seconds: float = tick_seconds
+        self.max_ticks: int = max_ticks
+        self.rng: random.Random = random.Random(seed)  # draws the seed of each match.
+        self.max_buffer: int = max_buffer
+        self.matches: list[Match] = []
+        self.waiting: Match | None = None
+        self.connections: dict[asyncio.Task, asyncio.StreamWriter] = {}  # the task serving each client.
+        self.stats: dict[str, float] = {'ticks': 0, 'late': 0, 'busy_seconds': 0.0, 'max_busy_seconds': 0.0, 'matches': 0}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client: seat it, then collect its inputs until it leaves."""
+        match: Match | None = None
+        seat: int = 0
+        task: asyncio.Task = asyncio.current_task()
+        self.connections[task] = writer
+        try:
+            kind, _ = await read_message(reader)
+            if kind != JOIN:
+                return
+            match = self.waiting or Match(self.config, self.rng.getrandbits(63), self.max_ticks)
+            seat = match.seats.index(None)
+            match.seats[seat] = writer
+            c: GameConfig = self.config
+            writer.write(frame(WELCOME, _WELCOME.pack(seat, c.players, c.length, c.food_abundance, c.wall_teleport, c.half_width, c.half_height, self.tick_seconds)))
+            self.waiting = None if match.full else match
+            if match.full:
+                match.start()
+                self.matches.append(match)
+                self.stats['matches'] += 1
+            while True:  # until the client closes, which it does when the match is over.
+                kind, payload = await read_message(reader)
+                if kind == INPUT and not match.over:
+                    match.inputs[seat].append(_INPUT.unpack(payload))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if match and match.started:
+                match.finish()  # a match cannot go on without one of its players.
+            elif match:
+                match.seats[seat] = None
+                if not any(match.seats):
+                    self.waiting = None
+            writer.close()
+            del self.connections[task]
+
+    async def run(self) -> None:
+        """The ticker: steps every match, then sleeps until the next tick is due."""
+        loop = asyncio.get_running_loop()
+        due: float = loop.time()
+        while True:
+            start: float = time.perf_counter()
+            for match in self.matches:
+                if not match.over:
+                    match.tick()
+                    for writer in match.seats:
+                        if writer and writer.transport.get_write_buffer_size() > self.max_buffer:
+                            match.finish()
+            self.matches = [m for m in self.matches if not m.over]
+            busy: float = time.perf_counter() - start
+            self.stats['ticks'] += 1
+            self.stats['busy_seconds'] += busy
+            self.stats['max_busy_seconds'] = max(self.stats['max_busy_seconds'], busy)
+            due += self.tick_seconds
+            if (delay := due - loop.time()) < 0:
+                self.stats['late'] += 1
+                if delay < -5 * self.tick_seconds:  # fell far behind: drop the backlog instead of rushing through it.
+                    due = loop.time()
+            await asyncio.sleep(max(0.0, delay))
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8765) -> None:
+        server: asyncio.Server = await asyncio.start_server(self.handle, host, port)
+        try:
+            async with server:
+                await self.run()
+        finally:  # on shutdown, end every connection so its task returns instead of being cancelled mid-read.
+            for writer in self.connections.values():
+                writer.close()
+            await asyncio.gather(*self.connections, return_exceptions=True)
+
+
+class RemoteState:
+    """A client's mirror of a match, rebuilt from snapshots. It offers what renderers and bots read of a `Simulation`:
+    `config`, `tick`, `snakes`, `grid`, `food`, `changed_food`, `in_bounds` and `wrap`."""
+    in_bounds = Simulation.in_bounds
+    wrap = Simulation.wrap
+
+    def __init__(self, config: GameConfig) -> None:
+        self.config: GameConfig = config
+        self.tick: int = 0
+        self.grid: OccupancyGrid = OccupancyGrid(config.half_width, config.half_height)
+        self.food: FoodTable = FoodTable()
+        self.changed_food: set[int] = set()
+        self.snakes: list[SnakeState] = [SnakeState([], Heading.Right, [], self.grid, idx) for idx in range(config.players)]
+
+    def apply(self, payload: bytes, offset: int = 0) -> None:
+        self.changed_food.clear()
+        self.grid.flipped.clear()
+        self.tick, = struct.unpack_from('<I', payload, offset)
+        offset += 4
+        for snake in self.snakes:
+            (score, heading, body_front, body_skip, body_keep, body_back,
+             colors_front, colors_skip, colors_keep, colors_back, colored) = _SNAKE.unpack_from(payload, offset)
+            offset += _SNAKE.size
+            cells: array = array('h', payload[offset:offset + 4 * (body_front + body_back)])
+            offset += 4 * (body_front + body_back)
+            codes: bytes = payload[offset:offset + colors_front + colors_back]
+            offset += colors_front + colors_back
+            body = snake.body
+            for _ in range(body_skip):
+                self.grid.remove(body.popleft(), snake.index)
+            while len(body) > body_keep:
+                self.grid.remove(body.pop(), snake.index)
+            for i in range(body_front - 1, -1, -1):
+                body.appendleft((cells[2 * i], cells[2 * i + 1]), heading)
+                self.grid.add(body[0], snake.index)
+            for i in range(body_front, body_front + body_back):
+                body.append((cells[2 * i], cells[2 * i + 1]), heading)
+                self.grid.add(body[-1], snake.index)
+            body.set_heading(0, heading)
+            for _ in range(colors_skip):
+                snake.colors.popleft()
+            snake.colors.truncate(colors_keep)
+            for code in reversed(codes[:colors_front]):
+                snake.colors.insert_front(color_name(code))
+            for code in codes[colors_front:]:
+                snake.colors.append(color_name(code))
+            snake.colored = colored
+            if snake.score != score:
+                snake.set_score(score)
+        count, = struct.unpack_from('<H', payload, offset)
+        offset += 2
+        for _ in range(count):
+            fid, x, y, code = _FOOD.unpack_from(payload, offset)
+            offset += _FOOD.size
+            if code == _GONE:
+                self.food.pop(fid, None)
+            else:
+                self.food[fid] = ((x, y), color_name(code))
+            self.changed_food.add(fid)
+
+
+class Client:
+    """One seat in a match on a server. `press` sends a key press and predicts it; `handle` applies what arrives.
+
+    `send` writes bytes to the server. It is the stream writer's `write` unless a client running its connection on
+    another thread replaces it with a thread-safe version.
+    """
+    def __init__(self) -> None:
+        self.seat: int = 0
+        self.tick_seconds: float = 0.0
+        self.state: RemoteState | None = None
+        self.seq: int = 0
+        self.pending: deque[tuple[int, Heading]] = deque()  # presses the server has not acknowledged yet.
+        self.heading: Heading = Heading.Right  # the heading of the own snake as of the last snapshot.
+        self.scores: list[int] | None = None  # set when the match ends.
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+        self.send: Callable[[bytes], None] = lambda data: None
+        self.received: int = 0  # bytes of snapshots received.
+        self.snapshots: int = 0
+
+    async def connect(self, host: str = '127.0.0.1', port: int = 8765) -> None:
+        """Join a match and wait for the seat to be assigned."""
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.send = self.writer.write
+        self.send(frame(JOIN))
+        kind, payload = await read_message(self.reader)
+        self.seat, players, length, food_abundance, wall_teleport, half_width, half_height, self.tick_seconds = _WELCOME.unpack(payload)
+        self.state = RemoteState(GameConfig(players, length, food_abundance, bool(wall_teleport), half_width, half_height))
+
+    async def messages(self) -> AsyncIterator[tuple[bytes, bytes]]:
+        """Every message from the server until the match ends or the connection drops."""
+        try:
+            while True:
+                kind, payload = await read_message(self.reader)
+                yield kind, payload
+                if kind == END:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+
+    def handle(self, kind: bytes, payload: bytes) -> None:
+        if kind == STATE:
+            acked, = struct.unpack_from('<I', payload)
+            self.state.apply(payload, 4)
+            self.received += len(payload) + _FRAME.size
+            self.snapshots += 1
+            while self.pending and self.pending[0][0] <= acked:
+                self.pending.popleft()
+            self.heading = self.state.snakes[self.seat].heading
+            self.predict()
+        elif kind == END:
+            self.scores = list(struct.unpack(f'<{len(payload) // 4}i', payload))
+
+    def press(self, heading: Heading) -> None:
+        if self.scores is not None or self.writer.is_closing():  # the match is over.
+            return
+        self.seq += 1
+        self.pending.append((self.seq, heading))
+        self.send(frame(INPUT, _INPUT.pack(self.seq, heading)))
+        self.predict()
+
+    def predict(self) -> None:
+        """Turn the own snake the way the server will on its next tick: to the first pending heading it allows."""
+        snake: SnakeState = self.state.snakes[self.seat]
+        if not len(snake.body):
+            return
+        turn: Heading = next((h for _, h in self.pending if h != self.heading.opposite), self.heading)
+        snake.body.set_heading(0, turn)
+
+    async def play(self, bot: Bot | None = None) -> list[int] | None:
+        """Follow the match to its end, letting `bot` press the keys after every snapshot. Returns the final scores."""
+        async for kind, payload in self.messages():
+            self.handle(kind, payload)
+            if bot and kind == STATE and (heading := bot.decide(self.state, self.seat)) is not None and heading != self.state.snakes[self.seat].heading:
+                self.press(heading)
+        self.writer.close()
+        return self.scores
+
+
+def connect_in_thread(host: str, port: int, timeout: float = 10.0) -> tuple[Client, queue.SimpleQueue]:
+    """Join a match from a program whose own loop is not asyncio, such as the game.
+
+    The connection runs on an event loop in a daemon thread. Every message from the server is put into the returned
+    queue for the program to `handle` on its own thread, followed by None once the connection is closed. `press` may be
+    called from the program's thread.
+    """
+    client = Client()
+    messages: queue.SimpleQueue = queue.SimpleQueue()
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    asyncio.run_coroutine_threadsafe(client.connect(host, port), loop).result(timeout)
+    write: Callable[[bytes], None] = client.writer.write
+    client.send = lambda data: loop.call_soon_threadsafe(write, data)
+
+    async def forward() -> None:
+        async for message in client.messages():
+            messages.put(message)
+        client.writer.close()
+        messages.put(None)
+    asyncio.run_coroutine_threadsafe(forward(), loop)
+    return client, messages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('role', choices=('serve', 'bot'))
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--players', type=int, default=2, help='seats per match, up to 32 (serve)')
+    parser.add_argument('--tick-ms', type=float, default=45.0, help='tick length in milliseconds (serve)')
+    parser.add_argument('--max-ticks', type=int, default=0, help='end matches after this many ticks (serve)')
+    parser.add_argument('--bot', default='greedy', help='bot that plays the seat (bot)')
+    args = parser.parse_args()
+
+    if args.role == 'bot':
+        async def play() -> None:
+            client = Client()
+            await client.connect(args.host, args.port)
+            print(f'seat {client.seat}, scores {await client.play(load_bot(args.bot, client.seat))}, '
+                  f'{client.received / max(1, client.snapshots):.1f} bytes per snapshot')
+        asyncio.run(play())
+        return
+
+    server = Server(GameConfig(players=args.players), args.tick_ms / 1000, args.max_ticks)
+
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:  # statistics follow.
+        pass
+    s: dict[str, float] = server.stats
+    print(f'ticks {s["ticks"]:.0f}, late {s["late"]:.0f}, matches {s["matches"]:.0f}, busy {s["busy_seconds"] / max(1, s["ticks"]) * 1000:.2f} ms/tick '
+          f'(max {s["max_busy_seconds"] * 1000:.2f} ms) of {args.tick_ms:g} ms', flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Per-phase timing of ticks and frames, with rolling percentiles for an on-screen readout and an export at exit."""
+import csv
+import json
+import time
+from array import array
+from typing import Callable
+
+
+class Rolling:
+    """The last `size` samples of a phase in nanoseconds, for percentiles, and the count, sum and peak of all of them."""
+    def __init__(self, size: int = 600) -> None:
+        self.samples: array = array('q', bytes(8 * size))  # a ring: sample n is at n % size.
+        self.count: int = 0
+        self.total: int = 0
+        self.peak: int = 0
+
+    def add(self, ns: int) -> None:
+        self.samples[self.count % len(self.samples)] = ns
+        self.count += 1
+        self.total += ns
+        if ns > self.peak:
+            self.peak = ns
+
+    def percentiles(self, *ps: float) -> list[int]:
+        """Nearest-rank percentiles of the samples in the window, or zeros before there are any."""
+        ordered: list[int] = sorted(self.samples[:min(self.count, len(self.samples))])
+        if not ordered:
+            return [0] * len(ps)
+        return [ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] for p in ps]
+
+
+class Profiler:
+    """Times named phases with `clock`, keeping a `Rolling` of the last `window` samples per phase. Timed code keeps its
+    profiler in an attribute that is None while profiling is off and tests it before every call."""
+    def __init__(self, window: int = 600, clock: Callable[[], int] = time.perf_counter_ns) -> None:
+        self.window: int = window
+        self.clock: Callable[[], int] = clock
+        self.phases: dict[str, Rolling] = {}  # in the order they were first timed.
+        self._last: int = clock()
+
+    def begin(self) -> None:
+        """Start timing from now: the next lap measures from here."""
+        self._last = self.clock()
+
+    def lap(self, phase: str) -> None:
+        """Record the time since the last `begin` or `lap` as one sample of `phase`."""
+        now: int = self.clock()
+        self.add(phase, now - self._last)
+        self._last = now
+
+    def add(self, phase: str, ns: int) -> None:
+        """Record `ns` as one sample of `phase`, for times measured otherwise than by laps, such as input latency."""
+        if (rolling := self.phases.get(phase)) is None:
+            rolling = self.phases[phase] = Rolling(self.window)
+        rolling.add(ns)
+
+    def summary(self) -> list[dict[str, str | int | float]]:
+        """A row per phase: the samples ever taken, their mean and peak, and percentiles of the window, in microseconds."""
+        rows: list[dict[str, str | int | float]] = []
+        for phase, rolling in self.phases.items():
+            p50, p90, p99 = rolling.percentiles(50, 90, 99)
+            rows.append({'phase': phase, 'samples': rolling.count, 'mean_us': round(rolling.total / max(rolling.count, 1) / 1000, 2),
+                         'p50_us': p50 / 1000, 'p90_us': p90 / 1000, 'p99_us': p99 / 1000, 'max_us': rolling.peak / 1000})
+        return rows
+
+    def report(self) -> str:
+        """The summary as lines of text, one per phase."""
+        return '\n'.join(f'{row["phase"]:<12} p50 {row["p50_us"]:8.1f}   p99 {row["p99_us"]:8.1f}   max {row["max_us"]:8.1f} us' for row in self.summary())
+
+    def export(self, path: str) -> None:
+        """Write the summary to `path`, as JSON if it ends in .json and as CSV otherwise."""
+        rows: list[dict[str, str | int | float]] = self.summary()
+        with open(path, mode='w', newline='') as f:
+            if path.endswith('.json'):
+                json.dump(rows, f, indent=2)
+                return
+            writer = csv.DictWriter(f, fieldnames=['phase', 'samples', 'mean_us', 'p50_us', 'p90_us', 'p99_us', 'max_us'])
+            writer.writeheader()
+            writer.writerows(rows)
@@ -0,0 +1,426 @@
+"""
+Offscreen rendering of games into NumPy images, and their export as PNG frames or animated GIFs, without Tk.
+
+    python -m color_the_snake.raster OUT (--log GAME.ctsl | --bots SPEC...) [--scale 8] [--start TICK] [--ticks N] [--every N]
+"""
+import argparse
+import os
+import struct
+import time
+import zlib
+from itertools import chain, islice
+from typing import BinaryIO, Iterator
+import numpy as np
+from .bots import load_bot, steer_all
+from .engine import COLORS, WHITE, Collision, GameConfig, Simulation, SnakeState, changes, mark
+from .grid import Cell
+from .replay import InputLog, Replay
+from .storage import ColorRow, SegmentRing
+
+
+TICK_SECONDS: float = 0.09  # a tick at speed 1, as the game window paces it; speed s ticks s times as often.
+DEPTH: int = 5  # bits per pixel of the GIF palette.
+PALETTE: np.ndarray = np.zeros((1 << DEPTH, 3), dtype=np.uint8)
+PALETTE[:len(COLORS)] = [[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in COLORS]
+WHITE_INDEX: int = len(COLORS)
+BACKGROUND: int = WHITE_INDEX + 1  # black.
+TRANSPARENT: int = (1 << DEPTH) - 1  # pixels a GIF frame leaves as the frame before showed them.
+PALETTE[WHITE_INDEX] = 255
+_INDEX: dict[str, int] = {color: i for i, color in enumerate(COLORS)} | {WHITE: WHITE_INDEX}
+
+SQUARE: int = 0
+CIRCLE: int = 1
+
+Ticks = Iterator[tuple[Simulation, int, list[Collision] | None]]  # a game tick by tick: simulation, speed, collisions.
+
+
+def _pairs(body: SegmentRing, colors: ColorRow, stop: int, start: int) -> Iterator[tuple[Cell, str]]:
+    """The cells and colors of a snake up to `stop` and from `start` on; the first are iterated, the rest looked up."""
+    if start <= stop:
+        return zip(body, colors)
+    return chain(islice(zip(body, colors), stop), ((body[i], colors[i]) for i in range(start, len(body))))
+
+
+class Rasterizer:
+    """Draws the arena of `config` at `scale` pixels per cell, row 0 of the images being its top row.
+
+    A cell several segments share shows a colored one over a white one, and food over both. `indexed` is the same image
+    as `rgb`, as indexes into `PALETTE`, for GIFs.
+    """
+    def __init__(self, config: GameConfig, scale: int = 8) -> None:
+        self.config: GameConfig = config
+        self.scale: int = scale
+        self.width: int = (2 * config.half_width + 1) * scale
+        self.height: int = (2 * config.half_height + 1) * scale
+        self.rgb: np.ndarray = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        self.indexed: np.ndarray = np.full((self.height, self.width), BACKGROUND, dtype=np.uint8)
+        self.rgb[:] = PALETTE[BACKGROUND]
+        self.bodies: list[SegmentRing] = []  # every snake as it was last taken in.
+        self.colors: list[ColorRow] = []
+        self.seen: list[tuple[int, int, int, int] | None] = []  # the `mark` of every snake as last taken in.
+        self.food: dict[int, tuple[Cell, int]] = {}  # food id -> cell and palette index, as last taken in.
+        self.segments: dict[Cell, list[int]] = {}  # palette indexes of the segments on every cell.
+        self.food_at: dict[Cell, list[int]] = {}  # palette indexes of the food on every cell.
+        self.dirty: set[Cell] = set()  # cells that may look different since the last frame.
+        self.shown: dict[Cell, tuple[int, int]] = {}  # (shape, palette index) of every cell drawn on in the last frame.
+        self.heads: dict[Cell, int] = {}  # palette index of every head drawn in the last frame.
+        self.head_size: int = round(1.3 * scale)
+        center: np.ndarray = np.arange(scale) + 0.5 - scale / 2
+        self.disc: np.ndarray = center[:, None] ** 2 + center[None, :] ** 2 <= (scale / 4) ** 2  # a food item, in its cell.
+        self.frames: int = 0
+        self.painted: int = 0  # cells repainted over all frames.
+
+    def box(self, cell: Cell, size: int) -> tuple[int, int, int, int]:
+        """(top, left, bottom, right) pixels of a square of `size` pixels centered on `cell`, cut to the image."""
+        offset: int = (size - self.scale) // 2
+        top: int = (self.config.half_height - cell[1]) * self.scale - offset
+        left: int = (cell[0] + self.config.half_width) * self.scale - offset
+        return max(top, 0), max(left, 0), min(top + size, self.height), min(left + size, self.width)
+
+    def paint(self, cell: Cell, shape: int, index: int) -> None:
+        top, left, bottom, right = self.box(cell, self.scale)
+        if shape == CIRCLE:
+            self.rgb[top:bottom, left:right] = PALETTE[BACKGROUND]
+            self.indexed[top:bottom, left:right] = BACKGROUND
+            self.rgb[top:bottom, left:right][self.disc] = PALETTE[index]
+            self.indexed[top:bottom, left:right][self.disc] = index
+        else:
+            self.rgb[top:bottom, left:right] = PALETTE[index]
+            self.indexed[top:bottom, left:right] = index
+
+    def _add(self, table: dict[Cell, list[int]], cell: Cell, index: int) -> None:
+        table.setdefault(cell, []).append(index)
+        self.dirty.add(cell)
+
+    def _remove(self, table: dict[Cell, list[int]], cell: Cell, index: int) -> None:
+        indexes: list[int] = table[cell]
+        indexes.remove(index)
+        if not indexes:
+            del table[cell]
+        self.dirty.add(cell)
+
+    def update(self, sim: Simulation, collisions: list[Collision] | None = None) -> None:
+        """Take in the step `sim` just played, given the collisions it returned, or with None all of `sim` afresh. Every
+        step has to be taken in, drawn or not. Like the server's deltas (`engine.changes`), a step costs what it
+        reports, not the length of the snakes."""
+        if collisions is None:
+            self.dirty.update(self.shown)
+            self.segments.clear()
+            self.food_at.clear()
+            self.food.clear()
+            self.bodies = [SegmentRing() for _ in sim.snakes]
+            self.colors = [ColorRow() for _ in sim.snakes]
+            self.seen = [None] * len(sim.snakes)
+        for fid in sim.food if collisions is None else sim.changed_food:
+            if (item := self.food.pop(fid, None)) is not None:
+                self._remove(self.food_at, *item)
+            if fid in sim.food:
+                cell, color = sim.food[fid]
+                self.food[fid] = cell, _INDEX[color]
+                self._add(self.food_at, cell, _INDEX[color])
+        for snake in sim.snakes:
+            self._follow(snake, collisions or [])
+
+    def _follow(self, snake: SnakeState, collisions: list[Collision]) -> None:
+        """Take in how `snake` changed. Only the segments that changed are touched: those the snake gained or lost at
+        either end, and those along the colored ones whose cell now has another color."""
+        idx: int = snake.index
+        seen_body, seen_colors, seen = self.bodies[idx], self.colors[idx], self.seen[idx]
+        body, colors = changes(snake, seen, collisions)
+        # The cells kept, from `body.front` on, are the old ones shifted by `moved`; from `a` to `b` the colors on them
+        # are the old ones too.
+        moved: int = body.front - body.skip
+        kept: int = body.front + body.keep
+        a: int = max(body.front, colors.front)
+        b: int = min(kept, colors.front + colors.keep)
+        if colors.front - colors.skip != moved:  # the colors moved along the cells, which only the white ones hide.
+            a = max(a, (seen[3] if seen else 0) + max(moved, colors.front - colors.skip))
+        if a >= b:
+            a = b = kept
+        segments, dirty = self.segments, self.dirty
+        for cell, color in _pairs(seen_body, seen_colors, body.skip, body.skip + body.keep):
+            indexes: list[int] = segments[cell]
+            indexes.remove(_INDEX[color])
+            if not indexes:
+                del segments[cell]
+            dirty.add(cell)
+        for cell, color in _pairs(snake.body, snake.colors, body.front, kept):
+            segments.setdefault(cell, []).append(_INDEX[color])
+            dirty.add(cell)
+        recolored = chain(
+            zip(islice(snake.body, body.front, a), islice(seen_colors, body.skip, a - moved), islice(snake.colors, body.front, a)),
+            ((snake.body[i], seen_colors[i - moved], snake.colors[i]) for i in range(b, kept)))
+        for cell, old, new in recolored:
+            if old != new:
+                indexes = segments[cell]
+                indexes[indexes.index(_INDEX[old])] = _INDEX[new]
+                dirty.add(cell)
+        for _ in range(body.skip):  # and the copies follow.
+            seen_body.popleft()
+        seen_body.truncate(body.keep)
+        for i in reversed(range(body.front)):
+            seen_body.appendleft(snake.body[i], snake.body.heading(i))
+        for i in range(body.front + body.keep, len(snake.body)):
+            seen_body.append(snake.body[i], snake.body.heading(i))
+        for _ in range(colors.skip):
+            seen_colors.popleft()
+        seen_colors.truncate(colors.keep)
+        for i in reversed(range(colors.front)):
+            seen_colors.insert_front(snake.colors[i])
+        for i in range(colors.front + colors.keep, len(snake.colors)):
+            seen_colors.append(snake.colors[i])
+        self.seen[idx] = mark(snake)
+
+    def draw(self) -> int:
+        """Bring the images up to the steps taken in, repainting only the cells that changed and those a head moved off,
+        and return how many cells that repainted."""
+        hw, hh = self.config.half_width, self.config.half_height
+        heads: dict[Cell, int] = {body[0]: _INDEX[colors[0]] for body, colors in zip(self.bodies, self.colors)}
+        uncovered: set[Cell] = set()
+        for (x, y), index in self.heads.items():
+            if heads.get((x, y)) != index:  # the head hung over the cells around it.
+                uncovered.update((x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+        painted: int = 0
+        for cell in self.dirty | uncovered:
+            if (food := self.food_at.get(cell)) is not None:
+                look: tuple[int, int] | None = CIRCLE, min(food)
+            elif (segments := self.segments.get(cell)) is not None:
+                look = SQUARE, min(segments)  # white comes after the colors.
+            else:
+                look = None
+            if self.shown.get(cell) == look and cell not in uncovered:
+                continue
+            if -hw <= cell[0] <= hw and -hh <= cell[1] <= hh:
+                self.paint(cell, *(look or (SQUARE, BACKGROUND)))
+                painted += 1
+            if look:
+                self.shown[cell] = look
+            else:
+                self.shown.pop(cell, None)
+        for cell, index in heads.items():  # on top, over whatever was repainted around them.
+            top, left, bottom, right = self.box(cell, self.head_size)
+            self.rgb[top:bottom, left:right] = PALETTE[index]
+            self.indexed[top:bottom, left:right] = index
+        self.heads, self.dirty = heads, set()
+        self.frames += 1
+        self.painted += painted
+        return painted
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def png(rgb: np.ndarray, level: int = 6) -> bytes:
+    """An RGB image of shape (height, width, 3) as a PNG file."""
+    height, width, _ = rgb.shape
+    rows = np.zeros((height, 1 + 3 * width), dtype=np.uint8)  # every row starts with its filter type, 0 for none.
+    rows[:, 1:] = rgb.reshape(height, -1)
+    return (b'\x89PNG\r\n\x1a\n' + _chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + _chunk(b'IDAT', zlib.compress(rows.tobytes(), level)) + _chunk(b'IEND', b''))
+
+
+class PngWriter:
+    """Writes every frame to `directory` as a PNG file of its own, numbered from 0."""
+    def __init__(self, directory: str, level: int = 6) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory: str = directory
+        self.level: int = level
+        self.frames: int = 0
+
+    def write(self, rgb: np.ndarray) -> str:
+        path: str = os.path.join(self.directory, f'frame{self.frames:06d}.png')
+        with open(path, 'wb') as f:
+            f.write(png(rgb, self.level))
+        self.frames += 1
+        return path
+
+
+def lzw(pixels: np.ndarray, depth: int = DEPTH) -> bytes:
+    """The LZW code stream of a GIF image of `depth` bits per pixel, packed least significant bit first."""
+    flat: np.ndarray = pixels.ravel()
+    starts: np.ndarray = np.flatnonzero(np.diff(flat)) + 1
+    values: list[int] = flat[np.r_[0, starts]].tolist()
+    lengths: list[int] = np.diff(np.r_[0, starts, flat.size]).tolist()
+    clear: int = 1 << depth
+    width: int = depth + 1
+    next_code: int = clear + 2
+    table: dict[int, int] = {}  # prefix code << 8 | pixel -> code of the string they make, but for the chains.
+    # the codes of 1, 2, 3... times each pixel, kept apart from the table so that a prefix repeating one pixel grows
+    # through as much of a run as its chain allows in one step: transparent areas and rows of a cell cost a few steps.
+    chains: list[list[int]] = [[pixel] for pixel in range(clear)]
+    out = bytearray()
+    bits, count = clear, width  # the codes not yet written out, and how many bits they take.
+    prefix = pixel = values[0]
+    run: int = 1  # the prefix is `pixel` this many times, or 0 if it is not one pixel repeated.
+    lengths[0] -= 1
+    for value, length in zip(values, lengths):
+        while length:
+            if run and pixel == value:
+                chain: list[int] = chains[value]
+                if run < len(chain):
+                    step: int = min(length, len(chain) - run)
+                    run += step
+                    length -= step
+                    prefix = chain[run - 1]
+                    continue
+            elif (code := table.get(prefix << 8 | value)) is not None:
+                prefix, run = code, 0
+                length -= 1
+                continue
+            bits |= prefix << count
+            count += width
+            while count >= 8:
+                out.append(bits & 0xFF)
+                bits >>= 8
+                count -= 8
+            if next_code < 4096:
+                if next_code == 1 << width:
+                    width += 1
+                if run and pixel == value:
+                    chains[value].append(next_code)
+                else:
+                    table[prefix << 8 | value] = next_code
+                next_code += 1
+            else:  # the table is full: start over.
+                bits |= clear << count
+                count += width
+                table.clear()
+                for chain in chains:
+                    del chain[1:]
+                width, next_code = depth + 1, clear + 2
+            prefix = pixel = value
+            run = 1
+            length -= 1
+    bits |= prefix << count
+    count += width
+    if next_code == 1 << width and next_code < 4096:  # the decoder adds an entry on reading the last code too.
+        width += 1
+    bits |= (clear + 1) << count
+    count += width
+    while count > 0:
+        out.append(bits & 0xFF)
+        bits >>= 8
+        count -= 8
+    return bytes(out)
+
+
+class GifWriter:
+    """Appends frames of `PALETTE` indexes to an animated GIF at `path` that loops `loops` times (0 for ever).
+    `close` finishes the file. A frame only covers the rectangle that changed, with the pixels in it that did not change
+    left transparent."""
+    def __init__(self, path: str, width: int, height: int, loops: int = 0) -> None:
+        self.file: BinaryIO = open(path, 'wb')
+        self.previous: np.ndarray | None = None  # the image the frames written so far leave on screen.
+        self.frames: int = 0
+        self.pixels: int = 0  # encoded over all frames.
+        self.file.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0x80 | (DEPTH - 1) << 4 | (DEPTH - 1), BACKGROUND, 0) + PALETTE.tobytes()
+                        + b'!\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', loops) + b'\x00')
+
+    def write(self, indexed: np.ndarray, delay: int) -> None:
+        """Add a frame shown for `delay` hundredths of a second."""
+        if self.previous is None:
+            self.previous = indexed.copy()
+            top, left, bottom, right = 0, 0, indexed.shape[0], indexed.shape[1]
+            pixels: np.ndarray = indexed
+        else:
+            changed: np.ndarray = indexed != self.previous
+            rows, columns = np.flatnonzero(changed.any(axis=1)), np.flatnonzero(changed.any(axis=0))
+            if rows.size:
+                top, left, bottom, right = rows[0], columns[0], rows[-1] + 1, columns[-1] + 1
+            else:  # nothing changed, but the frame still takes its time: one transparent pixel.
+                top, left, bottom, right = 0, 0, 1, 1
+            pixels = np.where(changed[top:bottom, left:right], indexed[top:bottom, left:right], TRANSPARENT).astype(np.uint8)
+            self.previous[top:bottom, left:right] = indexed[top:bottom, left:right]
+        data: bytes = lzw(pixels)
+        self.file.write(b'!\xf9\x04' + struct.pack('<BHBB', 1 << 2 | 1, delay, TRANSPARENT, 0)  # keep the frame, with transparency.
+                        + b',' + struct.pack('<HHHHB', left, top, right - left, bottom - top, 0) + bytes([DEPTH])
+                        + b''.join(bytes([len(block)]) + block for block in (data[i:i + 255] for i in range(0, len(data), 255))) + b'\x00')
+        self.frames += 1
+        self.pixels += pixels.size
+
+    def close(self) -> None:
+        self.file.write(b';')
+        self.file.close()
+
+
+def play_log(path: str, start: int) -> tuple[GameConfig, Ticks]:
+    """The config of the game logged at `path` and its ticks from `start` on, as (simulation, speed, collisions), the
+    collisions being None for the first."""
+    replay = Replay(InputLog.load(path))
+
+    def ticks() -> Ticks:
+        yield replay.seek(start), replay.speed, None
+        while not replay.done:
+            collisions: list[Collision] = replay.step()
+            yield replay.sim, replay.speed, collisions
+    return replay.log.config, ticks()
+
+
+def play_bots(specs: list[str], seed: int, speed: int) -> tuple[GameConfig, Ticks]:
+    """The config of a game of a bot of every spec and its ticks for as long as they are asked for."""
+    config = GameConfig(players=len(specs))
+    sim = Simulation(config, seed=seed)
+    bots = [load_bot(spec, seed + idx) for idx, spec in enumerate(specs)]
+
+    def ticks() -> Ticks:
+        yield sim, speed, None
+        while True:
+            steer_all(sim, bots)
+            collisions: list[Collision] = sim.step()
+            yield sim, speed, collisions
+    return config, ticks()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('out', help='OUT.gif for an animated GIF, OUT.png for the last frame, or a directory for a PNG per frame')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--log', metavar='GAME.ctsl', help='an input log to replay, as the game records them')
+    source.add_argument('--bots', nargs='+', metavar='SPEC', help='bots to play a game of, one snake each')
+    parser.add_argument('--scale', type=int, default=8, help='pixels per cell')
+    parser.add_argument('--start', type=int, default=0, metavar='TICK', help='tick of the first frame')
+    parser.add_argument('--ticks', type=int, metavar='N', help='ticks to render: the rest of a log, or 2000 of a bot game')
+    parser.add_argument('--every', type=int, default=1, metavar='N', help='render every Nth tick')
+    parser.add_argument('--speed', type=int, choices=(1, 2, 3, 4), default=2, help='speed of a bot game, which sets the frame delays')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    if args.log:
+        config, ticks = play_log(args.log, args.start)
+    else:
+        config, ticks = play_bots(args.bots, args.seed, args.speed)
+        for _ in range(args.start):
+            next(ticks)
+    rasterizer = Rasterizer(config, args.scale)
+    gif: GifWriter | None = GifWriter(args.out, rasterizer.width, rasterizer.height) if args.out.endswith('.gif') else None
+    frames: PngWriter | None = PngWriter(args.out) if not gif and not args.out.endswith('.png') else None
+    limit: int | None = args.ticks if args.ticks is not None else 2000 if args.bots else None  # a log plays to its end.
+    played: float = 0.0  # seconds of game the frames so far cover, which their delays add up to.
+    start: float = time.perf_counter()
+    for n, (sim, speed, collisions) in enumerate(ticks):
+        if limit is not None and n > limit:
+            break
+        rasterizer.update(sim, None if n == 0 else collisions)  # the first tick, after --start, is taken in whole.
+        if n % args.every:
+            continue
+        rasterizer.draw()
+        seconds: float = args.every * TICK_SECONDS / speed
+        if gif:
+            gif.write(rasterizer.indexed, round((played + seconds) * 100) - round(played * 100))
+        elif frames:
+            frames.write(rasterizer.rgb)
+        played += seconds
+    if gif:
+        gif.close()
+    elif not frames:
+        with open(args.out, 'wb') as f:
+            f.write(png(rasterizer.rgb))
+    elapsed: float = time.perf_counter() - start
+    print(f'{rasterizer.frames} frames of {rasterizer.width}x{rasterizer.height} to {args.out} in {elapsed:.2f}s, '
+          f'{rasterizer.frames / max(elapsed, 1e-9):,.0f} frames/s, {played / max(elapsed, 1e-9):,.0f}x real time')
+    print(f'  {rasterizer.painted / max(rasterizer.frames, 1):.1f} cells repainted per frame'
+          + (f', {gif.pixels / max(gif.frames, 1):,.0f} pixels encoded per GIF frame, {os.path.getsize(args.out):,} bytes' if gif else ''))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+"""
+Compact binary input logs of games, and their deterministic replay.
+
+    python -m color_the_snake.replay GAME.ctsl [--seek TICK] [--snapshot-every 500]
+"""
+import argparse
+import copy
+import struct
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from .engine import Collision, GameConfig, Heading, Simulation
+
+
+MAGIC: bytes = b'CTSL'
+VERSION: int = 2
+SPEED: int = 63  # event channel of speed changes; version 1 logs, from before games had more than two snakes, used 3.
+# magic, version, seed, ticks, players, length, food_abundance, wall_teleport, half_width, half_height, mode, speed.
+_HEADER: struct.Struct = struct.Struct('<4sBQIBBBBHHBB')
+
+
+@dataclass
+class InputLog:
+    """A game as its seed, its config and the headings the players chose: all its randomness comes from the seed.
+
+    Channels 0 to 62 of the events are the snakes, with a `Heading` as value; `SPEED` has the new speed minus one. An
+    event recorded at tick t was made while the simulation had run t steps, so it is replayed right before step t + 1.
+    """
+    seed: int
+    config: GameConfig
+    mode: int = 1
+    speed: int = 2  # the speed the game started at.
+    ticks: int = 0  # ticks the game ran for.
+    events: list[tuple[int, int, int]] = field(default_factory=list)  # (tick, channel, value) in the order they were made.
+
+    def record(self, tick: int, channel: int, value: int) -> None:
+        self.events.append((tick, channel, int(value)))
+
+    def to_bytes(self) -> bytes:
+        c: GameConfig = self.config
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, self.seed, self.ticks, c.players, c.length, c.food_abundance, c.wall_teleport,
+                                     c.half_width, c.half_height, self.mode, self.speed))
+        last: int = 0
+        for tick, channel, value in self.events:  # a LEB128 varint of the ticks since the last event, then the event.
+            delta: int = tick - last
+            last = tick
+            while delta >= 0x80:
+                out.append(delta & 0x7F | 0x80)
+                delta >>= 7
+            out.append(delta)
+            out.append(channel << 2 | value)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'InputLog':
+        magic, version, seed, ticks, players, length, food_abundance, wall_teleport, half_width, half_height, mode, speed = _HEADER.unpack_from(data)
+        if magic != MAGIC or version not in (1, VERSION):
+            raise ValueError(f'not a version 1 to {VERSION} Color the Snake! input log')
+        speed_channel: int = 3 if version == 1 else SPEED
+        log = cls(seed, GameConfig(players, length, food_abundance, bool(wall_teleport), half_width, half_height), mode, speed, ticks)
+        pos, tick = _HEADER.size, 0
+        while pos < len(data):
+            delta, shift = 0, 0
+            while data[pos] & 0x80:
+                delta |= (data[pos] & 0x7F) << shift
+                pos, shift = pos + 1, shift + 7
+            tick += delta | data[pos] << shift
+            channel: int = data[pos + 1] >> 2
+            log.events.append((tick, SPEED if channel == speed_channel else channel, data[pos + 1] & 3))
+            pos += 2
+        return log
+
+    def save(self, path: str) -> None:
+        with open(path, mode='wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'InputLog':
+        with open(path, mode='rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def snapshot(sim: Simulation) -> Simulation:
+    """A deep copy of `sim` that shares the score callbacks and the profiler instead of copying them."""
+    return copy.deepcopy(sim, {id(s.on_score_changed): s.on_score_changed for s in sim.snakes} | {id(sim.profiler): sim.profiler})
+
+
+class Replay:
+    """Plays an `InputLog` back on a `Simulation`, keeping a snapshot every `snapshot_every` ticks it passes.
+
+    `seek` restarts from the latest snapshot at or before the tick it is asked for (or carries on from where the replay
+    is, if that is closer), so jumping around a long game only replays a few hundred ticks.
+    """
+    def __init__(self, log: InputLog, snapshot_every: int = 500) -> None:
+        self.log: InputLog = log
+        self.snapshot_every: int = snapshot_every
+        self.ticks: list[int] = [tick for tick, _, _ in log.events]
+        self.sim: Simulation = Simulation(log.config, seed=log.seed)
+        self.snapshots: dict[int, tuple[Simulation, int]] = {0: (snapshot(self.sim), log.speed)}
+        self.speed: int = log.speed  # the speed setting as of the current tick.
+
+    @property
+    def done(self) -> bool:
+        return self.sim.tick >= self.log.ticks
+
+    def step(self) -> list[Collision]:
+        """Apply the key presses made before the next tick, then play it."""
+        sim: Simulation = self.sim
+        for i in range(bisect_left(self.ticks, sim.tick), bisect_right(self.ticks, sim.tick)):
+            _, channel, value = self.log.events[i]
+            if channel == SPEED:
+                self.speed = value + 1
+            else:
+                sim.snakes[channel].steer(Heading(value))
+        collisions: list[Collision] = sim.step()
+        if sim.tick % self.snapshot_every == 0 and sim.tick not in self.snapshots:
+            self.snapshots[sim.tick] = snapshot(sim), self.speed
+        return collisions
+
+    def seek(self, tick: int) -> Simulation:
+        """Bring the replay to `tick` and return the simulation as it was then. Later ticks have to be replayed anew."""
+        start: int = max((t for t in self.snapshots if t <= tick), default=0)
+        if not start <= self.sim.tick <= tick:
+            sim, self.speed = self.snapshots[start]
+            self.sim = snapshot(sim)
+        while self.sim.tick < tick:
+            self.step()
+        return self.sim
+
+    def run(self) -> Simulation:
+        """Play the rest of the game as fast as possible."""
+        while not self.done:
+            self.step()
+        return self.sim
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('log')
+    parser.add_argument('--seek', type=int, nargs='*', default=[], metavar='TICK', help='ticks to jump to after playing the game through')
+    parser.add_argument('--snapshot-every', type=int, default=500)
+    args = parser.parse_args()
+    log: InputLog = InputLog.load(args.log)
+    c: GameConfig = log.config
+    print(f'seed {log.seed}, {log.ticks} ticks, {len(log.events)} key presses, {len(log.to_bytes())} bytes')
+    print(f'  {c.players} player(s), {2 * c.half_width + 1}x{2 * c.half_height + 1} cells, length {c.length}, '
+          f'food abundance {c.food_abundance}, wall teleport {"on" if c.wall_teleport else "off"}, speed {log.speed}')
+    replay = Replay(log, args.snapshot_every)
+    start: float = time.perf_counter()
+    sim: Simulation = replay.run()
+    seconds: float = time.perf_counter() - start
+    print(f'  replayed in {seconds * 1000:.1f} ms ({log.ticks / max(seconds, 1e-9):,.0f} ticks/s), scores {[s.score for s in sim.snakes]}')
+    for tick in args.seek:
+        start = time.perf_counter()
+        sim = replay.seek(tick)
+        print(f'  seek to {tick}: {(time.perf_counter() - start) * 1000:.1f} ms, scores {[s.score for s in sim.snakes]}')
+
+
+if __name__ == '__main__':
+    main()
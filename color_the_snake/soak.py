@@ -0,0 +1,205 @@
+"""
+Soak test of the game: plays it headless for a long time and fails if it leaks or slows down.
+
+    python -m color_the_snake.soak [--ticks 1000000] [--every 10000] [--mode 1] [--bots N] [--arena CELLS] [--script FILE]
+"""
+import argparse
+import csv
+import json
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+from . import game, headless
+from .userdata import Userdata
+
+
+@dataclass
+class Sample:
+    tick: int
+    seconds: float  # since the run started, in real time.
+    traced_kb: float  # allocated by Python, as tracemalloc counts it; 0 without tracing.
+    rss_mb: float
+    items: int  # on the canvas.
+    pooled: int  # sprites the pools have made so far.
+    tick_p99_us: float
+    frame_p99_us: float
+
+
+# The metrics that must not trend upward, with the growth over a run they are allowed, in percent of their early median,
+# and the growth that is noise whatever the percent.
+TOLERANCES: dict[str, float] = {'traced_kb': 10, 'rss_mb': 10, 'items': 10, 'tick_p99_us': 25, 'frame_p99_us': 25}
+NOISE: dict[str, float] = {'traced_kb': 256, 'rss_mb': 2, 'items': 0, 'tick_p99_us': 50, 'frame_p99_us': 50}
+
+
+def rss_mb() -> float:
+    """Resident memory of the process in MB, or its peak where the current one cannot be read."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (2 ** 20 if sys.platform == 'darwin' else 2 ** 10)
+
+
+def p99(values: list[int]) -> int:
+    ordered: list[int] = sorted(values)
+    return ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] if ordered else 0
+
+
+def median(values: list[float]) -> float:
+    return sorted(values)[len(values) // 2]
+
+
+def settled(samples: list[Sample], warmup: int) -> int:
+    """The first sample of the trend window: after `warmup` and once the pools stop making sprites, but no later than
+    halfway, so a pool that never stops growing is still watched."""
+    start: int = warmup
+    for i in range(warmup, len(samples) // 2):
+        if samples[i].pooled != samples[i - 1].pooled:
+            start = i + 1
+    return min(start, len(samples) // 2)
+
+
+def trends(samples: list[Sample], warmup: int) -> dict[str, float]:
+    """How much each metric grows from the first to the last third of the trend window, comparing their medians, in
+    percent of the first; 0 where the growth is within `NOISE`. Canvas items may grow as the pools make sprites for
+    longer snakes, so only the items the pooled sprites do not account for count."""
+    kept: list[Sample] = samples[settled(samples, warmup):]
+    third: int = max(1, len(kept) // 3)
+    growth: dict[str, float] = {}
+    for metric in TOLERANCES:
+        early, late = (median([getattr(s, metric) - (s.pooled if metric == 'items' else 0) for s in window]) for window in (kept[:third], kept[-third:]))
+        base: float = median([getattr(s, metric) for s in kept[:third]])
+        growth[metric] = (late - early) / base * 100 if base and late - early > NOISE[metric] else 0.0
+    return growth
+
+
+class Player:
+    """Presses keys on the window every so often: the next line of `script`, or else a random one of `keys`."""
+    def __init__(self, window: headless.Window, scheduler: headless.Scheduler, keys: list[str], script: list[str] = None, seed: int = 0) -> None:
+        self.window: headless.Window = window
+        self.scheduler: headless.Scheduler = scheduler
+        self.keys: list[str] = keys
+        self.script: list[str] | None = script
+        self.line: int = 0
+        self.rng = random.Random(seed)
+        self.presses: int = 0
+        scheduler.after(0, self.press)
+
+    def press(self) -> None:
+        if self.script:
+            key: str = self.script[self.line % len(self.script)]
+            self.line += 1
+            delay: float = self.window.frame_rate
+        else:
+            key = self.rng.choice(self.keys) if self.keys else '.'
+            delay = self.rng.uniform(0.05, 0.5)  # a player reacting to the game, not a key held down.
+        if key != '.':
+            self.window.press(key)
+            self.presses += 1
+        self.scheduler.after(round(delay * 1000), self.press)
+
+
+def timed(func: Callable[..., Any], times: list[int]) -> Callable[..., Any]:
+    """`func`, adding the CPU time every call takes to `times` in nanoseconds. The time the process waits for the CPU
+    would swamp a short tick."""
+    def call(*args) -> Any:
+        start: int = time.thread_time_ns()
+        result = func(*args)
+        times.append(time.thread_time_ns() - start)
+        return result
+    return call
+
+
+def soak(settings: Userdata, ticks: int, every: int, bots: int = 0, arena: int = 0, script: list[str] = None, seed: int = 0, trace: bool = True,
+         report: Callable[[Sample], None] = lambda sample: None) -> list[Sample]:
+    """Play a headless game for `ticks` ticks and take a sample every `every`, passing each to `report`. The whole game
+    runs as on screen, pools and animations included, with a `Player` at the keys."""
+    random.seed(seed)  # the seed of the simulation comes from it.
+    game_play_manager, scheduler = headless.start(settings, bots=bots, arena=arena)
+    keys: list[str] = [key for up_left_down_right in game.KEYS[:game_play_manager.humans] for key in up_left_down_right]
+    player = Player(game.window, scheduler, keys, script, seed)
+    loop = game_play_manager.loop
+    tick_ns: list[int] = []
+    frame_ns: list[int] = []
+    loop.update, loop.render = timed(loop.update, tick_ns), timed(loop.render, frame_ns)
+    if trace:
+        tracemalloc.start()
+    samples: list[Sample] = []
+    start: float = time.perf_counter()
+    try:
+        for target in range(every, ticks + 1, every):
+            stall: float = scheduler.now + every  # seconds of game time by which the game must have ticked `every` times.
+            scheduler.run(lambda: game_play_manager.simulation.tick >= target or scheduler.now > stall)
+            if game_play_manager.simulation.tick < target:
+                raise RuntimeError(f'the game stopped ticking at tick {game_play_manager.simulation.tick}, after {player.presses} key presses')
+            samples.append(Sample(game_play_manager.simulation.tick, round(time.perf_counter() - start, 2),
+                                  round(tracemalloc.get_traced_memory()[0] / 1024, 1) if trace else 0.0, round(rss_mb(), 2), len(game.window.cv.items),
+                                  game.segment_pool.made + game.food_manager.pool.made,
+                                  p99(tick_ns) / 1000, p99(frame_ns) / 1000))
+            tick_ns.clear()
+            frame_ns.clear()
+            report(samples[-1])
+    finally:
+        if trace:
+            tracemalloc.stop()
+    return samples
+
+
+def save(samples: list[Sample], path: str) -> None:
+    """Write the samples to `path`, as JSON if it ends in .json and as CSV otherwise."""
+    rows: list[dict[str, Any]] = [asdict(s) for s in samples]
+    with open(path, mode='w', newline='') as f:
+        if path.endswith('.json'):
+            json.dump(rows, f, indent=2)
+            return
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else [])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=1_000_000)
+    parser.add_argument('--every', type=int, default=10_000, help='ticks between samples')
+    parser.add_argument('--warmup', type=int, default=3, help='samples left out of the trends')
+    parser.add_argument('--mode', type=int, choices=(1, 2, 3), default=1, help='1 and 2 players at the keyboard, or 3 for the computer player')
+    parser.add_argument('--bots', type=int, default=0, metavar='N', help='snakes steered by the computer next to the players')
+    parser.add_argument('--arena', type=int, default=0, metavar='CELLS')
+    parser.add_argument('--speed', type=int, choices=(1, 2, 3, 4), default=4)
+    parser.add_argument('--script', metavar='FILE', help='key names to press instead of random ones, a line every tick and over again at the end (. presses nothing)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--trace', action=argparse.BooleanOptionalAction, default=True, help='count the memory Python allocates (slows the game down)')
+    parser.add_argument('--out', metavar='FILE', help='also save the samples, as CSV or as JSON if FILE ends in .json')
+    args = parser.parse_args()
+    script: list[str] | None = None
+    if args.script:
+        with open(args.script) as f:
+            script = [line.strip() or '.' for line in f]
+    if args.ticks // args.every <= args.warmup + 2:
+        parser.error('the run needs at least three samples after the warm-up to see a trend')
+
+    print(f'{args.ticks:,} ticks, mode {args.mode}, {args.bots} bots, {"scripted" if script else "random"} keys, a sample every {args.every:,} ticks')
+    print(f'  {"tick":>10}  {"seconds":>8}  {"traced":>10}  {"rss":>8}  {"items":>6}  {"tick p99":>10}  {"frame p99":>10}')
+    samples: list[Sample] = soak(Userdata(mode=args.mode, speed=args.speed), args.ticks, args.every, args.bots, args.arena, script, args.seed, args.trace,
+                                 report=lambda s: print(f'  {s.tick:10,}  {s.seconds:8.1f}  {s.traced_kb:8.0f}KB  {s.rss_mb:6.1f}MB  {s.items:6}  '
+                                                        f'{s.tick_p99_us:8.1f}us  {s.frame_p99_us:8.1f}us', flush=True))
+    if args.out:
+        save(samples, args.out)
+    failed: list[str] = []
+    for metric, growth in trends(samples, args.warmup).items():
+        if metric == 'traced_kb' and not args.trace:
+            continue
+        verdict: str = 'ok' if growth <= TOLERANCES[metric] else 'GROWING'
+        print(f'{metric:<14} {growth:+7.1f}% over the run (tolerance {TOLERANCES[metric]:g}%)  {verdict}')
+        if growth > TOLERANCES[metric]:
+            failed.append(metric)
+    if failed:
+        raise SystemExit(f'trending upward: {", ".join(failed)}')
+
+
+if __name__ == '__main__':
+    main()
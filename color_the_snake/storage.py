@@ -0,0 +1,239 @@
+"""Compact storage for the segments and food of the simulation, in typed arrays rather than tuples and strings."""
+from array import array
+from collections.abc import MutableMapping
+from typing import Iterable, Iterator
+from .grid import Cell
+
+
+COLORS: tuple[str, ...] = "#FF5733", "#33FF57", "#3357FF", "#FF33A1", "#33FFA1", "#FF8633", "#33FFD1", "#A133FF", "#FFD133", "#33A1FF", '#A6076B', '#298862', '#FF6600', '#385BB4', '#D91656', '#0D92F4', '#FF885B', '#6EC207', '#B8001F'
+WHITE: str = 'white'
+WHITE_CODE: int = 255  # the other color codes index `COLORS`.
+_CODES: dict[str, int] = {color: code for code, color in enumerate(COLORS)} | {WHITE: WHITE_CODE}
+_NAMES: list[str] = [WHITE] * 256
+_NAMES[:len(COLORS)] = COLORS
+
+
+def color_code(color: str) -> int:
+    """The uint8 code of a color of `COLORS` or of white. Raises KeyError for any other color."""
+    return _CODES[color]
+
+
+def color_name(code: int) -> str:
+    return _NAMES[code]
+
+
+class Ring:
+    """Parallel typed arrays used as one growable ring buffer, index 0 first. Subclasses name their columns, one array
+    per field, with `TYPECODES`."""
+    TYPECODES: tuple[str, ...] = ()
+
+    def __init__(self, capacity: int = 16) -> None:
+        size: int = 1
+        while size < capacity:
+            size *= 2
+        self.columns: list[array] = [array(typecode, [0]) * size for typecode in self.TYPECODES]
+        self.mask: int = size - 1  # the capacity is a power of two, doubled whenever the ring is full.
+        self.start: int = 0  # pushing and popping at either end only move the start or the length, at any length.
+        self.length: int = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def capacity(self) -> int:
+        return self.mask + 1
+
+    def _slot(self, i: int) -> int:
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError('ring index out of range')
+        return (self.start + i) & self.mask
+
+    def _grow(self) -> None:
+        """Double the capacity, unrolling the ring so that index 0 is in slot 0."""
+        order: list[int] = [(self.start + i) & self.mask for i in range(self.length)]
+        extra: int = self.capacity
+        self.columns = [array(c.typecode, [c[s] for s in order]) + array(c.typecode, [0]) * (extra + extra - self.length) for c in self.columns]
+        self.mask = 2 * extra - 1
+        self.start = 0
+        self._bind()
+
+    def _bind(self) -> None:
+        """Let subclasses keep their own names for the columns, which `_grow` replaces."""
+
+    def _push_front(self) -> int:
+        if self.length == self.capacity:
+            self._grow()
+        self.start = (self.start - 1) & self.mask
+        self.length += 1
+        return self.start
+
+    def _push_back(self) -> int:
+        if self.length == self.capacity:
+            self._grow()
+        self.length += 1
+        return (self.start + self.length - 1) & self.mask
+
+    def _pop_front(self) -> int:
+        if not self.length:
+            raise IndexError('pop from an empty ring')
+        slot: int = self.start
+        self.start = (slot + 1) & self.mask
+        self.length -= 1
+        return slot
+
+    def _pop_back(self) -> int:
+        if not self.length:
+            raise IndexError('pop from an empty ring')
+        self.length -= 1
+        return (self.start + self.length) & self.mask
+
+    def truncate(self, length: int) -> None:
+        self.length = min(self.length, max(0, length))
+
+
+class SegmentRing(Ring):
+    """The cells and heading codes of a snake's body, head first, as int16 x and y and uint8 heading columns: five bytes
+    a segment, where a tuple per cell costs dozens. Iterating yields the cells.
+    """
+    TYPECODES = 'h', 'h', 'B'
+
+    def __init__(self, cells: Iterable[Cell] = (), heading: int = 0, capacity: int = 16) -> None:
+        cells = list(cells)
+        super().__init__(max(capacity, len(cells)))
+        self._bind()
+        for cell in cells:
+            self.append(cell, heading)
+
+    def _bind(self) -> None:
+        self.xs, self.ys, self.headings = self.columns
+
+    def __iter__(self) -> Iterator[Cell]:
+        xs, ys, mask, start = self.xs, self.ys, self.mask, self.start
+        for i in range(self.length):
+            slot: int = (start + i) & mask
+            yield xs[slot], ys[slot]
+
+    def __getitem__(self, i: int) -> Cell:
+        slot: int = self._slot(i)
+        return self.xs[slot], self.ys[slot]
+
+    def _write(self, slot: int, cell: Cell, heading: int) -> None:
+        self.xs[slot], self.ys[slot] = cell
+        self.headings[slot] = heading
+
+    def heading(self, i: int) -> int:
+        return self.headings[self._slot(i)]
+
+    def set_heading(self, i: int, heading: int) -> None:
+        self.headings[self._slot(i)] = heading
+
+    def appendleft(self, cell: Cell, heading: int) -> None:
+        self._write(self._push_front(), cell, heading)
+
+    def append(self, cell: Cell, heading: int) -> None:
+        self._write(self._push_back(), cell, heading)
+
+    def pop(self) -> Cell:
+        slot: int = self._pop_back()
+        return self.xs[slot], self.ys[slot]
+
+    def popleft(self) -> Cell:
+        slot: int = self._pop_front()
+        return self.xs[slot], self.ys[slot]
+
+
+class ColorRow(Ring):
+    """The colors of a snake by segment index, head first, as a ring of uint8 codes.
+
+    Shifting every color one segment towards the tail and coloring the head (`insert_front` and `pop`) only moves the
+    start of the ring. `shifts` counts those shifts, so a renderer can tell how far its drawn colors have moved along.
+    Indexing and iterating yield color names.
+    """
+    TYPECODES = 'B',
+
+    def __init__(self, colors: Iterable[str] = ()) -> None:
+        codes: list[int] = [color_code(color) for color in colors]
+        super().__init__(len(codes))
+        self._bind()
+        self.codes[:len(codes)] = array('B', codes)
+        self.length = len(codes)
+        self.shifts: int = 0
+
+    def _bind(self) -> None:
+        self.codes, = self.columns
+
+    def __iter__(self) -> Iterator[str]:
+        codes, mask, start = self.codes, self.mask, self.start
+        for i in range(self.length):
+            yield _NAMES[codes[(start + i) & mask]]
+
+    def __getitem__(self, i: int) -> str:
+        return _NAMES[self.codes[self._slot(i)]]
+
+    def insert_front(self, color: str) -> None:
+        slot: int = self._push_front()  # may grow the ring and replace `codes`.
+        self.codes[slot] = color_code(color)
+        self.shifts += 1
+
+    def append(self, color: str) -> None:
+        slot: int = self._push_back()  # may grow the ring and replace `codes`.
+        self.codes[slot] = color_code(color)
+
+    def pop(self) -> str:
+        return _NAMES[self.codes[self._pop_back()]]
+
+    def popleft(self) -> str:
+        return _NAMES[self.codes[self._pop_front()]]
+
+    def whiten(self, count: int) -> None:
+        """Paint the first `count` segments white."""
+        for i in range(min(count, self.length)):
+            self.codes[(self.start + i) & self.mask] = WHITE_CODE
+
+
+class FoodTable(MutableMapping):
+    """Food id -> (cell, color) stored as parallel int16 x and y and uint8 color arrays.
+
+    Items are packed densely: removing one moves the last item into its slot, and `slots` maps each food id to its slot.
+    """
+    def __init__(self) -> None:
+        self.xs: array = array('h')
+        self.ys: array = array('h')
+        self.colors: array = array('B')
+        self.ids: array = array('q')  # food id of each slot.
+        self.slots: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.slots)
+
+    def __contains__(self, fid: object) -> bool:
+        return fid in self.slots
+
+    def __getitem__(self, fid: int) -> tuple[Cell, str]:
+        slot: int = self.slots[fid]
+        return (self.xs[slot], self.ys[slot]), _NAMES[self.colors[slot]]
+
+    def __setitem__(self, fid: int, item: tuple[Cell, str]) -> None:
+        (x, y), color = item
+        if (slot := self.slots.get(fid)) is None:
+            self.slots[fid] = len(self.ids)
+            self.xs.append(x)
+            self.ys.append(y)
+            self.colors.append(color_code(color))
+            self.ids.append(fid)
+            return
+        self.xs[slot], self.ys[slot], self.colors[slot] = x, y, color_code(color)
+
+    def __delitem__(self, fid: int) -> None:
+        slot: int = self.slots.pop(fid)
+        last: int = len(self.ids) - 1
+        if slot != last:
+            self.xs[slot], self.ys[slot], self.colors[slot], self.ids[slot] = self.xs[last], self.ys[last], self.colors[last], self.ids[last]
+            self.slots[self.ids[slot]] = slot
+        for column in (self.xs, self.ys, self.colors, self.ids):
+            column.pop()
@@ -0,0 +1,164 @@
+"""
+Round-robin tournaments between bots, played headless on every core.
+
+    python -m color_the_snake.tournament greedy cautious random [--games 100] [--ticks 2000] [--workers N]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from itertools import permutations
+from typing import Iterator
+from .bots import BOTS, load_bot, steer_all
+from .engine import GameConfig, Simulation
+
+
+@dataclass(frozen=True)
+class Match:
+    """One scheduled game: bot specs by snake index and the seed its arena and bots are drawn from."""
+    index: int
+    bots: tuple[str, str]
+    seed: int
+    config: GameConfig
+    max_ticks: int
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    index: int
+    seed: int
+    bots: tuple[str, str]
+    scores: tuple[int, int]
+    crashes: tuple[int, int]
+    ticks: int
+
+    @property
+    def winner(self) -> str | None:
+        """Spec of the bot with the higher score, None for a draw."""
+        if self.scores[0] == self.scores[1]:
+            return None
+        return self.bots[0] if self.scores[0] > self.scores[1] else self.bots[1]
+
+
+def match_seed(seed: int, index: int) -> int:
+    """The seed of match `index`, so a tournament gives the same results however many workers play it and in whatever
+    order. String seeds are hashed the same way in every process, unlike `hash()`."""
+    return random.Random(f'{seed}:{index}').getrandbits(63)
+
+
+def schedule(bots: list[str], games: int, seed: int, config: GameConfig = GameConfig(players=2), max_ticks: int = 2000) -> list[Match]:
+    """`games` matches for every ordered pair of distinct bots, so each pair plays from both sides."""
+    pairs: list[tuple[str, str]] = list(permutations(bots, 2))
+    return [Match(i, pairs[i % len(pairs)], match_seed(seed, i), config, max_ticks) for i in range(games * len(pairs))]
+
+
+def play_match(match: Match) -> MatchResult:
+    sim = Simulation(match.config, seed=match.seed)
+    # bots draw from their own seeds, so one bot's choices never shift the arena's or the other bot's draws.
+    players = [load_bot(spec, match_seed(match.seed, idx)) for idx, spec in enumerate(match.bots)]
+    crashes: Counter = Counter()
+    for _ in range(match.max_ticks):
+        steer_all(sim, players)
+        for collision in sim.step():
+            crashes[collision.snake] += 1
+    return MatchResult(match.index, match.seed, match.bots, (sim.snakes[0].score, sim.snakes[1].score), (crashes[0], crashes[1]), sim.tick)
+
+
+def run(matches: list[Match], workers: int | None = None, chunksize: int = 4) -> Iterator[MatchResult]:
+    """Play `matches` on `workers` processes (all cores by default) and yield each result as soon as it is in."""
+    if workers == 1:
+        yield from map(play_match, matches)
+        return
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap_unordered(play_match, matches, chunksize)
+
+
+@dataclass
+class Record:
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    points: int = 0  # the bot's own scores summed over its games.
+    crashes: int = 0
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+
+@dataclass
+class Standings:
+    """Win/draw/loss records per bot and the wins of every bot against every other."""
+    records: dict[str, Record] = field(default_factory=lambda: defaultdict(Record))
+    head_to_head: dict[tuple[str, str], int] = field(default_factory=Counter)
+
+    def add(self, result: MatchResult) -> None:
+        winner: str | None = result.winner
+        for side, spec in enumerate(result.bots):
+            record: Record = self.records[spec]
+            record.points += result.scores[side]
+            record.crashes += result.crashes[side]
+            if winner is None:
+                record.draws += 1
+            elif winner == spec:
+                record.wins += 1
+                self.head_to_head[spec, result.bots[1 - side]] += 1
+            else:
+                record.losses += 1
+
+    def ranking(self) -> list[str]:
+        """Bots by points for wins (2) and draws (1), then by average score."""
+        return sorted(self.records, key=lambda b: (-(2 * self.records[b].wins + self.records[b].draws), -self.records[b].points / self.records[b].games, b))
+
+    def table(self) -> str:
+        ranked: list[str] = self.ranking()
+        width: int = max(len(b) for b in ranked)
+        lines: list[str] = [f'{"bot":<{width}}  {"games":>6} {"wins":>6} {"draws":>6} {"losses":>6} {"win %":>6} {"score":>8} {"crashes":>8}']
+        for b in ranked:
+            r: Record = self.records[b]
+            lines.append(f'{b:<{width}}  {r.games:6} {r.wins:6} {r.draws:6} {r.losses:6} {100 * r.wins / r.games:6.1f} {r.points / r.games:8.2f} {r.crashes / r.games:8.2f}')
+        lines.append('')
+        lines.append(f'{"wins vs":<{width}}  ' + ' '.join(f'{b[:6]:>6}' for b in ranked))
+        for b in ranked:
+            lines.append(f'{b:<{width}}  ' + ' '.join(f'{self.head_to_head[b, o]:6}' if o != b else f'{"-":>6}' for o in ranked))
+        return '\n'.join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('bots', nargs='*', help=f'registered names ({", ".join(sorted(BOTS))}) or module:Class paths; default: all registered bots')
+    parser.add_argument('--games', type=int, default=100, help='games per ordered pair of bots')
+    parser.add_argument('--ticks', type=int, default=2000, help='ticks per game')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--teleport', action=argparse.BooleanOptionalAction, default=True, help='snakes pass through the walls')
+    parser.add_argument('--food', type=int, default=2, help='food abundance')
+    args = parser.parse_args()
+    bots: list[str] = args.bots or sorted(BOTS)
+    if len(bots) < 2:
+        parser.error('a tournament needs at least two bots')
+    for spec in bots:  # fail here rather than in every worker.
+        load_bot(spec)
+
+    config = GameConfig(players=2, wall_teleport=args.teleport, food_abundance=args.food)
+    matches: list[Match] = schedule(bots, args.games, args.seed, config, args.ticks)
+    standings = Standings()
+    start: float = time.perf_counter()
+    for done, result in enumerate(run(matches, args.workers), 1):
+        standings.add(result)
+        if sys.stderr.isatty() and (done % 50 == 0 or done == len(matches)):
+            print(f'\r{done}/{len(matches)} games', end='', file=sys.stderr, flush=True)
+    seconds: float = time.perf_counter() - start
+    if sys.stderr.isatty():
+        print(file=sys.stderr)
+    print(f'{len(matches)} games of {args.ticks} ticks on {args.workers} worker(s) in {seconds:.1f}s '
+          f'({len(matches) / seconds:,.1f} games/s, {len(matches) * args.ticks / seconds:,.0f} ticks/s)\n')
+    print(standings.table())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""The player's settings and highscore, kept as JSON in the application data directory of the user."""
+import json
+import os
+import platform
+from dataclasses import asdict, dataclass
+
+
+APP_NAME: str = 'Color the Snake!'
+
+
+@dataclass
+class Userdata:
+    """What the menu sets and the game plays with. Saved field for field."""
+    mode: int = 1
+    speed: int = 2
+    length: int = 8
+    food_abundance: int = 2
+    wall_teleport: bool = True
+    highscore: int = 0
+    record: bool = False  # whether every game is saved as an input log that can be replayed.
+
+
+class UserdataFile:
+    """Singleton interface for loading and saving user data: loads `data` when created and writes it with `save`."""
+    __debug_mode__: bool = False
+
+    def __init__(self):
+        os.makedirs(directory:=self.get_appdata_directory(), exist_ok=True)
+        self.file_path = os.path.join(directory, 'userdata.json') if not self.__debug_mode__ else '.\\userdata.json'
+        self.data: Userdata = Userdata()
+        self.__load()
+
+    @staticmethod
+    def get_appdata_directory() -> str:
+        match platform.system():
+            case 'Windows':
+                return os.path.join(os.getenv('APPDATA'), APP_NAME)
+            case 'Darwin':  # Mac OS
+                return os.path.join(os.path.expanduser('~'), 'Library', 'Application Support', APP_NAME)
+            case _:  # Linux and other Unix-like systems
+                return os.path.join(os.path.expanduser('~'), f'.{APP_NAME}')
+
+    def save(self) -> None:
+        with open(self.file_path, mode='w') as f:
+            f.write(json.dumps(asdict(self.data)))
+
+    def __load(self) -> None:
+        try:
+            with open(self.file_path, mode='r') as f:
+                data: dict = json.load(f)
+                self.data = Userdata(data['mode'], data['speed'], data['length'], data['food_abundance'], data['wall_teleport'], data['highscore'],
+                                     data.get('record', False))  # missing from the files of older versions.
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):  # if error occurs then reload default settings.
+            self.save()
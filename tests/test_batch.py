@@ -0,0 +1,14 @@
+import pytest
+
+pytest.importorskip('numpy')  # the batch engine needs it; the rest of the package does not.
+
+from benchmarks.batch_throughput import check
+from color_the_snake.engine import GameConfig
+
+
+@pytest.mark.parametrize('players', (1, 2))
+@pytest.mark.parametrize('wall_teleport', (True, False))
+@pytest.mark.parametrize('food_abundance', (1, 30))
+def test_batch_games_replay_on_the_scalar_engine(players, wall_teleport, food_abundance):
+    config = GameConfig(players=players, wall_teleport=wall_teleport, food_abundance=food_abundance)
+    assert check(config, games=8, ticks=300, seed=players) == 0
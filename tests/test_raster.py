@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from color_the_snake.raster import DEPTH, TRANSPARENT, Rasterizer, lzw, play_bots
+
+
+def unlzw(data: bytes, depth: int) -> list[int]:
+    """The pixels of a GIF LZW code stream, decoded the plain way: a table of strings and a code per lookup."""
+    clear: int = 1 << depth
+    table: list[list[int]] = [[i] for i in range(clear)] + [[], []]
+    width: int = depth + 1
+    prev: list[int] | None = None
+    out: list[int] = []
+    bits, count, pos = 0, 0, 0
+    while True:
+        while count < width:
+            bits |= data[pos] << count
+            count, pos = count + 8, pos + 1
+        code: int = bits & (1 << width) - 1
+        bits >>= width
+        count -= width
+        if code == clear:
+            del table[clear + 2:]
+            width, prev = depth + 1, None
+            continue
+        if code == clear + 1:
+            return out
+        if prev is None:
+            entry: list[int] = table[code]
+        else:
+            entry = table[code] if code < len(table) else prev + prev[:1]
+            if len(table) < 4096:
+                table.append(prev + entry[:1])
+        out += entry
+        prev = entry
+        if len(table) == 1 << width and width < 12:
+            width += 1
+
+
+@pytest.mark.parametrize('kind', ('noise', 'runs', 'sparse', 'single'))
+@pytest.mark.parametrize('depth', (2, DEPTH))
+def test_lzw_decodes_to_its_pixels(kind, depth):
+    rng = np.random.default_rng(3)
+    top: int = (1 << depth) - 1
+    if kind == 'noise':  # fills the table several times over.
+        pixels = rng.integers(0, top + 1, (200, 200))
+    elif kind == 'runs':
+        pixels = np.repeat(rng.integers(0, top + 1, 300), rng.integers(1, 400, 300))
+    elif kind == 'sparse':  # the transparent frames of a GIF with a few cells changed.
+        pixels = np.full((120, 160), top)
+        pixels[rng.integers(0, 120, 40), rng.integers(0, 160, 40)] = rng.integers(0, top, 40)
+    else:
+        pixels = np.array([top])
+    pixels = pixels.astype(np.uint8)
+    assert unlzw(lzw(pixels, depth), depth) == pixels.ravel().tolist()
+
+
+def test_lzw_ends_right_after_any_code_width_change():
+    pixels = np.random.default_rng(4).integers(0, 4, 600).astype(np.uint8)
+    for n in range(1, pixels.size):
+        assert unlzw(lzw(pixels[:n], 2), 2) == pixels[:n].tolist(), f'{n} pixels'
+
+
+def test_lzw_decodes_game_frames():
+    config, ticks = play_bots(['greedy', 'cautious'], seed=5, speed=1)
+    raster = Rasterizer(config, scale=4)
+    for sim, _, collisions in (next(ticks) for _ in range(200)):
+        raster.update(sim, collisions)
+    raster.draw()
+    assert unlzw(lzw(raster.indexed), DEPTH) == raster.indexed.ravel().tolist()
+    assert TRANSPARENT not in raster.indexed
+
+
+@pytest.mark.parametrize('specs', (['greedy'], ['greedy', 'random', 'cautious']))
+@pytest.mark.parametrize('every', (1, 7))
+def test_incremental_frames_match_fresh_ones(specs, every):
+    config, ticks = play_bots(specs, seed=9, speed=1)
+    raster = Rasterizer(config, scale=4)
+    for sim, _, collisions in (next(ticks) for _ in range(300)):
+        raster.update(sim, collisions)
+        if sim.tick % every == 0:
+            raster.draw()
+        if sim.tick % 50 == 0:
+            raster.draw()
+            fresh = Rasterizer(config, scale=4)
+            fresh.update(sim, None)
+            fresh.draw()
+            assert np.array_equal(raster.indexed, fresh.indexed), f'tick {sim.tick}'
+            assert np.array_equal(raster.rgb, fresh.rgb), f'tick {sim.tick}'
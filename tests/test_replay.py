@@ -0,0 +1,46 @@
+import pytest
+from color_the_snake.bots import load_bot
+from color_the_snake.engine import GameConfig, Simulation
+from color_the_snake.replay import SPEED, InputLog, Replay
+
+
+def state(sim: Simulation) -> tuple:
+    snakes = [(list(s.body), list(s.colors), s.score) for s in sim.snakes]
+    return sim.tick, snakes, sorted((fid, *sim.food[fid]) for fid in sim.food)
+
+
+def record(config: GameConfig, seed: int, ticks: int) -> tuple[InputLog, Simulation]:
+    """A game of bots played for `ticks` ticks, with every heading they chose logged, and the simulation it ends in."""
+    sim = Simulation(config, seed=seed)
+    log = InputLog(seed, config)
+    bots = [load_bot(('greedy', 'random', 'cautious')[idx % 3], seed + idx) for idx in range(config.players)]
+    for _ in range(ticks):
+        for idx, bot in enumerate(bots):
+            if (heading := bot.decide(sim, idx)) is not None:
+                log.record(sim.tick, idx, heading)
+                sim.snakes[idx].steer(heading)
+        if sim.tick == ticks // 2:
+            log.record(sim.tick, SPEED, 3)
+        sim.step()
+    log.ticks = ticks
+    return log, sim
+
+
+@pytest.mark.parametrize('config', (GameConfig(), GameConfig(players=3, wall_teleport=True, food_abundance=5)))
+def test_replay_reproduces_the_recorded_game(config):
+    log, sim = record(config, seed=7, ticks=400)
+    replay = Replay(InputLog.from_bytes(log.to_bytes()), snapshot_every=100)
+    assert state(replay.run()) == state(sim)
+    assert replay.speed == 4
+
+
+def test_seek_matches_playing_through():
+    log, _ = record(GameConfig(players=2), seed=11, ticks=400)
+    replay = Replay(log, snapshot_every=100)
+    expected = {}
+    while not replay.done:
+        replay.step()
+        if replay.sim.tick % 70 == 0:
+            expected[replay.sim.tick] = state(replay.sim)
+    for tick in sorted(expected, reverse=True):
+        assert state(replay.seek(tick)) == expected[tick]
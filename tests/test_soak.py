@@ -0,0 +1,19 @@
+from color_the_snake import game, headless, soak
+from color_the_snake.userdata import Userdata
+
+
+def test_clean_game_does_not_trend_upward():
+    samples = soak.soak(Userdata(mode=1, speed=4), ticks=4000, every=200, trace=False)
+    growth = soak.trends(samples, warmup=3)
+    assert all(growth[metric] <= tolerance for metric, tolerance in soak.TOLERANCES.items()), growth
+
+
+def test_leaked_canvas_items_trend_upward(monkeypatch):
+    run = headless.Scheduler.run
+
+    def leaky(scheduler, until):  # a canvas item nothing ever deletes, every sample.
+        game.window.cv.create_rectangle(0, 0, 1, 1)
+        run(scheduler, until)
+    monkeypatch.setattr(headless.Scheduler, 'run', leaky)
+    samples = soak.soak(Userdata(mode=1, speed=4), ticks=4000, every=200, trace=False)
+    assert soak.trends(samples, warmup=3)['items'] > soak.TOLERANCES['items']